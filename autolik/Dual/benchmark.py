@@ -1,27 +1,35 @@
 import math
 from numbers import Real
-import scipy.special
+import numpy as np
+from autolik._lazy import scipy
+
+__all__ = ['Dual', 'DualArray', 'sin', 'cos', 'sqrt', 'exp', 'log', 'gamma', 'lgamma', 'log1p', 'expm1',
+           'tanh', 'erf', 'log_ndtr', 'atan', 'digamma', 'polygamma', 'logsumexp', 'betaln', 'beta']
 
 class Dual:
-    """Autolik Dual type"""
+    """Autolik Dual type
+
+    ``eps`` is either a float (one tangent direction) or a numpy vector of
+    tangents, then every partial derivative is carried through in one pass
+    """
+    __slots__ = ('real','eps')
+    __array_ufunc__ = None # let numpy defer to the Dual operators
+
     def __init__(self, real=0., eps=0.) -> None:
         self.real = real
         self.eps = eps
 
+    def __reduce__(self): # pickled as its constructor call, cheap to ship to worker processes
+        return (type(self), (self.real, self.eps))
+
     ############################
     # basic comparison operators
     ############################
     def __lt__(self,x):
-        if isinstance(x,Dual):
-            return self.real < x.real
-        elif isinstance(x,Real):
-            return self.real < x
+        return self.real < _real(x)
 
     def __gt__(self,x):
-        if isinstance(x,Dual):
-            return self.real > x.real
-        elif isinstance(x,Real):
-            return self.real > x
+        return self.real > _real(x)
 
     def __rlt__(self,x):
         return self.__gt__(x)
@@ -30,16 +38,10 @@ class Dual:
         return self.__lt__(x)
 
     def __le__(self,x):
-        if isinstance(x,Dual):
-            return self.real <= x.real
-        elif isinstance(x,Real):
-            return self.real <= x
+        return self.real <= _real(x)
 
     def __ge__(self,x):
-        if isinstance(x,Dual):
-            return self.real >= x.real
-        elif isinstance(x,Real):
-            return self.real >= x
+        return self.real >= _real(x)
 
     def __rle__(self,x):
         return self.__ge__(x)
@@ -54,64 +56,102 @@ class Dual:
         return Dual(-self.real,-self.eps)
 
     def __add__(self,x):
-        if isinstance(x,Dual):
+        kind = _KINDS.get(type(x)) or _kind(x)
+        if kind is _DUAL:
             return Dual(self.real + x.real, self.eps + x.eps)
-        if isinstance(x,Real):
-            return Dual(self.real + float(x), self.eps)
+        if kind is _REAL:
+            return Dual(self.real + x, self.eps)
+        if kind is _ARRAY:
+            return _promote(self,x).__add__(x)
+        return NotImplemented
 
     def __radd__(self,x):
         return self.__add__(x)
-    
+
     def __sub__(self,x): # Dual - Dual or Dual - float
-        if isinstance(x,Dual):
+        kind = _KINDS.get(type(x)) or _kind(x)
+        if kind is _DUAL:
             return Dual(self.real - x.real, self.eps - x.eps)
-        if isinstance(x,Real):
-            return Dual(self.real - float(x) , self.eps)
+        if kind is _REAL:
+            return Dual(self.real - x, self.eps)
+        if kind is _ARRAY:
+            return _promote(self,x).__sub__(x)
+        return NotImplemented
 
     def __rsub__(self,x): # Dual - Dual or float - Dual
-        if isinstance(x,Dual):
+        kind = _KINDS.get(type(x)) or _kind(x)
+        if kind is _DUAL:
             return Dual(x.real - self.real, x.eps - self.eps)
-        if isinstance(x,Real):
-            return Dual(float(x) - self.real , -self.eps)
+        if kind is _REAL:
+            return Dual(x - self.real, -self.eps)
+        if kind is _ARRAY:
+            return _promote(self,x).__rsub__(x)
+        return NotImplemented
 
     def __mul__(self,x): # Dual * Dual or Dual * float
-        if isinstance(x,Dual):
+        kind = _KINDS.get(type(x)) or _kind(x)
+        if kind is _DUAL:
             return Dual(self.real * x.real, self.real * x.eps + x.real * self.eps)
-        if isinstance(x,Real):
-            return Dual(float(x) * self.real, float(x) * self.eps)
-    
+        if kind is _REAL:
+            return Dual(x * self.real, x * self.eps)
+        if kind is _ARRAY:
+            return _promote(self,x).__mul__(x)
+        return NotImplemented
+
     def __rmul__(self,x): # float * Dual
         return self.__mul__(x)
 
-    def __truediv__(self,x): # Dual / float
-        return self.__mul__(1 / x)
+    def __truediv__(self,x): # Dual / Dual or Dual / float
+        kind = _KINDS.get(type(x)) or _kind(x)
+        if kind is _DUAL:
+            div_real = self.real / x.real
+            return Dual(div_real, (self.eps - div_real * x.eps) / x.real)
+        if kind is _REAL:
+            return Dual(self.real / x, self.eps / x)
+        if kind is _ARRAY:
+            return _promote(self,x).__truediv__(x)
+        return NotImplemented
 
     def __rtruediv__(self,x): # float / Dual
-        if isinstance(x,Dual):
-            return Dual(x.real / self.real, (x.eps * self.real - x.real * self.eps) / self.real ** 2)
-        if isinstance(x,Real):
-            return Dual(float(x) / self.real, (- float(x) * self.eps) / self.real ** 2)
+        kind = _KINDS.get(type(x)) or _kind(x)
+        if kind is _DUAL:
+            div_real = x.real / self.real
+            return Dual(div_real, (x.eps - div_real * self.eps) / self.real)
+        if kind is _REAL:
+            div_real = x / self.real
+            return Dual(div_real, - div_real * self.eps / self.real)
+        if kind is _ARRAY:
+            return _promote(self,x).__rtruediv__(x)
+        return NotImplemented
 
     def __pow__(self,x): # Dual^()
-        if isinstance(x,Dual):
+        kind = _KINDS.get(type(x)) or _kind(x)
+        if kind is _DUAL:
             pow_real = self.real ** x.real
             pow_diriv = pow_real * (x.eps * math.log(self.real) + x.real / self.real * self.eps)
             return Dual(pow_real,pow_diriv)
-        if isinstance(x,Real):
+        if kind is _REAL:
             pow_real = self.real ** x
             pow_diriv = x * (self.real ** (x-1)) * self.eps
             return Dual(pow_real,pow_diriv)
+        if kind is _ARRAY:
+            return _promote(self,x).__pow__(x)
+        return NotImplemented
 
     def __rpow__(self,x): # ()^Dual
-        if isinstance(x,Dual):
+        kind = _KINDS.get(type(x)) or _kind(x)
+        if kind is _DUAL:
             pow_real = x.real ** self.real
             pow_diriv = pow_real * (self.eps * math.log(x.real) + self.real / x.real * x.eps)
             return Dual(pow_real,pow_diriv)
-        if isinstance(x,Real):
-            pow_real = float(x) ** self.real
-            pow_diriv = pow_real * math.log(float(x))
+        if kind is _REAL:
+            pow_real = x ** self.real
+            pow_diriv = pow_real * math.log(x) * self.eps
             return Dual(pow_real,pow_diriv)
-        
+        if kind is _ARRAY:
+            return _promote(self,x).__rpow__(x)
+        return NotImplemented
+
     ############################
     # special functions
     ############################
@@ -122,17 +162,453 @@ class Dual:
         return Dual(math.cos(self.real), - self.eps * math.sin(self.real))
 
     def sqrt(self):
-        return Dual(math.sqrt(self.real), self.eps / (2 * math.sqrt(self.real)))
+        sqrt_real = math.sqrt(self.real)
+        return Dual(sqrt_real, self.eps / (2 * sqrt_real))
 
     def exp(self):
-        return Dual(math.exp(self.real), self.eps * math.exp(self.real))
+        exp_real = math.exp(self.real)
+        return Dual(exp_real, self.eps * exp_real)
 
     def log(self):
-        return Dual(math.log(self.real), self.eps * (1 / self.real))
+        return Dual(math.log(self.real), self.eps / self.real)
 
     def gamma(self):
-        return Dual(scipy.special.gamma(self.real), self.eps * scipy.special.gamma(self.real) * scipy.special.polygamma(0,self.real))
+        gamma_real = scipy.special.gamma(self.real)
+        return Dual(gamma_real, self.eps * gamma_real * scipy.special.digamma(self.real))
+
+    def lgamma(self):
+        return Dual(math.lgamma(self.real), self.eps * scipy.special.digamma(self.real))
+
+    def log1p(self):
+        return Dual(math.log1p(self.real), self.eps / (1 + self.real))
+
+    def expm1(self):
+        expm1_real = math.expm1(self.real)
+        return Dual(expm1_real, self.eps * (expm1_real + 1))
+
+    def tanh(self):
+        tanh_real = math.tanh(self.real)
+        return Dual(tanh_real, self.eps * (1 - tanh_real**2))
+
+    def erf(self):
+        return Dual(math.erf(self.real), self.eps * _2_SQRTPI * math.exp(-self.real**2))
+
+    def log_ndtr(self):
+        log_ndtr_real = float(scipy.special.log_ndtr(self.real))
+        return Dual(log_ndtr_real, self.eps * math.exp(-self.real**2/2 - log_ndtr_real) / _SQRT2PI)
+
+    def atan(self):
+        return Dual(math.atan(self.real), self.eps / (1 + self.real**2))
+
+    def digamma(self):
+        return Dual(scipy.special.digamma(self.real), self.eps * scipy.special.polygamma(1,self.real))
+
+    def polygamma(self,n):
+        return Dual(scipy.special.polygamma(n,self.real), self.eps * scipy.special.polygamma(n+1,self.real))
+
+    def logsumexp(self,axis=None):
+        return Dual(self.real,self.eps) # log(exp(x)) of a single element
+
+    def betaln(self,b):
+        """Log of the Beta function B(self,b), value and both partials from one digamma pass"""
+        kind = _KINDS.get(type(b)) or _kind(b)
+        if kind is _ARRAY:
+            return _promote(self,b).betaln(b)
+        if isinstance(b,DualArray):
+            return b.betaln(self)
+        psi_ab = scipy.special.digamma(self.real + _real(b))
+        diriv = self.eps * (scipy.special.digamma(self.real) - psi_ab)
+        if kind is _DUAL:
+            diriv = diriv + b.eps * (scipy.special.digamma(b.real) - psi_ab)
+        return Dual(scipy.special.betaln(self.real,_real(b)), diriv)
+
+
+_2_SQRTPI = 2 / math.sqrt(math.pi) # d erf(x) / dx = 2/sqrt(pi) exp(-x^2)
+_SQRT2PI = math.sqrt(2 * math.pi) # d log_ndtr(x) / dx = exp(-x^2/2 - log_ndtr(x)) / sqrt(2 pi)
+
+############################
+# operand kinds
+############################
+# exact-type dispatch: the kind of every operand type seen is looked up in
+# _KINDS, the abstract-base-class checks only run once per new type
+_DUAL, _REAL, _ARRAY, _OTHER = 1, 2, 3, 4
+_KINDS = {float: _REAL, int: _REAL}
+
+def _kind(x):
+    """Classify the type of an operand and cache the answer"""
+    t = type(x)
+    if issubclass(t,Dual):
+        kind = _DUAL
+    elif issubclass(t,Real):
+        kind = _REAL
+    elif issubclass(t,np.ndarray):
+        kind = _ARRAY
+    else:
+        kind = _OTHER
+    _KINDS[t] = kind
+    return kind
+
+def _plain(x):
+    """True for plain numbers and numpy arrays, False for differentiable types"""
+    kind = _KINDS.get(type(x)) or _kind(x)
+    return kind is _REAL or kind is _ARRAY
+
+
+class DualArray(Dual):
+    """Autolik vectorized Dual type
+
+    Holds parallel ``real`` and ``eps`` numpy arrays, every operator and
+    special function acts elementwise, so a whole sample is differentiated
+    by a handful of numpy calls instead of one ``Dual`` per observation.
+    Vector tangents are stored on a leading axis, ``eps.shape == (p,) + real.shape``.
+
+    Example:
+
+    >>> import numpy as np
+    >>> from autolik import Dual
+    >>> y = np.array([0.5,1.5,2.5])
+    >>> mu = Dual(1.,1.)
+    >>> ((y - mu) ** 2).sum() # DualArray reduced to a Dual
+
+    """
+    __slots__ = ()
+
+    def __init__(self, real=0., eps=0.) -> None:
+        self.real = np.asarray(real,dtype=float)
+        self.eps = np.asarray(eps,dtype=float)
+
+    def __len__(self):
+        return len(self.real)
+
+    def __getitem__(self,key):
+        lead = self.eps.ndim - self.real.ndim
+        if lead > 0:
+            key = (slice(None),) * lead + (key if isinstance(key,tuple) else (key,))
+        return DualArray(self.real[key], self._full_eps()[key])
+
+    @property
+    def shape(self):
+        return self.real.shape
+
+    def _full_eps(self):
+        """eps broadcast against real, keeping any leading tangent axis"""
+        lead = max(self.eps.ndim - self.real.ndim, 0)
+        return np.broadcast_to(self.eps, self.eps.shape[:lead] + self.real.shape)
+
+    def sum(self,axis=None):
+        """Sum the elements, a full reduction gives back a scalar Dual"""
+        real = self.real.sum(axis=axis)
+        eps = self._full_eps()
+        lead = eps.ndim - self.real.ndim
+        if axis is None:
+            eps_axis = tuple(range(lead, eps.ndim))
+        elif isinstance(axis,tuple):
+            eps_axis = tuple(a if a < 0 else a + lead for a in axis)
+        else:
+            eps_axis = axis if axis < 0 else axis + lead
+        eps = eps.sum(axis=eps_axis)
+        if np.ndim(real) == 0:
+            return Dual(float(real), eps if lead else float(eps))
+        return DualArray(real,eps)
+
+    ############################
+    # basic comparison operators
+    ############################
+    def __lt__(self,x):
+        return self.real < _real(x)
+
+    def __gt__(self,x):
+        return self.real > _real(x)
+
+    def __le__(self,x):
+        return self.real <= _real(x)
+
+    def __ge__(self,x):
+        return self.real >= _real(x)
+
+    ############################
+    # basic numeric operators
+    ############################
+    def __neg__(self):
+        return DualArray(-self.real,-self.eps)
+
+    def __add__(self,x):
+        if isinstance(x,Dual):
+            return DualArray(self.real + x.real, self.eps + _eps(x,self))
+        if isinstance(x,(Real,np.ndarray)):
+            return DualArray(self.real + x, self.eps)
+        return NotImplemented
+
+    def __radd__(self,x):
+        return self.__add__(x)
+
+    def __sub__(self,x):
+        if isinstance(x,Dual):
+            return DualArray(self.real - x.real, self.eps - _eps(x,self))
+        if isinstance(x,(Real,np.ndarray)):
+            return DualArray(self.real - x, self.eps)
+        return NotImplemented
+
+    def __rsub__(self,x):
+        if isinstance(x,Dual):
+            return DualArray(x.real - self.real, _eps(x,self) - self.eps)
+        if isinstance(x,(Real,np.ndarray)):
+            return DualArray(x - self.real, -self.eps)
+        return NotImplemented
+
+    def __mul__(self,x):
+        if isinstance(x,Dual):
+            return DualArray(self.real * x.real, self.real * _eps(x,self) + x.real * self.eps)
+        if isinstance(x,(Real,np.ndarray)):
+            return DualArray(self.real * x, x * self.eps)
+        return NotImplemented
+
+    def __rmul__(self,x):
+        return self.__mul__(x)
+
+    def __truediv__(self,x):
+        if isinstance(x,Dual):
+            div_real = self.real / x.real
+            return DualArray(div_real, (self.eps - div_real * _eps(x,self)) / x.real)
+        if isinstance(x,(Real,np.ndarray)):
+            return DualArray(self.real / x, self.eps / x)
+        return NotImplemented
+
+    def __rtruediv__(self,x):
+        if isinstance(x,Dual):
+            div_real = x.real / self.real
+            return DualArray(div_real, (_eps(x,self) - div_real * self.eps) / self.real)
+        if isinstance(x,(Real,np.ndarray)):
+            div_real = x / self.real
+            return DualArray(div_real, - div_real * self.eps / self.real)
+        return NotImplemented
+
+    def __pow__(self,x):
+        if isinstance(x,Dual):
+            pow_real = self.real ** x.real
+            pow_diriv = pow_real * (_eps(x,self) * np.log(self.real) + x.real / self.real * self.eps)
+            return DualArray(pow_real,pow_diriv)
+        if isinstance(x,(Real,np.ndarray)):
+            pow_real = self.real ** x
+            pow_diriv = x * (self.real ** (x-1)) * self.eps
+            return DualArray(pow_real,pow_diriv)
+        return NotImplemented
+
+    def __rpow__(self,x):
+        if isinstance(x,Dual):
+            pow_real = x.real ** self.real
+            pow_diriv = pow_real * (self.eps * np.log(x.real) + self.real / x.real * _eps(x,self))
+            return DualArray(pow_real,pow_diriv)
+        if isinstance(x,(Real,np.ndarray)):
+            pow_real = x ** self.real
+            pow_diriv = pow_real * np.log(x) * self.eps
+            return DualArray(pow_real,pow_diriv)
+        return NotImplemented
+
+    ############################
+    # special functions
+    ############################
+    def sin(self):
+        return DualArray(np.sin(self.real), self.eps * np.cos(self.real))
+
+    def cos(self):
+        return DualArray(np.cos(self.real), - self.eps * np.sin(self.real))
+
+    def sqrt(self):
+        sqrt_real = np.sqrt(self.real)
+        return DualArray(sqrt_real, self.eps / (2 * sqrt_real))
+
+    def exp(self):
+        exp_real = np.exp(self.real)
+        return DualArray(exp_real, self.eps * exp_real)
+
+    def log(self):
+        return DualArray(np.log(self.real), self.eps / self.real)
+
+    def gamma(self):
+        gamma_real = scipy.special.gamma(self.real)
+        return DualArray(gamma_real, self.eps * gamma_real * scipy.special.digamma(self.real))
+
+    def lgamma(self):
+        return DualArray(scipy.special.gammaln(self.real), self.eps * scipy.special.digamma(self.real))
+
+    def log1p(self):
+        return DualArray(np.log1p(self.real), self.eps / (1 + self.real))
+
+    def expm1(self):
+        expm1_real = np.expm1(self.real)
+        return DualArray(expm1_real, self.eps * (expm1_real + 1))
+
+    def tanh(self):
+        tanh_real = np.tanh(self.real)
+        return DualArray(tanh_real, self.eps * (1 - tanh_real**2))
+
+    def erf(self):
+        return DualArray(scipy.special.erf(self.real), self.eps * _2_SQRTPI * np.exp(-self.real**2))
+
+    def log_ndtr(self):
+        log_ndtr_real = scipy.special.log_ndtr(self.real)
+        return DualArray(log_ndtr_real, self.eps * np.exp(-self.real**2/2 - log_ndtr_real) / _SQRT2PI)
+
+    def atan(self):
+        return DualArray(np.arctan(self.real), self.eps / (1 + self.real**2))
+
+    def digamma(self):
+        return DualArray(scipy.special.digamma(self.real), self.eps * scipy.special.polygamma(1,self.real))
+
+    def polygamma(self,n):
+        return DualArray(scipy.special.polygamma(n,self.real), self.eps * scipy.special.polygamma(n+1,self.real))
+
+    def logsumexp(self,axis=None):
+        """log(sum(exp)) of the elements, computed without overflow"""
+        lse = scipy.special.logsumexp(self.real,axis=axis,keepdims=True)
+        weight = np.exp(self.real - lse) # softmax, d lse / d real
+        result = DualArray(self.real, self.eps * weight).sum(axis=axis)
+        real = np.squeeze(lse,axis=axis)
+        result.real = float(real) if np.ndim(real) == 0 else real
+        return result
+
+    def betaln(self,b):
+        """Log of the Beta function B(self,b), value and both partials from one digamma pass"""
+        b_real = _real(b)
+        psi_ab = scipy.special.digamma(self.real + b_real)
+        diriv = self.eps * (scipy.special.digamma(self.real) - psi_ab)
+        if isinstance(b,Dual):
+            diriv = diriv + _eps(b,self) * (scipy.special.digamma(b_real) - psi_ab)
+        return DualArray(scipy.special.betaln(self.real,b_real), diriv)
+
+
+def _real(x):
+    """Real part of a Dual, plain numbers are returned unchanged"""
+    return x.real if isinstance(x,Dual) else x
+
+
+def _tangent(eps,ndim):
+    """Tangent vector reshaped to broadcast against ndim-dimensional data"""
+    if np.ndim(eps) == 0:
+        return eps
+    return np.reshape(eps, np.shape(eps) + (1,) * ndim)
+
+
+def _promote(d:Dual,x) -> DualArray:
+    """Scalar Dual as a DualArray broadcasting against the array ``x``"""
+    return DualArray(d.real, _tangent(d.eps,np.ndim(x)))
+
+
+def _eps(x:Dual,like:DualArray):
+    """eps of a Dual operand, shaped to broadcast against ``like``"""
+    if isinstance(x,DualArray):
+        return x.eps
+    return _tangent(x.eps,like.real.ndim)
+
+
+############################
+# generic elementary functions
+############################
+def sin(x):
+    """Sine of a number, a numpy array or any autolik differentiable type"""
+    if _plain(x):
+        return np.sin(x)
+    return x.sin()
+
+def cos(x):
+    """Cosine of a number, a numpy array or any autolik differentiable type"""
+    if _plain(x):
+        return np.cos(x)
+    return x.cos()
+
+def sqrt(x):
+    """Square root of a number, a numpy array or any autolik differentiable type"""
+    if _plain(x):
+        return np.sqrt(x)
+    return x.sqrt()
+
+def exp(x):
+    """Exponential of a number, a numpy array or any autolik differentiable type"""
+    if _plain(x):
+        return np.exp(x)
+    return x.exp()
+
+def log(x):
+    """Natural logarithm of a number, a numpy array or any autolik differentiable type"""
+    if _plain(x):
+        return np.log(x)
+    return x.log()
+
+def gamma(x):
+    """Gamma function of a number, a numpy array or any autolik differentiable type"""
+    if _plain(x):
+        return scipy.special.gamma(x)
+    return x.gamma()
+
+def lgamma(x):
+    """Log-Gamma function of a number, a numpy array or any autolik differentiable type"""
+    if _plain(x):
+        return scipy.special.gammaln(x)
+    return x.lgamma()
+
+def log1p(x):
+    """log(1+x) of a number, a numpy array or any autolik differentiable type"""
+    if _plain(x):
+        return np.log1p(x)
+    return x.log1p()
+
+def expm1(x):
+    """exp(x)-1 of a number, a numpy array or any autolik differentiable type"""
+    if _plain(x):
+        return np.expm1(x)
+    return x.expm1()
+
+def tanh(x):
+    """Hyperbolic tangent of a number, a numpy array or any autolik differentiable type"""
+    if _plain(x):
+        return np.tanh(x)
+    return x.tanh()
+
+def erf(x):
+    """Error function of a number, a numpy array or any autolik differentiable type"""
+    if _plain(x):
+        return scipy.special.erf(x)
+    return x.erf()
+
+def log_ndtr(x):
+    """Log of the standard normal CDF, accurate far into the lower tail, of a number, a numpy array or any autolik differentiable type"""
+    if _plain(x):
+        return scipy.special.log_ndtr(x)
+    return x.log_ndtr()
+
+def atan(x):
+    """Inverse tangent of a number, a numpy array or any autolik differentiable type"""
+    if _plain(x):
+        return np.arctan(x)
+    return x.atan()
+
+def digamma(x):
+    """Digamma function of a number, a numpy array or any autolik differentiable type"""
+    if _plain(x):
+        return scipy.special.digamma(x)
+    return x.digamma()
+
+def polygamma(n,x):
+    """n-th derivative of the digamma function of a number, a numpy array or any autolik differentiable type"""
+    if _plain(x):
+        return scipy.special.polygamma(n,x)
+    return x.polygamma(n)
+
+def logsumexp(x,axis=None):
+    """log(sum(exp(x))) over an axis of a numpy array or any autolik differentiable type"""
+    if _plain(x):
+        return scipy.special.logsumexp(x,axis=axis)
+    return x.logsumexp(axis)
+
+def betaln(a,b):
+    """Log of the Beta function, fused into one node for autolik differentiable types"""
+    if _plain(a):
+        if _plain(b):
+            return scipy.special.betaln(a,b)
+        a, b = b, a # B(a,b) is symmetric
+    return a.betaln(b)
 
- 
-def beta(a:Dual,b:Dual) -> Dual:
-    return Dual.gamma(a) * Dual.gamma(b) / Dual.gamma(a + b)
\ No newline at end of file
+def beta(a,b):
+    """Beta function of numbers, numpy arrays or any autolik differentiable types"""
+    return exp(betaln(a,b))
@@ -0,0 +1,277 @@
+from numbers import Real
+import numpy as np
+from autolik._lazy import scipy
+from autolik.Dual.benchmark import Dual
+
+class HyperDual(Dual):
+    """Autolik second-order (hyper-dual) type
+
+    Carries the value ``real``, its gradient ``eps`` and its Hessian ``eps2``
+    with respect to p seeded inputs. Every operation applies the second-order
+    chain rule
+
+    .. math::
+        f(u) = (f(r),\\ f'(r) g,\\ f'(r) H + f''(r) g g^T)
+
+    so one evaluation of a function gives every entry of its Hessian.
+    ``real`` may be a numpy array of observations, the tangent axes are then
+    leading: ``eps.shape == (p,) + real.shape`` and
+    ``eps2.shape == (p,p) + real.shape``.
+
+    Example:
+
+    >>> import numpy as np
+    >>> from autolik.Dual.hyperdual import HyperDual
+    >>> x = HyperDual(1.,np.array([1.,0.]),np.zeros((2,2)))
+    >>> y = HyperDual(2.,np.array([0.,1.]),np.zeros((2,2)))
+    >>> (x * (x*y).exp()).eps2
+
+    """
+    __slots__ = ('eps2',)
+
+    def __init__(self, real=0., eps=0., eps2=0.) -> None:
+        self.real = real
+        self.eps = eps
+        self.eps2 = eps2
+
+    def __reduce__(self):
+        return (HyperDual, (self.real, self.eps, self.eps2))
+
+    def _unary(self,f,df,d2f):
+        """Apply a scalar function given its value and first two derivatives"""
+        _, g, H = _lift(self,np.ndim(f))
+        return HyperDual(f, df * g, df * H + d2f * _outer(g,g))
+
+    def __len__(self):
+        return len(self.real)
+
+    @property
+    def shape(self):
+        return np.shape(self.real)
+
+    def sum(self,axis=None):
+        """Sum over the observations, a full reduction gives back a scalar HyperDual"""
+        ndim = np.ndim(self.real)
+        eps, eps2 = _full(self.eps,1,self.real), _full(self.eps2,2,self.real)
+        if axis is None:
+            axes = tuple(range(ndim))
+        else:
+            axes = tuple(a % ndim for a in (axis if isinstance(axis,tuple) else (axis,)))
+        real = np.sum(self.real,axis=axes)
+        return HyperDual(float(real) if np.ndim(real) == 0 else real,
+                         eps.sum(axis=tuple(a + 1 for a in axes)),
+                         eps2.sum(axis=tuple(a + 2 for a in axes)))
+
+    ############################
+    # basic comparison operators
+    ############################
+    def __lt__(self,x):
+        return self.real < _real(x)
+
+    def __gt__(self,x):
+        return self.real > _real(x)
+
+    def __le__(self,x):
+        return self.real <= _real(x)
+
+    def __ge__(self,x):
+        return self.real >= _real(x)
+
+    ############################
+    # basic numeric operators
+    ############################
+    def __neg__(self):
+        return HyperDual(-self.real,-self.eps,-self.eps2)
+
+    def __add__(self,x):
+        if isinstance(x,HyperDual):
+            a, b = _align(self,x)
+            return HyperDual(a[0] + b[0], a[1] + b[1], a[2] + b[2])
+        if isinstance(x,(Real,np.ndarray)):
+            r, g, H = _lift(self,np.ndim(x))
+            return HyperDual(r + x, g, H)
+        return NotImplemented
+
+    def __radd__(self,x):
+        return self.__add__(x)
+
+    def __sub__(self,x):
+        if isinstance(x,HyperDual):
+            a, b = _align(self,x)
+            return HyperDual(a[0] - b[0], a[1] - b[1], a[2] - b[2])
+        if isinstance(x,(Real,np.ndarray)):
+            r, g, H = _lift(self,np.ndim(x))
+            return HyperDual(r - x, g, H)
+        return NotImplemented
+
+    def __rsub__(self,x):
+        if isinstance(x,(Real,np.ndarray)):
+            r, g, H = _lift(self,np.ndim(x))
+            return HyperDual(x - r, -g, -H)
+        return NotImplemented
+
+    def __mul__(self,x):
+        if isinstance(x,HyperDual):
+            (r, g, H), (s, h, K) = _align(self,x)
+            return HyperDual(r * s, r * h + s * g, r * K + s * H + _outer(g,h) + _outer(h,g))
+        if isinstance(x,(Real,np.ndarray)):
+            r, g, H = _lift(self,np.ndim(x))
+            return HyperDual(r * x, g * x, H * x)
+        return NotImplemented
+
+    def __rmul__(self,x):
+        return self.__mul__(x)
+
+    def __truediv__(self,x):
+        if isinstance(x,HyperDual):
+            return self * x.__rtruediv__(1.)
+        if isinstance(x,(Real,np.ndarray)):
+            return self * (1 / x)
+        return NotImplemented
+
+    def __rtruediv__(self,x):
+        if isinstance(x,(Real,np.ndarray)):
+            inv = 1 / self.real
+            return self._unary(inv, -inv**2, 2 * inv**3) * x
+        return NotImplemented
+
+    def __pow__(self,x):
+        if isinstance(x,HyperDual):
+            return (x * self.log()).exp()
+        if isinstance(x,(Real,np.ndarray)):
+            r = self.real
+            return self._unary(r ** x, x * r ** (x-1), x * (x-1) * r ** (x-2))
+        return NotImplemented
+
+    def __rpow__(self,x):
+        if isinstance(x,(Real,np.ndarray)):
+            return (self * np.log(x)).exp()
+        return NotImplemented
+
+    ############################
+    # special functions
+    ############################
+    def sin(self):
+        s, c = np.sin(self.real), np.cos(self.real)
+        return self._unary(s, c, -s)
+
+    def cos(self):
+        s, c = np.sin(self.real), np.cos(self.real)
+        return self._unary(c, -s, -c)
+
+    def sqrt(self):
+        s = np.sqrt(self.real)
+        return self._unary(s, 1 / (2 * s), -1 / (4 * s * self.real))
+
+    def exp(self):
+        e = np.exp(self.real)
+        return self._unary(e, e, e)
+
+    def log(self):
+        inv = 1 / self.real
+        return self._unary(np.log(self.real), inv, -inv**2)
+
+    def gamma(self):
+        g = scipy.special.gamma(self.real)
+        psi = scipy.special.digamma(self.real)
+        return self._unary(g, g * psi, g * (psi**2 + scipy.special.polygamma(1,self.real)))
+
+    def lgamma(self):
+        return self._unary(scipy.special.gammaln(self.real), scipy.special.digamma(self.real),
+                           scipy.special.polygamma(1,self.real))
+
+    def log1p(self):
+        inv = 1 / (1 + self.real)
+        return self._unary(np.log1p(self.real), inv, -inv**2)
+
+    def expm1(self):
+        e = np.expm1(self.real)
+        return self._unary(e, e + 1, e + 1)
+
+    def tanh(self):
+        t = np.tanh(self.real)
+        return self._unary(t, 1 - t**2, -2 * t * (1 - t**2))
+
+    def erf(self):
+        d = 2 / np.sqrt(np.pi) * np.exp(-self.real**2)
+        return self._unary(scipy.special.erf(self.real), d, -2 * self.real * d)
+
+    def log_ndtr(self):
+        v = scipy.special.log_ndtr(self.real)
+        d = np.exp(-self.real**2/2 - v) / np.sqrt(2 * np.pi)
+        return self._unary(v, d, -d * (self.real + d))
+
+    def atan(self):
+        d = 1 / (1 + self.real**2)
+        return self._unary(np.arctan(self.real), d, -2 * self.real * d**2)
+
+    def digamma(self):
+        return self.polygamma(0)
+
+    def polygamma(self,n):
+        return self._unary(*(scipy.special.polygamma(k,self.real) for k in (n, n+1, n+2)))
+
+    def logsumexp(self,axis=None):
+        """log(sum(exp)) of the elements, computed without overflow"""
+        ndim = np.ndim(self.real)
+        if axis is None:
+            axes = tuple(range(ndim))
+        else:
+            axes = tuple(a % ndim for a in (axis if isinstance(axis,tuple) else (axis,)))
+        lse = scipy.special.logsumexp(self.real,axis=axes,keepdims=True)
+        w = np.exp(self.real - lse) # softmax, d lse / d real
+        g, H = _full(self.eps,1,self.real), _full(self.eps2,2,self.real)
+        G = np.sum(w * g, axis=tuple(a + 1 for a in axes))
+        K = np.sum(w * (H + _outer(g,g)), axis=tuple(a + 2 for a in axes)) - _outer(G,G)
+        real = np.squeeze(lse,axis=axes)
+        return HyperDual(float(real) if np.ndim(real) == 0 else real, G, K)
+
+    def betaln(self,b):
+        """Log of the Beta function B(self,b) with its first and second partials"""
+        if not isinstance(b,HyperDual):
+            r = self.real
+            return self._unary(scipy.special.betaln(r,b),
+                               scipy.special.digamma(r) - scipy.special.digamma(r + b),
+                               scipy.special.polygamma(1,r) - scipy.special.polygamma(1,r + b))
+        (r, g, H), (s, h, K) = _align(self,b)
+        psi_a, psi_b, psi_ab = scipy.special.digamma(r), scipy.special.digamma(s), scipy.special.digamma(r + s)
+        tri_a, tri_b, tri_ab = (scipy.special.polygamma(1,v) for v in (r, s, r + s))
+        fa, fb = psi_a - psi_ab, psi_b - psi_ab
+        eps2 = (fa * H + fb * K + (tri_a - tri_ab) * _outer(g,g) + (tri_b - tri_ab) * _outer(h,h)
+                - tri_ab * (_outer(g,h) + _outer(h,g)))
+        return HyperDual(scipy.special.betaln(r,s), fa * g + fb * h, eps2)
+
+
+def _real(x):
+    """Value of a HyperDual, plain numbers are returned unchanged"""
+    return x.real if isinstance(x,HyperDual) else x
+
+
+def _outer(g,h):
+    """Outer product over the leading tangent axis, data axes broadcast"""
+    if np.ndim(g) == 0 or np.ndim(h) == 0: # constant operand, no tangent
+        return 0.
+    return np.expand_dims(g,1) * np.expand_dims(h,0)
+
+
+def _full(part,lead,real):
+    """Tangent part broadcast against real, keeping its lead tangent axes"""
+    part = np.asarray(part)
+    return np.broadcast_to(part, part.shape[:lead] + np.shape(real))
+
+
+def _lift(x:HyperDual,ndim):
+    """Parts of x with the tangents reshaped to broadcast against ndim-dimensional data"""
+    pad = ndim - np.ndim(x.real)
+    eps, eps2 = x.eps, x.eps2
+    if pad > 0 and np.ndim(eps):
+        eps = np.reshape(eps, np.shape(eps)[:1] + (1,) * pad + np.shape(eps)[1:])
+    if pad > 0 and np.ndim(eps2):
+        eps2 = np.reshape(eps2, np.shape(eps2)[:2] + (1,) * pad + np.shape(eps2)[2:])
+    return x.real, eps, eps2
+
+
+def _align(x:HyperDual,y:HyperDual):
+    """Parts of two HyperDuals reshaped to broadcast against each other"""
+    ndim = max(np.ndim(x.real), np.ndim(y.real))
+    return _lift(x,ndim), _lift(y,ndim)
@@ -0,0 +1,180 @@
+import numpy as np
+from autolik._lazy import scipy
+from autolik.Dual.benchmark import Dual, DualArray
+from autolik.Dual.hyperdual import HyperDual, _lift, _outer
+from autolik.Dual.reverse import Var
+from autolik.Dual.trace import Trace
+
+# log of the regularized incomplete gamma and beta functions, with their
+# derivatives in the integration bound in closed form and in the shape
+# parameters by central differences of the log values (no closed form)
+_H = 1e-4 # relative step of the shape differences
+
+
+############################
+# plain values, log-stable
+############################
+def _log_p(a,x):
+    """log P(a,x), the leading series terms where P underflows"""
+    with np.errstate(divide='ignore',invalid='ignore'):
+        v = np.log(scipy.special.gammainc(a,x))
+        tail = a*np.log(x) - x - scipy.special.gammaln(a + 1) + np.log1p(x/(a + 1)*(1 + x/(a + 2)))
+    return np.where(np.isfinite(v),v,tail)
+
+def _log_q(a,x):
+    """log Q(a,x), the leading asymptotic terms where Q underflows"""
+    with np.errstate(divide='ignore',invalid='ignore'):
+        v = np.log(scipy.special.gammaincc(a,x))
+        tail = (a - 1)*np.log(x) - x - scipy.special.gammaln(a) + np.log1p((a - 1)/x*(1 + (a - 2)/x))
+    return np.where(np.isfinite(v),v,tail)
+
+def _log_i(a,b,x):
+    """log I_x(a,b), the leading series terms where I underflows"""
+    with np.errstate(divide='ignore',invalid='ignore'):
+        v = np.log(scipy.special.betainc(a,b,x))
+        tail = a*np.log(x) + b*np.log1p(-x) - np.log(a) - scipy.special.betaln(a,b) + np.log1p((a + b)/(a + 1)*x)
+    return np.where(np.isfinite(v),v,tail)
+
+def _log_ic(a,b,x):
+    """log(1 - I_x(a,b)) = log I_{1-x}(b,a)"""
+    with np.errstate(divide='ignore',invalid='ignore'):
+        v = np.log(scipy.special.betaincc(a,b,x))
+        tail = b*np.log1p(-x) + a*np.log(x) - np.log(b) - scipy.special.betaln(a,b) + np.log1p((a + b)/(b + 1)*(1 - x))
+    return np.where(np.isfinite(v),v,tail)
+
+
+############################
+# partial derivatives
+############################
+def _bound_gamma(a,x,v,sign):
+    """d/dx of log P (sign 1) or log Q (sign -1), x^(a-1) e^-x / Gamma(a) over the function"""
+    return sign * np.exp((a - 1)*np.log(x) - x - scipy.special.gammaln(a) - v)
+
+def _bound_beta(a,b,x,v,sign):
+    """d/dx of log I (sign 1) or log(1-I) (sign -1)"""
+    return sign * np.exp((a - 1)*np.log(x) + (b - 1)*np.log1p(-x) - scipy.special.betaln(a,b) - v)
+
+def _curvature_gamma(a,x,d):
+    """d2/dx2 of log P or log Q from its first derivative d"""
+    return d * ((a - 1)/x - 1 - d)
+
+def _curvature_beta(a,b,x,d):
+    """d2/dx2 of log I or log(1-I) from its first derivative d"""
+    return d * ((a - 1)/x - (b - 1)/(1 - x) - d)
+
+def _shape(fn,args,i):
+    """Central difference of the log value in the shape argument i
+
+    the step is relative, the shapes are positive and a - h stays so however small a is
+    """
+    h = _H * np.abs(args[i])
+    up, down = list(args), list(args)
+    up[i], down[i] = args[i] + h, args[i] - h
+    return (fn(*up) - fn(*down)) / (2*h)
+
+def _partials(fn,bound,args):
+    """Value and first partials in every argument, the bound (last) in closed form"""
+    v = fn(*args)
+    return v, [_shape(fn,args,i) for i in range(len(args) - 1)] + [bound(*args,v)]
+
+def _second(fn,bound,curvature,args):
+    """Second partials, in the shapes by central differences of the first partials
+
+    the bound is never shifted, it may sit at the edge of its domain
+    """
+    n = len(args)
+    d2 = [[None] * n for _ in range(n)]
+    for j in range(n - 1):
+        h = _H * np.abs(args[j])
+        up, down = list(args), list(args)
+        up[j], down[j] = args[j] + h, args[j] - h
+        d_up, d_down = _partials(fn,bound,up)[1], _partials(fn,bound,down)[1]
+        for i in range(n):
+            d2[i][j] = (d_up[i] - d_down[i]) / (2*h)
+    for i in range(n - 1): # mixed partials, the bound derivative differenced in the shape
+        d2[i][n-1] = d2[n-1][i]
+    d2[n-1][n-1] = curvature(*args,_partials(fn,bound,args)[1][-1])
+    return [[(d2[i][j] + d2[j][i]) / 2 for j in range(n)] for i in range(n)]
+
+
+############################
+# chain rule on the autolik types
+############################
+def _chain(fn,bound,curvature,*args):
+    """Apply fn with the first (and second) order chain rule over its autolik arguments"""
+    kinds = {type(x) for x in args if isinstance(x,Dual)}
+    reals = [np.asarray(x.real if isinstance(x,Dual) else x,dtype=float) for x in args]
+    if not kinds:
+        v = fn(*reals)
+        return float(v) if np.ndim(v) == 0 else v
+    if len(kinds) > 1 and kinds != {Dual, DualArray}:
+        raise TypeError(f"cannot mix {', '.join(sorted(k.__name__ for k in kinds))}")
+    kind = kinds.pop()
+    if kind is Trace: # recorded as one node, compile emits the partials below as its adjoints
+        v = fn(*reals)
+        graph = next(x for x in args if isinstance(x,Trace)).graph
+        return graph.node(_TRACED[fn],float(v) if np.ndim(v) == 0 else v,*args)
+    if kind is Var:
+        v, d = _partials(fn,bound,reals)
+        tape = next(x for x in args if isinstance(x,Var)).tape
+        return Var(float(v) if np.ndim(v) == 0 else v,tape,
+                   tuple((x,di) for x, di in zip(args,d) if isinstance(x,Var)))
+    if kind is HyperDual:
+        v, d = _partials(fn,bound,reals)
+        d2 = _second(fn,bound,curvature,reals)
+        ndim = np.ndim(v)
+        lifted = [_lift(x,ndim)[1:] if isinstance(x,HyperDual) else (0.,0.) for x in args]
+        eps = sum(di * g for di, (g, _) in zip(d,lifted))
+        eps2 = sum(di * H for di, (_, H) in zip(d,lifted))
+        for i, (gi, _) in enumerate(lifted):
+            for j, (gj, _) in enumerate(lifted):
+                eps2 = eps2 + d2[i][j] * _outer(gi,gj)
+        return HyperDual(float(v) if ndim == 0 else v, eps, eps2)
+    if kind not in (Dual, DualArray):
+        raise TypeError(f"{kind.__name__} is not supported by the incomplete gamma and beta functions")
+    v, d = _partials(fn,bound,reals)
+    ndim = np.ndim(v)
+    eps = sum(di * _tangent(x,ndim) for di, x in zip(d,args) if isinstance(x,Dual))
+    return Dual(float(v), eps) if ndim == 0 else DualArray(v, eps)
+
+# name of the Trace node of each function, see trace._VALUE and trace._ADJOINT
+_TRACED = {_log_p: 'log_gammainc', _log_q: 'log_gammaincc', _log_i: 'log_betainc', _log_ic: 'log_betaincc'}
+
+def _tangent(x:Dual,ndim):
+    """Tangent of x reshaped to broadcast against ndim-dimensional data"""
+    eps = np.asarray(x.eps)
+    pad = ndim - np.ndim(x.real)
+    if pad > 0 and eps.ndim:
+        eps = np.reshape(eps, eps.shape[:1] + (1,) * pad + eps.shape[1:])
+    return eps
+
+
+############################
+# public functions
+############################
+def log_gammainc(a,x):
+    r"""Log of the regularized lower incomplete gamma function
+
+    .. math::
+        \ln P(a,x) = \ln \frac{1}{\Gamma(a)} \int_0^x t^{a-1} e^{-t} dt
+
+    of numbers, numpy arrays or autolik differentiable types, finite where
+    :math:`P` itself underflows
+    """
+    return _chain(_log_p,lambda a,x,v: _bound_gamma(a,x,v,1),_curvature_gamma,a,x)
+
+def log_gammaincc(a,x):
+    r"""Log of the regularized upper incomplete gamma function :math:`\ln Q(a,x) = \ln(1 - P(a,x))`"""
+    return _chain(_log_q,lambda a,x,v: _bound_gamma(a,x,v,-1),_curvature_gamma,a,x)
+
+def log_betainc(a,b,x):
+    r"""Log of the regularized incomplete beta function
+
+    .. math::
+        \ln I_x(a,b) = \ln \frac{1}{B(a,b)} \int_0^x t^{a-1} (1-t)^{b-1} dt
+    """
+    return _chain(_log_i,lambda a,b,x,v: _bound_beta(a,b,x,v,1),_curvature_beta,a,b,x)
+
+def log_betaincc(a,b,x):
+    r"""Log of the complement of the regularized incomplete beta function :math:`\ln(1 - I_x(a,b))`"""
+    return _chain(_log_ic,lambda a,b,x,v: _bound_beta(a,b,x,v,-1),_curvature_beta,a,b,x)
@@ -0,0 +1,246 @@
+from numbers import Real
+import numpy as np
+from autolik._lazy import scipy
+from autolik.Dual.benchmark import Dual
+
+class Var(Dual):
+    """Autolik reverse-mode variable
+
+    Every operation on a ``Var`` computes its value and the local partial
+    derivatives with respect to its operands, and appends the result to the
+    tape shared by all the variables of one evaluation. ``backward`` then walks
+    the tape once in reverse order and accumulates the adjoints, so the whole
+    gradient costs a small constant multiple of one function evaluation.
+
+    ``real`` may be a float or a numpy array, adjoints of broadcast operands
+    are summed back to the operand shape.
+
+    Example:
+
+    >>> from autolik.Dual.reverse import Var
+    >>> tape = []
+    >>> x, y = Var(1.,tape), Var(2.,tape)
+    >>> z = x * (-x**2 - y**2).exp()
+    >>> z.backward()
+    >>> x.adj, y.adj
+
+    """
+    __slots__ = ('adj','parents','tape')
+
+    def __init__(self, real=0., tape=None, parents=()) -> None:
+        self.real = real
+        self.adj = 0.
+        self.parents = parents # ((operand, local partial), ...)
+        self.tape = tape
+        if tape is not None:
+            tape.append(self)
+
+    def _node(self,real,*parents):
+        return Var(real,self.tape,parents)
+
+    def backward(self):
+        """Back-propagate the adjoint of this (scalar) variable through the tape"""
+        self.adj = 1.
+        for node in reversed(self.tape):
+            adj = node.adj
+            if np.ndim(adj) == 0 and adj == 0.:
+                continue
+            for parent, partial in node.parents:
+                if callable(partial):
+                    contrib = partial(adj)
+                else:
+                    contrib = _unbroadcast(adj * partial, np.shape(parent.real))
+                parent.adj = parent.adj + contrib
+
+    def __len__(self):
+        return len(self.real)
+
+    @property
+    def shape(self):
+        return np.shape(self.real)
+
+    def sum(self,axis=None):
+        """Sum the elements of an array-valued variable"""
+        shape = np.shape(self.real)
+        real = np.sum(self.real,axis=axis)
+        if axis is None:
+            partial = lambda g: np.broadcast_to(g,shape)
+        else:
+            partial = lambda g: np.broadcast_to(np.expand_dims(g,axis),shape)
+        if np.ndim(real) == 0:
+            real = float(real)
+        return self._node(real,(self,partial))
+
+    ############################
+    # basic comparison operators
+    ############################
+    def __lt__(self,x):
+        return self.real < _real(x)
+
+    def __gt__(self,x):
+        return self.real > _real(x)
+
+    def __le__(self,x):
+        return self.real <= _real(x)
+
+    def __ge__(self,x):
+        return self.real >= _real(x)
+
+    ############################
+    # basic numeric operators
+    ############################
+    def __neg__(self):
+        return self._node(-self.real,(self,-1.))
+
+    def __add__(self,x):
+        if isinstance(x,Var):
+            return self._node(self.real + x.real,(self,1.),(x,1.))
+        if isinstance(x,(Real,np.ndarray)):
+            return self._node(self.real + x,(self,1.))
+        return NotImplemented
+
+    def __radd__(self,x):
+        return self.__add__(x)
+
+    def __sub__(self,x):
+        if isinstance(x,Var):
+            return self._node(self.real - x.real,(self,1.),(x,-1.))
+        if isinstance(x,(Real,np.ndarray)):
+            return self._node(self.real - x,(self,1.))
+        return NotImplemented
+
+    def __rsub__(self,x):
+        if isinstance(x,(Real,np.ndarray)):
+            return self._node(x - self.real,(self,-1.))
+        return NotImplemented
+
+    def __mul__(self,x):
+        if isinstance(x,Var):
+            return self._node(self.real * x.real,(self,x.real),(x,self.real))
+        if isinstance(x,(Real,np.ndarray)):
+            return self._node(self.real * x,(self,x))
+        return NotImplemented
+
+    def __rmul__(self,x):
+        return self.__mul__(x)
+
+    def __truediv__(self,x):
+        if isinstance(x,Var):
+            div_real = self.real / x.real
+            return self._node(div_real,(self,1 / x.real),(x,-div_real / x.real))
+        if isinstance(x,(Real,np.ndarray)):
+            return self._node(self.real / x,(self,1 / x))
+        return NotImplemented
+
+    def __rtruediv__(self,x):
+        if isinstance(x,(Real,np.ndarray)):
+            div_real = x / self.real
+            return self._node(div_real,(self,-div_real / self.real))
+        return NotImplemented
+
+    def __pow__(self,x):
+        if isinstance(x,Var):
+            pow_real = self.real ** x.real
+            return self._node(pow_real,(self,x.real * pow_real / self.real),(x,pow_real * np.log(self.real)))
+        if isinstance(x,(Real,np.ndarray)):
+            pow_real = self.real ** x
+            return self._node(pow_real,(self,x * self.real ** (x-1)))
+        return NotImplemented
+
+    def __rpow__(self,x):
+        if isinstance(x,(Real,np.ndarray)):
+            pow_real = x ** self.real
+            return self._node(pow_real,(self,pow_real * np.log(x)))
+        return NotImplemented
+
+    ############################
+    # special functions
+    ############################
+    def sin(self):
+        return self._node(np.sin(self.real),(self,np.cos(self.real)))
+
+    def cos(self):
+        return self._node(np.cos(self.real),(self,-np.sin(self.real)))
+
+    def sqrt(self):
+        sqrt_real = np.sqrt(self.real)
+        return self._node(sqrt_real,(self,1 / (2 * sqrt_real)))
+
+    def exp(self):
+        exp_real = np.exp(self.real)
+        return self._node(exp_real,(self,exp_real))
+
+    def log(self):
+        return self._node(np.log(self.real),(self,1 / self.real))
+
+    def gamma(self):
+        gamma_real = scipy.special.gamma(self.real)
+        return self._node(gamma_real,(self,gamma_real * scipy.special.digamma(self.real)))
+
+    def lgamma(self):
+        return self._node(scipy.special.gammaln(self.real),(self,scipy.special.digamma(self.real)))
+
+    def log1p(self):
+        return self._node(np.log1p(self.real),(self,1 / (1 + self.real)))
+
+    def expm1(self):
+        expm1_real = np.expm1(self.real)
+        return self._node(expm1_real,(self,expm1_real + 1))
+
+    def tanh(self):
+        tanh_real = np.tanh(self.real)
+        return self._node(tanh_real,(self,1 - tanh_real**2))
+
+    def erf(self):
+        return self._node(scipy.special.erf(self.real),(self,2 / np.sqrt(np.pi) * np.exp(-self.real**2)))
+
+    def log_ndtr(self):
+        log_ndtr_real = scipy.special.log_ndtr(self.real)
+        return self._node(log_ndtr_real,(self,np.exp(-self.real**2/2 - log_ndtr_real) / np.sqrt(2 * np.pi)))
+
+    def atan(self):
+        return self._node(np.arctan(self.real),(self,1 / (1 + self.real**2)))
+
+    def digamma(self):
+        return self._node(scipy.special.digamma(self.real),(self,scipy.special.polygamma(1,self.real)))
+
+    def polygamma(self,n):
+        return self._node(scipy.special.polygamma(n,self.real),(self,scipy.special.polygamma(n+1,self.real)))
+
+    def logsumexp(self,axis=None):
+        """log(sum(exp)) of the elements, computed without overflow"""
+        lse = scipy.special.logsumexp(self.real,axis=axis,keepdims=True)
+        weight = np.exp(self.real - lse) # softmax, d lse / d real
+        if axis is None:
+            partial = lambda g: g * weight
+        else:
+            partial = lambda g: np.expand_dims(g,axis) * weight
+        real = np.squeeze(lse,axis=axis)
+        if np.ndim(real) == 0:
+            real = float(real)
+        return self._node(real,(self,partial))
+
+    def betaln(self,b):
+        """Log of the Beta function B(self,b), value and both partials from one digamma pass"""
+        b_real = _real(b)
+        psi_ab = scipy.special.digamma(self.real + b_real)
+        parents = ((self,scipy.special.digamma(self.real) - psi_ab),)
+        if isinstance(b,Var):
+            parents += ((b,scipy.special.digamma(b_real) - psi_ab),)
+        return self._node(scipy.special.betaln(self.real,b_real),*parents)
+
+
+def _real(x):
+    """Value of a Var, plain numbers are returned unchanged"""
+    return x.real if isinstance(x,Var) else x
+
+
+def _unbroadcast(g,shape):
+    """Sum an adjoint back down to the shape of the operand it flows into"""
+    if np.shape(g) == shape:
+        return g
+    g = np.sum(g,axis=tuple(range(np.ndim(g) - len(shape))))
+    keep = tuple(i for i, n in enumerate(shape) if n == 1 and np.shape(g)[i] != 1)
+    if keep:
+        g = np.sum(g,axis=keep,keepdims=True)
+    return float(g) if shape == () else g
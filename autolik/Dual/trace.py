@@ -0,0 +1,436 @@
+from numbers import Real
+import numpy as np
+from autolik._lazy import scipy
+from autolik.Dual.benchmark import Dual
+from autolik.Dual.reverse import _unbroadcast
+
+class Trace(Dual):
+    """Autolik tracing type
+
+    A ``Trace`` records the operation that produced it instead of a
+    derivative. Tracing a function once on ``Trace`` arguments builds the
+    expression DAG of its result: identical operations on identical operands
+    are shared (common-subexpression elimination) and chains of constant
+    factors or offsets are folded into one node. ``real`` holds the value
+    computed during the trace, so comparisons and parameter checks behave as
+    on the traced point.
+
+    Example:
+
+    >>> from autolik.Dual.trace import Trace, _Graph
+    >>> graph = _Graph()
+    >>> x, y = graph.input(1.), graph.input(2.)
+    >>> z = x * (-x**2 - y**2).exp()
+    >>> len(graph.nodes)
+
+    """
+    __slots__ = ('op','args','graph','index')
+
+    def __init__(self, real=0., op='input', args=(), graph=None) -> None:
+        self.real = real
+        self.op = op
+        self.args = args
+        self.graph = graph
+        self.index = len(graph.nodes)
+
+    def _node(self,op,real,*args):
+        return self.graph.node(op,real,*args)
+
+    def __len__(self):
+        return len(self.real)
+
+    @property
+    def shape(self):
+        return np.shape(self.real)
+
+    def sum(self,axis=None):
+        """Sum the elements of an array-valued trace"""
+        real = np.sum(self.real,axis=axis)
+        return self._node('sum',float(real) if np.ndim(real) == 0 else real,self,axis)
+
+    ############################
+    # basic comparison operators
+    ############################
+    def __lt__(self,x):
+        return self.real < _real(x)
+
+    def __gt__(self,x):
+        return self.real > _real(x)
+
+    def __le__(self,x):
+        return self.real <= _real(x)
+
+    def __ge__(self,x):
+        return self.real >= _real(x)
+
+    ############################
+    # basic numeric operators
+    ############################
+    def __neg__(self):
+        if self.op == 'neg':
+            return self.args[0]
+        if self.op == 'mul' and _scalar(self.args[1]): # -(y*c) = y*(-c)
+            return self.args[0] * -self.args[1]
+        return self._node('neg',-self.real,self)
+
+    def __add__(self,x):
+        if isinstance(x,Trace):
+            return self._node('add',self.real + x.real,*sorted((self,x),key=_order))
+        if isinstance(x,(Real,np.ndarray)):
+            if _scalar(x) and x == 0:
+                return self
+            if self.op == 'add' and _scalar(x) and _scalar(self.args[1]): # (y+c1)+c2 = y+(c1+c2)
+                return self.args[0] + (self.args[1] + x)
+            return self._node('add',self.real + x,self,x)
+        return NotImplemented
+
+    def __radd__(self,x):
+        return self.__add__(x)
+
+    def __sub__(self,x):
+        if isinstance(x,Trace):
+            return self._node('sub',self.real - x.real,self,x)
+        if isinstance(x,(Real,np.ndarray)):
+            if _scalar(x):
+                return self + -x
+            return self._node('sub',self.real - x,self,x)
+        return NotImplemented
+
+    def __rsub__(self,x):
+        if isinstance(x,(Real,np.ndarray)):
+            if _scalar(x) and x == 0:
+                return -self
+            return self._node('sub',x - self.real,x,self)
+        return NotImplemented
+
+    def __mul__(self,x):
+        if isinstance(x,Trace):
+            return self._node('mul',self.real * x.real,*sorted((self,x),key=_order))
+        if isinstance(x,(Real,np.ndarray)):
+            if _scalar(x) and x == 1:
+                return self
+            if self.op == 'mul' and _scalar(x) and _scalar(self.args[1]): # (y*c1)*c2 = y*(c1*c2)
+                return self.args[0] * (self.args[1] * x)
+            return self._node('mul',self.real * x,self,x)
+        return NotImplemented
+
+    def __rmul__(self,x):
+        return self.__mul__(x)
+
+    def __truediv__(self,x):
+        if isinstance(x,Trace):
+            return self._node('div',self.real / x.real,self,x)
+        if isinstance(x,(Real,np.ndarray)):
+            if _scalar(x):
+                return self * (1 / x)
+            return self._node('div',self.real / x,self,x)
+        return NotImplemented
+
+    def __rtruediv__(self,x):
+        if isinstance(x,(Real,np.ndarray)):
+            return self._node('div',x / self.real,x,self)
+        return NotImplemented
+
+    def __pow__(self,x):
+        if isinstance(x,Trace):
+            return self._node('pow',self.real ** x.real,self,x)
+        if isinstance(x,(Real,np.ndarray)):
+            if _scalar(x) and x == 1:
+                return self
+            return self._node('pow',self.real ** x,self,x)
+        return NotImplemented
+
+    def __rpow__(self,x):
+        if isinstance(x,(Real,np.ndarray)):
+            return self._node('pow',x ** self.real,x,self)
+        return NotImplemented
+
+    ############################
+    # special functions
+    ############################
+    def sin(self):
+        return self._node('sin',np.sin(self.real),self)
+
+    def cos(self):
+        return self._node('cos',np.cos(self.real),self)
+
+    def sqrt(self):
+        return self._node('sqrt',np.sqrt(self.real),self)
+
+    def exp(self):
+        return self._node('exp',np.exp(self.real),self)
+
+    def log(self):
+        return self._node('log',np.log(self.real),self)
+
+    def gamma(self):
+        return self._node('gamma',scipy.special.gamma(self.real),self)
+
+    def lgamma(self):
+        return self._node('lgamma',scipy.special.gammaln(self.real),self)
+
+    def log1p(self):
+        return self._node('log1p',np.log1p(self.real),self)
+
+    def expm1(self):
+        return self._node('expm1',np.expm1(self.real),self)
+
+    def tanh(self):
+        return self._node('tanh',np.tanh(self.real),self)
+
+    def erf(self):
+        return self._node('erf',scipy.special.erf(self.real),self)
+
+    def log_ndtr(self):
+        return self._node('log_ndtr',scipy.special.log_ndtr(self.real),self)
+
+    def atan(self):
+        return self._node('atan',np.arctan(self.real),self)
+
+    def digamma(self):
+        return self.polygamma(0)
+
+    def polygamma(self,n):
+        return self._node('polygamma',scipy.special.polygamma(n,self.real),self,n)
+
+    def logsumexp(self,axis=None):
+        """log(sum(exp)) of the elements, computed without overflow"""
+        real = scipy.special.logsumexp(self.real,axis=axis)
+        return self._node('logsumexp',float(real) if np.ndim(real) == 0 else real,self,axis)
+
+    def betaln(self,b):
+        """Log of the Beta function B(self,b)"""
+        if not isinstance(b,(Trace,Real,np.ndarray)):
+            return NotImplemented
+        return self._node('betaln',scipy.special.betaln(self.real,_real(b)),self,b)
+
+
+def _real(x):
+    """Value of a Trace, plain numbers are returned unchanged"""
+    return x.real if isinstance(x,Trace) else x
+
+def _scalar(x):
+    """True for a plain number, the only constants folded at trace time"""
+    return isinstance(x,Real) and not isinstance(x,Trace)
+
+def _order(x:Trace):
+    """Canonical operand order of commutative operations, x+y and y+x share a node"""
+    return x.index
+
+
+class _Graph:
+    """Expression DAG of one traced evaluation
+
+    ``node`` returns the existing node when the same operation was already
+    applied to the same operands, so every subexpression is computed once
+    """
+    def __init__(self) -> None:
+        self.nodes = []
+        self.inputs = []
+        self._memo = {}
+        self._consts = [] # keeps the array constants alive, their ids key the memo
+
+    def input(self,real):
+        x = Trace(real,'input',(len(self.inputs),),self)
+        self.nodes.append(x)
+        self.inputs.append(x)
+        return x
+
+    def node(self,op,real,*args):
+        key = (op,) + tuple(self._key(a) for a in args)
+        if key in self._memo:
+            return self._memo[key]
+        x = Trace(real,op,args,self)
+        self.nodes.append(x)
+        self._memo[key] = x
+        return x
+
+    def _key(self,x):
+        if isinstance(x,Trace):
+            return ('node',x.index)
+        if isinstance(x,np.ndarray):
+            self._consts.append(x)
+            return ('array',id(x))
+        return ('const',type(x).__name__,x)
+
+
+############################
+# code generation
+############################
+# value of each operation, {0} {1} are the operands
+_VALUE = {
+    'add': '{0} + {1}', 'sub': '{0} - {1}', 'mul': '{0} * {1}', 'div': '{0} / {1}',
+    'pow': '{0} ** {1}', 'neg': '-{0}',
+    'sin': 'np.sin({0})', 'cos': 'np.cos({0})', 'sqrt': 'np.sqrt({0})', 'exp': 'np.exp({0})',
+    'log': 'np.log({0})', 'gamma': 'sp.gamma({0})', 'lgamma': 'sp.gammaln({0})',
+    'log1p': 'np.log1p({0})', 'expm1': 'np.expm1({0})', 'tanh': 'np.tanh({0})', 'erf': 'sp.erf({0})',
+    'log_ndtr': 'sp.log_ndtr({0})', 'atan': 'np.arctan({0})',
+    'polygamma': 'sp.polygamma({1}, {0})', 'sum': 'np.sum({0}, axis={1})',
+    'logsumexp': 'sp.logsumexp({0}, axis={1})', 'betaln': 'sp.betaln({0}, {1})',
+    'log_gammainc': 'inc._log_p({0}, {1})', 'log_gammaincc': 'inc._log_q({0}, {1})',
+    'log_betainc': 'inc._log_i({0}, {1}, {2})', 'log_betaincc': 'inc._log_ic({0}, {1}, {2})',
+}
+
+# contribution of the adjoint g of the result v to the adjoint of each operand
+_ADJOINT = {
+    'add': ('{g}', '{g}'),
+    'sub': ('{g}', '-{g}'),
+    'mul': ('{g} * {1}', '{g} * {0}'),
+    'div': ('{g} / {1}', '-{g} * {v} / {1}'),
+    'pow': ('{g} * {1} * {0} ** ({1} - 1)', '{g} * {v} * np.log({0})'),
+    'neg': ('-{g}',),
+    'sin': ('{g} * np.cos({0})',),
+    'cos': ('-{g} * np.sin({0})',),
+    'sqrt': ('{g} / (2 * {v})',),
+    'exp': ('{g} * {v}',),
+    'log': ('{g} / {0}',),
+    'gamma': ('{g} * {v} * sp.digamma({0})',),
+    'lgamma': ('{g} * sp.digamma({0})',),
+    'log1p': ('{g} / (1 + {0})',),
+    'expm1': ('{g} * ({v} + 1)',),
+    'tanh': ('{g} * (1 - {v} ** 2)',),
+    'erf': ('{g} * 1.1283791670955126 * np.exp(-{0} ** 2)',),
+    'log_ndtr': ('{g} * np.exp(-{0} ** 2 / 2 - {v}) / 2.5066282746310002',),
+    'atan': ('{g} / (1 + {0} ** 2)',),
+    'polygamma': ('{g} * sp.polygamma({1} + 1, {0})',),
+    'betaln': ('{g} * (sp.digamma({0}) - sp.digamma({0} + {1}))', '{g} * (sp.digamma({1}) - sp.digamma({0} + {1}))'),
+    # incomplete gamma and beta: shapes by central differences, the bound in closed form
+    'log_gammainc': ('{g} * inc._shape(inc._log_p, ({0}, {1}), 0)', '{g} * inc._bound_gamma({0}, {1}, {v}, 1)'),
+    'log_gammaincc': ('{g} * inc._shape(inc._log_q, ({0}, {1}), 0)', '{g} * inc._bound_gamma({0}, {1}, {v}, -1)'),
+    'log_betainc': ('{g} * inc._shape(inc._log_i, ({0}, {1}, {2}), 0)', '{g} * inc._shape(inc._log_i, ({0}, {1}, {2}), 1)',
+                    '{g} * inc._bound_beta({0}, {1}, {2}, {v}, 1)'),
+    'log_betaincc': ('{g} * inc._shape(inc._log_ic, ({0}, {1}, {2}), 0)', '{g} * inc._shape(inc._log_ic, ({0}, {1}, {2}), 1)',
+                     '{g} * inc._bound_beta({0}, {1}, {2}, {v}, -1)'),
+}
+
+_INCOMPLETE = ('log_gammainc','log_gammaincc','log_betainc','log_betaincc')
+
+def _reduction_adjoint(x:Trace,arg:Trace,g,v):
+    """Adjoint of the operand of a sum or logsumexp, broadcast back to its shape"""
+    axis = x.args[1]
+    if axis is not None:
+        g, v = f'np.expand_dims({g}, {axis!r})', f'np.expand_dims({v}, {axis!r})'
+    if x.op == 'sum':
+        return f'np.broadcast_to({g}, {np.shape(arg.real)!r})'
+    return f'{g} * np.exp({{0}} - {v})'
+
+
+def _emit(graph:_Graph,out:Trace):
+    """Python source of the value function and of the value-and-gradient function
+
+    only the nodes the result depends on are emitted, in trace order for the
+    value and in reverse order for the adjoints. Array constants are passed
+    in through the namespace, scalars are written as literals
+    """
+    live = {out.index}
+    for x in reversed(graph.nodes):
+        if x.index in live:
+            live.update(a.index for a in x.args if isinstance(a,Trace))
+    nodes = [x for x in graph.nodes if x.index in live and x.op != 'input']
+    namespace = {'np': np, 'sp': scipy.special, '_unbroadcast': _unbroadcast}
+    if any(x.op in _INCOMPLETE for x in nodes):
+        from autolik.Dual import incomplete # imported here, incomplete itself imports Trace
+        namespace['inc'] = incomplete
+
+    def name(x):
+        if isinstance(x,Trace):
+            return f'x{x.args[0]}' if x.op == 'input' else f'v{x.index}'
+        if isinstance(x,(int,float)) and np.isfinite(x) or x is None or isinstance(x,tuple):
+            return f'({x!r})' if isinstance(x,Real) and x < 0 else repr(x)
+        c = f'c{len(namespace)}' # arrays, numpy scalars, inf and nan
+        namespace[c] = x
+        return c
+
+    args = ', '.join(f'x{i}' for i in range(len(graph.inputs)))
+    body = [f'    {name(x)} = {_VALUE[x.op].format(*map(name,x.args))}' for x in nodes]
+    value = '\n'.join([f'def value({args}):', *body, f'    return {name(out)}'])
+
+    grads = {out.index: '1.'}
+    lines = []
+    for x in reversed(nodes):
+        g = grads.get(x.index)
+        if g is None:
+            continue
+        operands = list(map(name,x.args))
+        for i, arg in enumerate(x.args):
+            if not isinstance(arg,Trace):
+                continue
+            if x.op in ('sum','logsumexp'):
+                rule = _reduction_adjoint(x,arg,g,name(x))
+            elif x.op == 'pow' and i == 0 and _scalar(x.args[1]): # constant exponent, c-1 folded
+                c = x.args[1]
+                rule = f'{g} * 2 * {{0}}' if c == 2 else f'{g} * {name(c)} * {{0}} ** {name(c - 1)}'
+            else:
+                rule = _ADJOINT[x.op][i].replace('{g}',g).replace('{v}',name(x))
+            contrib = rule.format(*operands)
+            if contrib.startswith(('1. * ','-1. * ')): # adjoint of the result
+                contrib = contrib.replace('1. * ','',1)
+            if np.broadcast_shapes(np.shape(x.real),np.shape(arg.real)) != np.shape(arg.real):
+                contrib = f'_unbroadcast({contrib}, {np.shape(arg.real)!r})'
+            a = f'g{arg.index}'
+            lines.append(f'    {a} = {contrib}' if arg.index not in grads else f'    {a} = {a} + {contrib}')
+            grads[arg.index] = a
+    gradient = ', '.join(grads.get(x.index,'0.') for x in graph.inputs)
+    value_and_grad = '\n'.join([f'def value_and_grad({args}):', *body, *lines,
+                                f'    return {name(out)}, ({gradient},)'])
+    return value + '\n\n' + value_and_grad + '\n', namespace
+
+
+class Compiled:
+    """A function traced once and replayed as generated NumPy code
+
+    The first call with plain numbers traces ``f`` at that point and generates
+    two flat functions, the value and the value with its reverse-mode gradient,
+    reused by every later call. Calls with any autolik differentiable type
+    (``grad``, ``hessian``, ...) go to ``f`` itself.
+
+    The trace records operations, not Python control flow: branches and
+    parameter checks taken on the parameters are fixed at the traced point,
+    and the shapes of the data are those of the first call.
+    """
+    def __init__(self, f, n_args) -> None:
+        self.f = f
+        self.n_args = n_args
+        self.source = None
+        self._value = None
+        self._value_and_grad = None
+
+    def _trace(self,params):
+        graph = _Graph()
+        out = self.f(*(graph.input(float(p)) for p in params))
+        if not isinstance(out,Trace): # f does not depend on its arguments
+            out = float(out)
+            self._value = lambda *theta: out
+            self._value_and_grad = lambda *theta: (out, (0.,) * self.n_args)
+            return
+        if np.ndim(out.real) != 0:
+            raise ValueError("compile needs a scalar-valued function")
+        self.source, namespace = _emit(graph,out)
+        exec(compile(self.source,f'<autolik.compile {getattr(self.f,"__name__","f")}>','exec'),namespace)
+        self._value, self._value_and_grad = namespace['value'], namespace['value_and_grad']
+
+    def _ready(self,params):
+        if len(params) != self.n_args:
+            raise TypeError(f"compiled function takes {self.n_args} arguments, {len(params)} given")
+        if self._value is None:
+            self._trace(params)
+
+    def __call__(self,*params):
+        if any(isinstance(p,Dual) for p in params):
+            return self.f(*params)
+        self._ready(params)
+        return float(self._value(*params))
+
+    def value(self,*params):
+        """Value at the given point"""
+        return self(*params)
+
+    def grad(self,*params):
+        """Gradient at the given point, as a list in argument order"""
+        return self.value_and_grad(*params)[1]
+
+    def value_and_grad(self,*params):
+        """Value and gradient from one pass of the generated code"""
+        self._ready(params)
+        value, gradient = self._value_and_grad(*params)
+        return float(value), [float(g) for g in gradient]
@@ -1,4 +1,50 @@
-from autolik.autodiff import grad, F, gradient
+import os as _os
 from autolik.Dual.benchmark import *
-from autolik.likelihood.loglik import *
-from autolik.distributions.univariate import *
\ No newline at end of file
+from autolik.Dual.benchmark import __all__ as _EAGER
+
+# public names and the module defining them, imported at first access
+_LAZY = {
+    **dict.fromkeys(['grad', 'F', 'gradient', 'value_and_grad', 'rgrad', 'rgradient', 'hessian',
+                     'batch_F', 'batch_gradient', 'compile'], 'autolik.autodiff'),
+    'll': 'autolik.likelihood.loglik',
+    'll_score': 'autolik.likelihood.score',
+    'll_value': 'autolik.likelihood.score',
+    'Likelihood': 'autolik.likelihood.model',
+    'ParallelLikelihood': 'autolik.likelihood.parallel',
+    'll_stream': 'autolik.likelihood.stream',
+    'chunked': 'autolik.likelihood.stream',
+    'Mixture': 'autolik.likelihood.mixture',
+    'Regression': 'autolik.likelihood.regression',
+    **dict.fromkeys(['pdf', 'logpdf', 'logcdf', 'logsf'], 'autolik.distributions.univariate'),
+    **dict.fromkeys(['log_gammainc', 'log_gammaincc', 'log_betainc', 'log_betaincc'], 'autolik.Dual.incomplete'),
+    'll_censored': 'autolik.likelihood.censored',
+    'll_truncated': 'autolik.likelihood.censored',
+    **dict.fromkeys(['scores', 'opg', 'sandwich'], 'autolik.likelihood.information'),
+    'mle': 'autolik.optim',
+    'multistart': 'autolik.optim',
+    'profile': 'autolik.profiling',
+}
+
+_SUBMODULES = ['autodiff', 'distributions', 'likelihood', 'optim', 'profiling']
+
+__all__ = [*_EAGER, *_LAZY]
+
+
+def __getattr__(name):
+    """Import the module of a public name, or a subpackage, on first access"""
+    import importlib
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name]),name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f'autolik.{name}')
+    else:
+        raise AttributeError(f"module 'autolik' has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(__all__) | set(_SUBMODULES) | {'Dual'})
+
+
+if _os.environ.get('AUTOLIK_PROFILE','').strip() not in ('','0'):
+    from autolik import profiling
@@ -0,0 +1,15 @@
+import importlib
+
+class _LazyScipy:
+    """Stand-in for the scipy package inside autolik
+
+    ``scipy.special`` is imported at its first use rather than with autolik,
+    the module is then stored on the instance so later lookups are plain
+    attribute reads
+    """
+    def __getattr__(self,name):
+        module = importlib.import_module(f'scipy.{name}')
+        setattr(self,name,module)
+        return module
+
+scipy = _LazyScipy()
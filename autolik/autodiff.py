@@ -1,33 +1,60 @@
 from typing import Callable
-from autolik.Dual.benchmark import Dual
+import functools
+import numpy as np
+from autolik.Dual.benchmark import Dual, DualArray, _real
+from autolik.Dual.reverse import Var
+from autolik.Dual.hyperdual import HyperDual
+from autolik.Dual.trace import Compiled
 
 def _F(f:Callable,at):
-    """Compute the value of a Dual-type function at specific points"""
+    """Compute the value of a Dual-type function at specific points
+
+    ``f`` is evaluated once, the value is repeated once per argument as the
+    result has always been laid out
+    """
     X = tuple(Dual(real) for real in at)
 
-    result = []
+    value = _real(f(*X))
 
-    for _ in X:
-        result.append(f(*X).real)
-    
-    return result
+    return [value for _ in X]
 
 def F(f:Callable):
     """Construct a function for Dual-type function computation"""
     return lambda x: _F(f,at=x)
 
-def _gradient(f:Callable,at):
-    """Compute the gradient of a provided function at specific points (hidden)"""
-    X = tuple(Dual(real) for real in at)
+def _indices(wrt,n):
+    """Argument indices of ``wrt`` as non-negative ints, negative ones counted from the end (hidden)"""
+    indices = []
+    for i in wrt:
+        if not -n <= i < n:
+            raise IndexError(f"wrt index {i} out of range for {n} arguments")
+        indices.append(i % n)
+    if len(set(indices)) < len(indices):
+        raise ValueError(f"wrt {list(wrt)} lists an argument twice")
+    return indices
+
+def _value_and_gradient(f:Callable,at,wrt=None):
+    """Compute the value and the gradient of a function at a specific point (hidden)
+
+    every argument is seeded with its own unit tangent vector, so the value
+    and all the partial derivatives come out of a single evaluation of ``f``.
+    With ``wrt`` only those argument indices are seeded, the others enter as
+    constants and the gradient lists the requested partials in ``wrt`` order,
+    negative indices count from the last argument
+    """
+    wrt = range(len(at)) if wrt is None else _indices(wrt,len(at))
+    seeds = dict(zip(wrt,np.eye(len(wrt))))
+    X = tuple(Dual(real,seeds.get(i,0.)) for i, real in enumerate(at))
 
-    result = []
+    y = f(*X)
+    if not isinstance(y,Dual): # f does not depend on its arguments
+        return float(y), [0. for _ in wrt]
 
-    for dual in X:
-        dual.eps = 1.
-        result.append(f(*X).eps)
-        dual.eps = 0.
-    
-    return result
+    return float(y.real), [float(eps) for eps in np.broadcast_to(y.eps,(len(wrt),))]
+
+def _gradient(f:Callable,at):
+    """Compute the gradient of a provided function at specific points (hidden)"""
+    return _value_and_gradient(f,at)[1]
 
 def grad(f:Callable):
     """Construct a gradient function
@@ -45,6 +72,45 @@ def grad(f:Callable):
     """
     return lambda x: _gradient(f,x)
 
+def value_and_grad(f:Callable,wrt=None,cache=None):
+    """Construct a function returning the value and the gradient together
+
+    the value and the partial derivatives come out of the same single dual
+    evaluation of ``f``. ``wrt`` (an argument index or a list of them)
+    restricts the differentiation to those arguments, the others are held
+    fixed, e.g. the parameters of interest of a profile likelihood. The
+    gradient lists the partials in ``wrt`` order, negative indices count
+    from the last argument and an index out of range or given twice raises.
+
+    ``cache=n`` keeps the results of the ``n`` most recently evaluated points
+    in an LRU cache keyed on the parameter vector, so a line search asking
+    again for the same point costs nothing. ``cache_info()`` and
+    ``cache_clear()`` of the returned function report on and empty it.
+
+    Example:
+
+    >>> import autolik
+    >>> y = [0.0,1.5,0.5,-1.,0.8,-2.4]
+    >>> vg = autolik.value_and_grad(lambda mu,sigma: autolik.ll.normal(y,mu,sigma),cache=128)
+    >>> vg([0.,1.])
+    >>> autolik.value_and_grad(lambda mu,sigma: autolik.ll.normal(y,mu,sigma),wrt=1)([0.,1.])
+
+    """
+    wrt = None if wrt is None else tuple(np.atleast_1d(wrt).tolist())
+    if cache is None:
+        return lambda x: _value_and_gradient(f,x,wrt)
+
+    @functools.lru_cache(maxsize=cache)
+    def cached(at):
+        value, gradient = _value_and_gradient(f,at,wrt)
+        return value, tuple(gradient)
+
+    def vg(x):
+        value, gradient = cached(tuple(float(real) for real in x))
+        return value, list(gradient)
+    vg.cache_info, vg.cache_clear = cached.cache_info, cached.cache_clear
+    return vg
+
 def gradient(f:Callable,at):
     """Compute the gradient of a provided function at specific points
     
@@ -64,27 +130,220 @@ def gradient(f:Callable,at):
 
     return result
 
+def _batch_value_and_gradient(f:Callable,at):
+    """Compute the values and gradients of a function at many points in one pass (hidden)
 
+    parameter j enters ``f`` once, as a ``DualArray`` holding its values at
+    every point in an (n_points,1) column with tangent e_j. The trailing axis
+    lets it broadcast against data, so reductions over the last axis (as in
+    ``ll``) stay per point.
+    """
+    n, p = at.shape
+    seeds = np.eye(p).reshape(p,p,1,1)
+    X = tuple(DualArray(at[:,[j]],seeds[j]) for j in range(p))
+
+    y = f(*X)
+    if not isinstance(y,Dual): # f does not depend on its arguments
+        return np.broadcast_to(np.asarray(y,dtype=float),(n,)).copy(), np.zeros((n,p))
+
+    real = np.reshape(y.real,-1)
+    eps = np.reshape(np.broadcast_to(y.eps,(p,) + np.shape(y.real)),(p,-1))
+    return np.broadcast_to(real,(n,)).copy(), np.broadcast_to(eps.T,(n,p)).copy()
+
+def _batches(f:Callable,at,chunksize):
+    """Run the batched evaluation over row chunks of the points (hidden)"""
+    at = np.asarray(at,dtype=float)
+    at = at.reshape(len(at),-1)
+    chunksize = chunksize or len(at)
+    parts = [_batch_value_and_gradient(f,at[i:i+chunksize]) for i in range(0,len(at),chunksize)]
+    return np.concatenate([v for v, _ in parts]), np.concatenate([g for _, g in parts])
+
+def batch_F(f:Callable,at,chunksize=None):
+    """Compute the values of a function at many points in one vectorized pass
+
+    ``at`` is an (n_points, n_params) array, the result an (n_points,) array.
+    ``f`` is called once (per ``chunksize`` rows) with every argument holding
+    all its values down an (n_points,1) column, so it must be written with
+    elementwise operations and reduce data over the last axis only, as every
+    ``ll`` function does.
 
+    Example:
 
+    >>> import autolik
+    >>> import numpy as np
+    >>> y = np.random.normal(-1,2,100)
+    >>> Mu, Sigma = np.meshgrid(np.linspace(-2,2,50),np.linspace(1,6,50))
+    >>> at = np.column_stack([Mu.ravel(),Sigma.ravel()])
+    >>> loglik = autolik.batch_F(lambda mu,sigma: autolik.ll.normal(y,mu,sigma),at)
 
+    """
+    return _batches(f,at,chunksize)[0]
 
+def batch_gradient(f:Callable,at,chunksize=None):
+    """Compute the gradients of a function at many points in one vectorized pass
 
-# TODO: fix the hessian computation
-def _hessian(f:Callable,at):
-    X = tuple(Dual(real) for real in at)
+    same interface as ``batch_F``, the result is an (n_points, n_params)
+    array of gradients
 
-    result = [[0 for _ in at] for _ in at]
+    Example:
+
+    >>> import autolik
+    >>> import numpy as np
+    >>> f = lambda x,y: x * (-x**2 - y**2).exp()
+    >>> at = np.random.uniform(-2,2,(10**5,2))
+    >>> G = autolik.batch_gradient(f,at)
+
+    """
+    return _batches(f,at,chunksize)[1]
+
+def _rgradient(f:Callable,at):
+    """Compute the gradient by reverse mode at a specific point (hidden)
+
+    records ``f`` on a tape of ``Var`` once and back-propagates once
+    """
+    tape = []
+    X = tuple(Var(float(real),tape) for real in at)
+
+    y = f(*X)
+    if not isinstance(y,Var): # f does not depend on its arguments
+        return [0. for _ in at]
+    y.backward()
+
+    return [float(np.sum(x.adj)) for x in X]
+
+def rgrad(f:Callable):
+    """Construct a reverse-mode gradient function
+
+    same interface as ``grad``, the gradient is obtained from one taped
+    evaluation of ``f`` and one backward sweep, whatever the number of
+    arguments, which suits scalar log-likelihoods of many parameters
+
+    Example:
+
+    >>> import autolik
+    >>> y = [0.0,1.5,0.5,-1.,0.8,-2.4]
+    >>> g = autolik.rgrad(lambda mu,sigma: autolik.ll.normal(y,mu,sigma))
+    >>> g([0.,1.])
+
+    """
+    return lambda x: _rgradient(f,x)
+
+def rgradient(f:Callable,at):
+    """Compute the reverse-mode gradient of a provided function at specific points
+
+    same interface as ``gradient``
+    """
+    result = []
+    for xs in at:
+        result.append(_rgradient(f,xs))
 
-    for i, dual0 in enumerate(X):
-        for j, dual1 in enumerate(X):
-            dual0.eps, dual1.eps = 1., 1.
-            result[i][j] = f(*X).eps
-            dual0.eps, dual1.eps = 0., 0.
-    
     return result
 
 
+
+
+
+
+
+def _value_gradient_hessian(f:Callable,at):
+    """Compute the value, gradient and Hessian of a function at a specific point (hidden)
+
+    every argument is seeded with a unit gradient and a zero Hessian, the
+    single hyper-dual evaluation of ``f`` carries the value, the gradient and
+    every entry of the Hessian
+    """
+    p = len(at)
+    seeds = np.eye(p)
+    X = tuple(HyperDual(float(real),seed,np.zeros((p,p))) for real, seed in zip(at,seeds))
+
+    y = f(*X)
+    if not isinstance(y,HyperDual): # f does not depend on its arguments
+        return float(y), [0. for _ in at], [[0. for _ in at] for _ in at]
+
+    return (float(y.real), [float(eps) for eps in np.broadcast_to(y.eps,(p,))],
+            np.broadcast_to(y.eps2,(p,p)).astype(float).tolist())
+
+def _values_and_scores(f:Callable,at):
+    """Compute the per-observation values and gradients of an array-valued function (hidden)
+
+    ``f`` returns one contribution per observation (last axis), the single
+    dual evaluation gives them all with their (n,p) matrix of gradients
+    """
+    p = len(at)
+    X = tuple(Dual(real,seed) for real, seed in zip(at,np.eye(p)))
+
+    y = f(*X)
+    values = np.asarray(_real(y),dtype=float)
+    if not isinstance(y,Dual): # f does not depend on its arguments
+        return values, np.zeros(values.shape + (p,))
+
+    return values, np.moveaxis(np.broadcast_to(y.eps,(p,) + values.shape),0,-1).copy()
+
+def _values_scores_hessian(f:Callable,at):
+    """Compute the per-observation values and gradients and the Hessian of their sum (hidden)
+
+    one hyper-dual evaluation of the array-valued ``f``
+    """
+    p = len(at)
+    X = tuple(HyperDual(float(real),seed,np.zeros((p,p))) for real, seed in zip(at,np.eye(p)))
+
+    y = f(*X)
+    values = np.asarray(_real(y),dtype=float)
+    if not isinstance(y,HyperDual): # f does not depend on its arguments
+        return values, np.zeros(values.shape + (p,)), np.zeros((p,p))
+
+    eps = np.broadcast_to(y.eps,(p,) + values.shape)
+    eps2 = np.broadcast_to(y.eps2,(p,p) + values.shape)
+    return values, np.moveaxis(eps,0,-1).copy(), eps2.reshape(p,p,-1).sum(axis=-1)
+
+def _hessian(f:Callable,at):
+    """Compute the Hessian of a provided function at a specific point (hidden)"""
+    return _value_gradient_hessian(f,at)[2]
+
+def hessian(f:Callable):
+    """Construct a Hessian function
+
+    same interface as ``grad``, the whole (p x p) Hessian comes out of one
+    hyper-dual evaluation of ``f`` rather than p² nested dual evaluations
+
+    Example:
+
+    >>> import autolik
+    >>> y = [0.0,1.5,0.5,-1.,0.8,-2.4]
+    >>> H = autolik.hessian(lambda mu,sigma: autolik.ll.normal(y,mu,sigma))
+    >>> H([0.,1.])
+
+    """
+    return lambda x: _hessian(f,x)
+
+def compile(f:Callable,n_args) -> Compiled:
+    """Trace a function once and replay it as generated NumPy code
+
+    ``f`` of ``n_args`` scalar parameters is traced at the first call on
+    ``Trace`` arguments into an expression DAG, with common subexpressions
+    shared, constant factors folded and every data-only subexpression (log y,
+    y², ...) computed once at the trace. The DAG is turned into two flat
+    Python/NumPy functions, the value and the value with its reverse-mode
+    gradient, cached in the returned object and reused by every later call.
+
+    The result is called like ``f`` for the value and has ``grad`` and
+    ``value_and_grad`` methods, so it can be handed to ``mle`` directly.
+    Branches and parameter checks on the parameters are only evaluated at
+    the traced point, and the data keep the shapes of the first call.
+
+    Example:
+
+    >>> import autolik
+    >>> import numpy as np
+    >>> y = np.random.gamma(2.,1.5,10**5)
+    >>> L = autolik.compile(lambda alpha,beta: autolik.ll.gamma(y,alpha,beta),2)
+    >>> L(2.,1.5), L.value_and_grad(2.,1.5)
+    >>> print(L.source)
+
+    """
+    return Compiled(f,n_args)
+
+
 # depreciated #
 # def _rawf(f:Callable,wrt:Tuple,at):
 #     at_len = len(at)
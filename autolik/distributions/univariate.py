@@ -1,10 +1,18 @@
-from numbers import Real
 from autolik.Dual.benchmark import *
-import scipy.special
+from autolik.Dual.benchmark import _real
+from autolik.Dual.incomplete import log_gammainc, log_gammaincc, log_betainc, log_betaincc
+import numpy as np
 import math
 
 class pdf:
-    r"""Univariate distributions probability density functions library"""
+    r"""Univariate distributions probability density functions library
+
+    ``x`` may be a single observation or a numpy array of observations, arrays
+    are evaluated elementwise in one pass (``Dual`` parameters then give back a
+    ``DualArray``). The formulas only use operators and the generic ``exp``,
+    ``log``, ``sqrt`` and ``gamma``, so parameters may be plain numbers or any
+    autolik differentiable type
+    """
     def beta(x,beta,gam):
         r"""Beta distribution :math:`X \sim beta(\beta,\gamma)`
         
@@ -13,16 +21,9 @@ class pdf:
 
         with positive shape parameters :math:`\beta > 0`, :math:`\gamma > 0`
         """
-        assert 0 < x < 1, "'x' out of range"
-        assert beta > 0 and gam > 0, "Wrong paramterization"
-        if isinstance(beta,Dual) and isinstance(gam,Dual):
-            return (beta+gam).gamma() * x ** (beta-1) * (1-x) ** (gam - 1)/(beta.gamma()*gam.gamma())
-        elif isinstance(beta,Real) and isinstance(gam,Dual):
-            return (gam+beta).gamma() * x ** (beta-1) * (1-x) ** (gam - 1)/(scipy.special.gamma(beta)*gam.gamma())
-        elif isinstance(beta,Dual) and isinstance(gam,Real):
-            return (beta+gam).gamma() * x ** (beta-1) * (1-x) ** (gam - 1)/(beta.gamma()*scipy.special.gamma(gam))
-        elif isinstance(beta,Real) and isinstance(gam,Real):
-            return scipy.special.gamma(beta+gam) * x ** (beta-1) * (1-x) ** (gam - 1)/(scipy.special.gamma(beta)*scipy.special.gamma(gam))
+        assert np.all((0 < x) & (x < 1)), "'x' out of range"
+        assert np.all((beta > 0) & (gam > 0)), "Wrong paramterization"
+        return gamma(beta+gam) * x**(beta-1) * (1-x)**(gam-1) / (gamma(beta)*gamma(gam))
 
     def cauchy(x,a,alpha):
         r"""Cauchy distribution :math:`X \sim Cauchy(a,\alpha)`
@@ -32,7 +33,7 @@ class pdf:
 
         with location parameter :math:`a \in (-\infty,\infty)`, and positive scale parameter :math:`\alpha > 0`
         """
-        assert alpha > 0, "Wrong paramterization"
+        assert np.all(alpha > 0), "Wrong paramterization"
         denom = alpha * math.pi * (1 + ((x - a)/alpha) ** 2)
         return 1 / denom
 
@@ -44,12 +45,9 @@ class pdf:
 
         with :math:`n` degrees of freedom 
         """
-        assert x > 0, "'x' out of range"
-        assert n > 0, "Wrong paramterization"
-        if isinstance(n,Dual):
-            return 1 / (2**(n/2-1) * (n/2).gamma()) * x**(n-1) * math.exp(-x**2/2)
-        elif isinstance(n,Real):
-            return 1 / (2**(n/2-1) * scipy.special.gamma(n/2)) * x**(n-1) * math.exp(-x**2/2)
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all(n > 0), "Wrong paramterization"
+        return 1 / (2**(n/2-1) * gamma(n/2)) * x**(n-1) * exp(-x**2/2)
 
     def chisqr(x,n):
         r"""Chi-square distribution :math:`X \sim \chi^2(n)`
@@ -59,12 +57,9 @@ class pdf:
 
         with :math:`n` degrees of freedom 
         """
-        assert x > 0, "'x' out of range"
-        assert n > 0, "Wrong paramterization"
-        if isinstance(n,Dual):
-            return x**(n/2-1) * math.exp(-x/2) / (2**(n/2) * (n/2).gamma())
-        elif isinstance(n,Real):
-            return x**(n/2-1) * math.exp(-x/2) / (2**(n/2) * scipy.special.gamma(n/2))
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all(n > 0), "Wrong paramterization"
+        return x**(n/2-1) * exp(-x/2) / (2**(n/2) * gamma(n/2))
 
     def exponential(x,lam):
         r"""Exponential distribution :math:`X \sim exponential(\alpha)`
@@ -74,12 +69,9 @@ class pdf:
 
         with rate :math:`\lambda`
         """
-        assert x > 0, "'x' out of range"
-        assert lam > 0, "Wrong paramterization"
-        if isinstance(lam,Dual):
-            return lam * (-x * lam).exp()
-        elif isinstance(lam,Real):
-            return lam * math.exp(-x * lam)
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all(lam > 0), "Wrong paramterization"
+        return lam * exp(-x * lam)
 
     def gamma(x,alpha,beta):
         r"""Gamma distribution :math:`X \sim gamma(\alpha,\beta)`
@@ -89,16 +81,9 @@ class pdf:
 
         with positive scale parameter :math:`\alpha > 0` and positive shape parameter :math:`\beta > 0`
         """
-        assert x > 0, "'x' out of range"
-        assert alpha > 0 and beta > 0, "Wrong paramterization"
-        if isinstance(alpha,Dual) and isinstance(beta,Dual):
-            return x**(beta-1) * (-x/alpha).exp() / (alpha**beta * beta.gamma())
-        elif isinstance(alpha,Real) and isinstance(beta,Dual):
-            return x**(beta-1) * math.exp(-x/alpha) / (alpha**beta * beta.gamma())
-        elif isinstance(alpha,Dual) and isinstance(beta,Real):
-            return x**(beta-1) * (-x/alpha).exp() / (alpha**beta * scipy.special.gamma(beta))
-        elif isinstance(alpha,Real) and isinstance(beta,Real):
-            return x**(beta-1) * math.exp(-x/alpha) / (alpha**beta * scipy.special.gamma(beta))
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((alpha > 0) & (beta > 0)), "Wrong paramterization"
+        return x**(beta-1) * exp(-x/alpha) / (alpha**beta * gamma(beta))
 
     def Ggamma(x,alpha,beta,gam):
         r"""Generalized Gamma distribution :math:`X \sim \text{generalized gamma}(\alpha,\beta,\gamma)`
@@ -108,26 +93,11 @@ class pdf:
 
         with positive scale parameter :math:`\alpha > 0` and positive shape parameter :math:`\beta > 0` and :math:`\gamma > 0`
         """
-        assert x > 0, "'x' out of range"
-        assert alpha > 0 and beta > 0 and gam > 0, "Wrong paramterization"
-        if isinstance(beta,Dual):
-            if isinstance(alpha,Real) and isinstance(gam,Real):
-                numer = gam * x**(gam*beta-1) * math.exp(-(x/alpha)**gam)
-                denom = alpha**(gam*beta) * beta.gamma()
-                return numer / denom
-            else:
-                numer = gam * x**(gam*beta-1) * (-(x/alpha)**gam).exp()
-                denom = alpha**(gam*beta) * beta.gamma()
-                return numer / denom
-        elif isinstance(beta,Real):
-            if isinstance(alpha,Real) and isinstance(gam,Real):
-                numer = gam * x**(gam*beta-1) * math.exp(-(x/alpha)**gam)
-                denom = alpha**(gam*beta) * scipy.special.gamma(beta)
-                return numer / denom
-            else:
-                numer = gam * x**(gam*beta-1) * (-(x/alpha)**gam).exp()
-                denom = alpha**(gam*beta) * scipy.special.gamma(beta)
-                return numer / denom
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((alpha > 0) & (beta > 0) & (gam > 0)), "Wrong paramterization"
+        numer = gam * x**(gam*beta-1) * exp(-(x/alpha)**gam)
+        denom = alpha**(gam*beta) * gamma(beta)
+        return numer / denom
 
     def Gpareto(x,delta,kappa,gam):
         r"""Generalized Pareto distribution :math:`X \sim \text{generalized pareto}(\delta,\kappa,\gamma)`
@@ -137,12 +107,9 @@ class pdf:
 
         with shape parameters :math:`\delta > 0`, :math:`\kappa \ge -\delta \gamma` and :math:`\gamma \ge 0`
         """
-        assert x > 0, "'x' out of range"
-        assert delta > 0 and gam >= 0 and kappa >= -delta*gam, "Wrong paramterization"
-        if isinstance(gam,Dual):
-            return (gam+kappa/(x+delta)) * (1+x/delta)**(-kappa) * (-gam*x).exp()
-        else:
-            return (gam+kappa/(x+delta)) * (1+x/delta)**(-kappa) * math.exp(-gam*x)
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((delta > 0) & (gam >= 0) & (kappa >= -delta*gam)), "Wrong paramterization"
+        return (gam+kappa/(x+delta)) * (1+x/delta)**(-kappa) * exp(-gam*x)
 
     def invgaussian(x,lam,mu):
         r"""Inverse Gaussian distribution :math:`X \sim \text{inverse Gaussian}(\lambda, \mu)`
@@ -152,15 +119,9 @@ class pdf:
 
         with parameters :math:`\lambda > 0` and :math:`\mu > 0`
         """
-        assert x > 0, "'x' out of range"
-        assert lam > 0 and mu > 0, "Wrong paramterization"
-        if isinstance(lam,Dual):
-            return (lam / 2 * math.pi * x**3).sqrt() * (-lam*(x-mu)**2/2*x*mu**2).exp()
-        elif isinstance(lam,Real):
-            if isinstance(mu,Dual):
-                return math.sqrt(lam / 2 * math.pi * x**3) * (-lam*(x-mu)**2/2*x*mu**2).exp()
-            elif isinstance(mu,Real):
-                return math.sqrt(lam / 2 * math.pi * x**3) * math.exp(-lam*(x-mu)**2/2*x*mu**2)
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((lam > 0) & (mu > 0)), "Wrong paramterization"
+        return sqrt(lam/(2*math.pi*x**3)) * exp(-lam*(x-mu)**2/(2*x*mu**2))
 
     def invgamma(x,alpha,beta):
         r"""Inverted Gamma distribution :math:`X \sim \text{inverted gamma}(\alpha,\beta)`
@@ -170,15 +131,8 @@ class pdf:
 
         with positive shape parameter :math:`\alpha > 0` and positive scale parameter :math:`\beta > 0`
         """
-        assert x > 0, "'x' out of range"
-        if isinstance(alpha,Dual) and isinstance(beta,Dual):
-            return x**(-(alpha+1)) * (-1/(beta*x)).exp() / (alpha.gamma() * beta**alpha)
-        elif isinstance(alpha,Real) and isinstance(beta,Dual):
-            return x**(-(alpha+1)) * (-1/(beta*x)).exp() / (scipy.special.gamma(alpha) * beta**alpha)
-        elif isinstance(alpha,Dual) and isinstance(beta,Real):
-            return x**(-(alpha+1)) * math.exp(-1/(beta*x)) / (alpha.gamma() * beta**alpha)
-        elif isinstance(alpha,Real) and isinstance(beta,Real):
-            return x**(-(alpha+1)) * math.exp(-1/(beta*x)) / (scipy.special.gamma(alpha) * beta**alpha)            
+        assert np.all(x > 0), "'x' out of range"
+        return x**(-(alpha+1)) * exp(-1/(beta*x)) / (gamma(alpha) * beta**alpha)
 
     def laplace(x,alpha1,alpha2):
         r"""Laplace distribution :math:`X \sim Laplace(\alpha_1,\alpha_2)`
@@ -188,17 +142,9 @@ class pdf:
 
         with positive scale parameters :math:`\alpha_1 > 0` and :math:`\alpha_2 > 0`
         """
-        assert alpha1 > 0 and alpha2 > 0, "Wrong paramterization"
-        if x < 0:
-            if isinstance(alpha1,Dual):
-                return (1/(alpha1+alpha2)) * (x/alpha1).exp()
-            elif isinstance(alpha1,Real):
-                return (1/(alpha1+alpha2)) * math.exp(x/alpha1)
-        else:
-            if isinstance(alpha2,Dual):
-                return (1/(alpha1+alpha2)) * (-x/alpha2).exp()
-            elif isinstance(alpha2,Real):
-                return (1/(alpha1+alpha2)) * math.exp(-x/alpha2)
+        assert np.all((alpha1 > 0) & (alpha2 > 0)), "Wrong paramterization"
+        z = np.minimum(x,0)/alpha1 - np.maximum(x,0)/alpha2 # x/alpha1 for x < 0, -x/alpha2 otherwise
+        return (1/(alpha1+alpha2)) * exp(z)
 
     def loggamma(x,alpha,beta):
         r"""Log-Gamma distribution :math:`X \sim log-gamma(\alpha,\beta)`
@@ -208,14 +154,7 @@ class pdf:
 
         with positive scale parameter :math:`\alpha > 0` and positive shape parameter :math:`\beta > 0`
         """
-        if isinstance(alpha,Dual) and isinstance(beta,Dual):
-            return (beta*x).exp() * (-math.exp(x)/alpha).exp() / (alpha**beta * beta.gamma())
-        elif isinstance(alpha,Real) and isinstance(beta,Dual):
-            return (beta*x).exp() * math.exp(-math.exp(x)/alpha) / (alpha**beta * beta.gamma())
-        elif isinstance(alpha,Dual) and isinstance(beta,Real):
-            return math.exp(beta*x) * (-math.exp(x)/alpha).exp() / (alpha**beta * scipy.special.gamma(beta))
-        elif isinstance(alpha,Real) and isinstance(beta,Real):
-            return math.exp(beta*x) * math.exp(-math.exp(x)/alpha) / (alpha**beta * scipy.special.gamma(beta))
+        return exp(beta*x) * exp(-exp(x)/alpha) / (alpha**beta * gamma(beta))
 
     def loglogistic(x,lam,kappa):
         r"""Log-Logistic distribution :math:`X \sim loglogistic(\lambda,\kappa)`
@@ -225,8 +164,8 @@ class pdf:
 
         with positive scale parameter :math:`\lambda > 0` and positive shape parameter :math:`\kappa > 0`
         """
-        assert x > 0, "'x' out of range"
-        assert lam > 0 and kappa > 0, "Wrong paramterization"
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((lam > 0) & (kappa > 0)), "Wrong paramterization"
         return lam*kappa*(lam*x)**(kappa-1) / (1+(lam*x)**kappa)**2
 
     def lognormal(x,alpha,beta):
@@ -237,15 +176,9 @@ class pdf:
 
         with positive parameters :math:`\alpha > 0`, :math:`\beta > 0`
         """
-        assert x > 0, "'x' out of range"
-        assert alpha > 0 and beta > 0, "Wrong paramterization"
-        if isinstance(alpha,Dual):
-            return 1/(x*beta*math.sqrt(2*math.pi)) * (-1/2*((x/alpha).log()/beta)**2).exp()
-        elif isinstance(alpha,Real):
-            if isinstance(beta,Dual):
-                return 1/(x*beta*math.sqrt(2*math.pi)) * (-1/2*(math.log(x/alpha)/beta)**2).exp()
-            elif isinstance(beta,Real):
-                return 1/(x*beta*math.sqrt(2*math.pi)) * math.exp(-1/2*(math.log(x/alpha)/beta)**2)
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((alpha > 0) & (beta > 0)), "Wrong paramterization"
+        return 1/(x*beta*math.sqrt(2*math.pi)) * exp(-1/2*(log(x/alpha)/beta)**2)
 
     def logistic(x,lam,kappa):
         r"""Logistic distribution :math:`X \sim logistic(\lambda,\kappa)`
@@ -255,10 +188,7 @@ class pdf:
 
         with positive scale parameter :math:`\lambda > 0` and positive shape parameter :math:`\kappa > 0`
         """
-        if isinstance(kappa,Dual):
-            return lam**kappa * kappa * (kappa*x).exp() / (1+(lam*math.exp(x))**kappa)**2
-        elif isinstance(kappa,Real):
-            return lam**kappa * kappa * math.exp(kappa*x) / (1+(lam*math.exp(x))**kappa)**2
+        return lam**kappa * kappa * exp(kappa*x) / (1+(lam*exp(x))**kappa)**2
 
     def logistic_exp(x,alpha,beta):
         r"""Logistic-Exponential distribution :math:`X \sim log-exponential(\alpha,\beta)`
@@ -268,12 +198,9 @@ class pdf:
 
         with positive scale parameter :math:`\alpha > 0` and positive shape parameter :math:`\beta > 0`
         """
-        assert x > 0, "'x' out of range"
-        assert alpha > 0 and beta > 0, "Wrong paramterization"
-        if isinstance(alpha,Dual):
-            return alpha*beta*((alpha*x).exp()-1)**(beta-1)*(alpha*x).exp() / (1+((alpha*x).exp()-1)**beta)**2
-        elif isinstance(alpha,Real):
-            return alpha*beta*(math.exp(alpha*x)-1)**(beta-1)*math.exp(alpha*x) / (1+(math.exp(alpha*x)-1)**beta)**2
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((alpha > 0) & (beta > 0)), "Wrong paramterization"
+        return alpha*beta*(exp(alpha*x)-1)**(beta-1)*exp(alpha*x) / (1+(exp(alpha*x)-1)**beta)**2
 
     def lomax(x,lam,kappa):
         r"""Lomax distribution :math:`X \sim lomax(\lambda,\kappa)`
@@ -283,8 +210,8 @@ class pdf:
 
         with positive scale parameter :math:`\lambda > 0` and positive shape parameter :math:`\kappa > 0`
         """
-        assert x > 0, "'x' out of range"
-        assert lam > 0 and kappa > 0, "Wrong paramterization"
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((lam > 0) & (kappa > 0)), "Wrong paramterization"
         return lam*kappa / (1+lam*x)**(kappa+1)
 
     def makeham(x,delta,kappa,gam):
@@ -295,15 +222,9 @@ class pdf:
 
         with positive parameters :math:`\delta > 0` :math:`\kappa > 0` :math:`\gamma > 0`
         """
-        assert x > 0, "'x' out of range"
-        assert delta > 0 and kappa > 1 and gam > 0, "Wrong paramterization"
-        if isinstance(kappa,Real):
-            if isinstance(delta,Real) and isinstance(gam,Real):
-                return (gam+delta*kappa**x) * math.exp(-gam*x-delta*(kappa**x-1)/math.log(kappa))
-            else:
-                return (gam+delta*kappa**x) * (-gam*x-delta*(kappa**x-1)/math.log(kappa)).exp()
-        elif isinstance(kappa,Dual):
-            return (gam+delta*kappa**x) * (-gam*x-delta*(kappa**x-1)/kappa.log()).exp()
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((delta > 0) & (kappa > 1) & (gam > 0)), "Wrong paramterization"
+        return (gam+delta*kappa**x) * exp(-gam*x-delta*(kappa**x-1)/log(kappa))
 
     def minimax(x,beta,gam):
         r"""Minimax distribution :math:`X \sim minimax(\beta,\gamma)`
@@ -313,8 +234,8 @@ class pdf:
 
         with positive shape parameters :math:`\beta > 0` and :math:`\gamma > 0`
         """
-        assert 0 < x < 1, "'x' out of range"
-        assert beta > 0 and gam > 0, "Wrong paramterization"
+        assert np.all((0 < x) & (x < 1)), "'x' out of range"
+        assert np.all((beta > 0) & (gam > 0)), "Wrong paramterization"
         return beta * gam * x**(beta-1) * (1-x**beta)**(gam-1)
 
     def muth(x,kappa):
@@ -325,12 +246,9 @@ class pdf:
 
         with parameter :math:`0 < \kappa \le 1`
         """
-        assert x > 0, "'x' out of range"
-        assert 0 < kappa <= 1, "Wrong paramterization"
-        if isinstance(kappa,Dual):
-            return ((kappa*x).exp() - kappa) * (-(kappa*x).exp()/kappa + kappa*x + 1/kappa).exp()
-        elif isinstance(kappa,Real):
-            return (math.exp(kappa*x) - kappa) * math.exp(-math.exp(kappa*x)/kappa + kappa*x + 1/kappa)
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((0 < kappa) & (kappa <= 1)), "Wrong paramterization"
+        return (exp(kappa*x) - kappa) * exp(-exp(kappa*x)/kappa + kappa*x + 1/kappa)
 
     def normal(x,mu,sigma):
         r"""Gaussian distribution :math:`X \sim N(\mu,\sigma^2)`
@@ -340,11 +258,8 @@ class pdf:
 
         with mean :math:`-\infty < \mu < \infty` and variance :math:`\sigma^2`
         """
-        assert sigma > 0, "Wrong paramterization"
-        if isinstance(mu,Real) and isinstance(sigma,Real):
-            return 1/(math.sqrt(2*math.pi)*sigma) * math.exp(-(x-mu)**2/(2*sigma**2))
-        elif isinstance(mu,Dual) or isinstance(sigma,Dual):
-            return 1/(math.sqrt(2*math.pi)*sigma) * (-(x-mu)**2/(2*sigma**2)).exp()
+        assert np.all(sigma > 0), "Wrong paramterization"
+        return 1/(math.sqrt(2*math.pi)*sigma) * exp(-(x-mu)**2/(2*sigma**2))
 
     def pareto(x,lam,kappa):
         r"""Pareto distribution :math:`X \sim pareto(\lambda,\kappa)`
@@ -354,8 +269,8 @@ class pdf:
 
         with positive parameters :math:`\lambda > 0` and :math:`\kappa > 0`
         """
-        assert x > lam, "'x' out of range"
-        assert lam > 0 and kappa > 0, "Wrong paramterization"
+        assert np.all(x > lam), "'x' out of range"
+        assert np.all((lam > 0) & (kappa > 0)), "Wrong paramterization"
         return kappa * lam**kappa / x**(kappa+1)
 
     def power(x,alpha,beta):
@@ -366,8 +281,8 @@ class pdf:
 
         with positive scale parameter :math:`\alpha > 0` and positive shape parameter :math:`\beta > 0`
         """
-        assert 0 < x < alpha, "'x' out of range"
-        assert alpha > 0 and beta > 0, "Wrong paramterization"
+        assert np.all((0 < x) & (x < alpha)), "'x' out of range"
+        assert np.all((alpha > 0) & (beta > 0)), "Wrong paramterization"
         return beta * x**(beta-1) / alpha**beta
     
     def std_power(x,beta):
@@ -378,8 +293,8 @@ class pdf:
 
         with positive shape parameter :math:`\beta > 0`
         """
-        assert 0 < x < 1, "'x' out of range"
-        assert beta > 0, "Wrong paramterization"
+        assert np.all((0 < x) & (x < 1)), "'x' out of range"
+        assert np.all(beta > 0), "Wrong paramterization"
         return beta * x**(beta-1)
 
     def rayleigh(x,alpha):
@@ -390,12 +305,9 @@ class pdf:
 
         with positive parameter :math:`\alpha > 0`
         """
-        assert x > 0, "'x' out of range"
-        assert alpha > 0, "Wrong paramterization"
-        if isinstance(alpha,Dual):
-            return 2*x * (-x**2/alpha).exp() / alpha
-        elif isinstance(alpha,Real):
-            return 2*x * math.exp(-x**2/alpha) / alpha
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all(alpha > 0), "Wrong paramterization"
+        return 2*x * exp(-x**2/alpha) / alpha
 
     def std_wald(x,lam):
         r"""Standard Wald distribution :math:`X \sim standard-Wald(\lambda)`
@@ -405,12 +317,9 @@ class pdf:
 
         with parameter :math:`\lambda > 0`
         """
-        assert x > 0, "'x' out of range"
-        assert lam > 0, "Wrong paramterization"
-        if isinstance(lam, Dual):
-            return (lam/(2*math.pi*x**3)).sqrt() * (-lam*(x-1)**2/(2*x)).exp()
-        elif isinstance(lam,Real):
-            return math.sqrt(lam/(2*math.pi*x**3)) * math.exp(-lam*(x-1)**2/(2*x))
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all(lam > 0), "Wrong paramterization"
+        return sqrt(lam/(2*math.pi*x**3)) * exp(-lam*(x-1)**2/(2*x))
 
     def Tdist(x,n):
         r"""Student t distribution :math:`X \sim t(n)`
@@ -420,11 +329,8 @@ class pdf:
 
         with :math:`n` degrees of freedom
         """
-        assert n > 0, "Wrong paramterization"
-        if isinstance(n,Dual):
-            return ((n+1)/2).gamma() * (1+x**2/n)**(-(n+1)/2) / ((n*math.pi).sqrt() * (n/2).gamma())
-        elif isinstance(n,Real):
-            return scipy.special.gamma((n+1)/2) * (1+x**2/n)**(-(n+1)/2) / (math.sqrt(n*math.pi) * scipy.special.gamma(n/2))
+        assert np.all(n > 0), "Wrong paramterization"
+        return gamma((n+1)/2) * (1+x**2/n)**(-(n+1)/2) / (sqrt(n*math.pi) * gamma(n/2))
 
     def uniform(x,a,b):
         r"""Uniform distribution :math:`X \sim U(a,b)`
@@ -434,7 +340,9 @@ class pdf:
 
         with range parameters :math:`-\infty < a < b < \infty`
         """
-        assert a < x < b, "'x' out of range"
+        assert np.all((a < x) & (x < b)), "'x' out of range"
+        if isinstance(x,np.ndarray):
+            return 1 / (b - a) * np.ones(x.shape)
         return 1 / (b - a)
 
     def weibull(x,alpha,beta):
@@ -445,26 +353,848 @@ class pdf:
 
         with positive scale parameter :math:`\alpha > 0` and positive shape parameter :math:`\beta > 0`
         """
-        assert x > 0, "'x' out of range"
-        assert alpha > 0 and beta > 0, "Wrong paramterization"
-        if isinstance(alpha,Dual) or isinstance(beta,Dual):
-            return beta/alpha * x**(beta-1) * (-(1/alpha) * x**beta).exp()
-        elif isinstance(alpha,Real) and isinstance(beta,Real):
-            return beta/alpha * x**(beta-1) * math.exp(-(1/alpha) * x**beta)
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((alpha > 0) & (beta > 0)), "Wrong paramterization"
+        return beta/alpha * x**(beta-1) * exp(-(1/alpha) * x**beta)
 
     ####################################
-    # not supported for Dual computation
+    # standard forms, no parameters
     ####################################
     def std_cauchy(x):
         return 1 / (math.pi * (1+x**2))
 
     def std_normal(x):
-        return math.exp(-x**2/2) / math.sqrt(2*math.pi)
+        return exp(-x**2/2) / math.sqrt(2*math.pi)
 
     def std_uniform(x):
-        assert 0 < x < 1, "'x' out of range"
+        assert np.all((0 < x) & (x < 1)), "'x' out of range"
+        if isinstance(x,np.ndarray):
+            return np.ones(x.shape)
         return 1.
 
+############################
+# log-densities
+############################
+_LOG2 = math.log(2)
+_LOG2PI = math.log(2*math.pi)
+
+class _logparts:
+    r"""Log-densities split into a parameter-only part and a data part
+
+    ``_logparts.<family>(x,*params)`` returns ``(c, k)`` with
+    :math:`\ln f(x) = c(\theta) + k(x,\theta)` and holds the domain checks.
+    It is the one definition of every log-density: ``logpdf`` adds the two
+    parts, ``ll`` evaluates the normalizing constant :math:`c` once and adds
+    it as :math:`n\,c`, so only the kernel runs per observation (``None``
+    when there is no data part)
+    """
+    def beta(x,beta,gam):
+        assert np.all((0 < x) & (x < 1)), "'x' out of range"
+        assert np.all((beta > 0) & (gam > 0)), "Wrong paramterization"
+        return -betaln(beta,gam), (beta-1)*log(x) + (gam-1)*log1p(-x)
+
+    def cauchy(x,a,alpha):
+        assert np.all(alpha > 0), "Wrong paramterization"
+        return -log(alpha*math.pi), -log1p(((x - a)/alpha)**2)
+
+    def chi(x,n):
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all(n > 0), "Wrong paramterization"
+        return -(n/2-1)*_LOG2 - lgamma(n/2), (n-1)*log(x) - x**2/2
+
+    def chisqr(x,n):
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all(n > 0), "Wrong paramterization"
+        return -n/2*_LOG2 - lgamma(n/2), (n/2-1)*log(x) - x/2
+
+    def exponential(x,lam):
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all(lam > 0), "Wrong paramterization"
+        return log(lam), -x * lam
+
+    def gamma(x,alpha,beta):
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((alpha > 0) & (beta > 0)), "Wrong paramterization"
+        return -beta*log(alpha) - lgamma(beta), (beta-1)*log(x) - x/alpha
+
+    def Ggamma(x,alpha,beta,gam):
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((alpha > 0) & (beta > 0) & (gam > 0)), "Wrong paramterization"
+        return log(gam) - gam*beta*log(alpha) - lgamma(beta), (gam*beta-1)*log(x) - (x/alpha)**gam
+
+    def Gpareto(x,delta,kappa,gam):
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((delta > 0) & (gam >= 0) & (kappa >= -delta*gam)), "Wrong paramterization"
+        return 0., log(gam+kappa/(x+delta)) - kappa*log1p(x/delta) - gam*x
+
+    def invgaussian(x,lam,mu):
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((lam > 0) & (mu > 0)), "Wrong paramterization"
+        return (log(lam) - _LOG2PI)/2, -1.5*log(x) - lam/(2*mu**2)*(x-mu)**2/x
+
+    def invgamma(x,alpha,beta):
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((alpha > 0) & (beta > 0)), "Wrong paramterization"
+        return -lgamma(alpha) - alpha*log(beta), -(alpha+1)*log(x) - 1/(beta*x)
+
+    def laplace(x,alpha1,alpha2):
+        assert np.all((alpha1 > 0) & (alpha2 > 0)), "Wrong paramterization"
+        return -log(alpha1+alpha2), np.minimum(x,0)/alpha1 - np.maximum(x,0)/alpha2
+
+    def loggamma(x,alpha,beta):
+        assert np.all((alpha > 0) & (beta > 0)), "Wrong paramterization"
+        return -beta*log(alpha) - lgamma(beta), beta*x - exp(x)/alpha
+
+    def loglogistic(x,lam,kappa):
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((lam > 0) & (kappa > 0)), "Wrong paramterization"
+        return log(lam*kappa) + (kappa-1)*log(lam), (kappa-1)*log(x) - 2*log1p((lam*x)**kappa)
+
+    def lognormal(x,alpha,beta):
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((alpha > 0) & (beta > 0)), "Wrong paramterization"
+        return -log(beta) - _LOG2PI/2, -log(x) - (log(x/alpha)/beta)**2/2
+
+    def logistic(x,lam,kappa):
+        assert np.all((lam > 0) & (kappa > 0)), "Wrong paramterization"
+        return kappa*log(lam) + log(kappa), kappa*x - 2*log1p((lam*exp(x))**kappa)
+
+    def logistic_exp(x,alpha,beta):
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((alpha > 0) & (beta > 0)), "Wrong paramterization"
+        em1 = expm1(alpha*x)
+        return log(alpha*beta), (beta-1)*log(em1) + alpha*x - 2*log1p(em1**beta)
+
+    def lomax(x,lam,kappa):
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((lam > 0) & (kappa > 0)), "Wrong paramterization"
+        return log(lam*kappa), -(kappa+1)*log1p(lam*x)
+
+    def makeham(x,delta,kappa,gam):
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((delta > 0) & (kappa > 1) & (gam > 0)), "Wrong paramterization"
+        kx = kappa**x
+        return 0., log(gam+delta*kx) - gam*x - delta/log(kappa)*(kx-1)
+
+    def minimax(x,beta,gam):
+        assert np.all((0 < x) & (x < 1)), "'x' out of range"
+        assert np.all((beta > 0) & (gam > 0)), "Wrong paramterization"
+        return log(beta*gam), (beta-1)*log(x) + (gam-1)*log1p(-x**beta)
+
+    def muth(x,kappa):
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((0 < kappa) & (kappa <= 1)), "Wrong paramterization"
+        ekx = exp(kappa*x)
+        return 1/kappa, log(ekx - kappa) - ekx/kappa + kappa*x
+
+    def normal(x,mu,sigma):
+        assert np.all(sigma > 0), "Wrong paramterization"
+        return -log(sigma) - _LOG2PI/2, -1/(2*sigma**2)*(x-mu)**2
+
+    def pareto(x,lam,kappa):
+        assert np.all(x > lam), "'x' out of range"
+        assert np.all((lam > 0) & (kappa > 0)), "Wrong paramterization"
+        return log(kappa) + kappa*log(lam), -(kappa+1)*log(x)
+
+    def power(x,alpha,beta):
+        assert np.all((0 < x) & (x < alpha)), "'x' out of range"
+        assert np.all((alpha > 0) & (beta > 0)), "Wrong paramterization"
+        return log(beta) - beta*log(alpha), (beta-1)*log(x)
+
+    def std_power(x,beta):
+        assert np.all((0 < x) & (x < 1)), "'x' out of range"
+        assert np.all(beta > 0), "Wrong paramterization"
+        return log(beta), (beta-1)*log(x)
+
+    def rayleigh(x,alpha):
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all(alpha > 0), "Wrong paramterization"
+        return -log(alpha), log(2*x) - x**2/alpha
+
+    def std_wald(x,lam):
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all(lam > 0), "Wrong paramterization"
+        return (log(lam) - _LOG2PI)/2, -1.5*log(x) - lam/2*(x-1)**2/x
+
+    def Tdist(x,n):
+        assert np.all(n > 0), "Wrong paramterization"
+        return -betaln(0.5,n/2) - log(n)/2, -(n+1)/2*log1p(x**2/n)
+
+    def uniform(x,a,b):
+        assert np.all((a < x) & (x < b)), "'x' out of range"
+        return -log(b - a), None
+
+    def weibull(x,alpha,beta):
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((alpha > 0) & (beta > 0)), "Wrong paramterization"
+        return log(beta/alpha), (beta-1)*log(x) - x**beta/alpha
+
+
+def _joined(x,const,kernel):
+    """c + k, a constant broadcast over the observations when there is no data part"""
+    if kernel is None:
+        return const * np.ones(x.shape) if isinstance(x,np.ndarray) else const
+    return const + kernel
+
+
+class logpdf:
+    r"""Univariate distributions log-density functions library
+
+    Same families, arguments and checks as ``pdf``, written directly in log
+    space with ``log``, ``log1p``, ``lgamma`` and ``betaln`` so that the density itself is
+    never formed: no exp/log round trip per observation and no overflow of
+    :math:`\Gamma` for large parameters or underflow of the density in the
+    tails. Each family is the sum of the two parts of ``_logparts``, the same
+    split ``ll`` sums over a sample
+    """
+    def beta(x,beta,gam):
+        r"""Log-density of :math:`beta(\beta,\gamma)`
+
+        .. math::
+            \ln f(x) = -\ln B(\beta,\gamma) + (\beta-1)\ln x + (\gamma-1)\ln(1-x)
+        """
+        return _joined(x,*_logparts.beta(x,beta,gam))
+
+    def cauchy(x,a,alpha):
+        r"""Log-density of :math:`Cauchy(a,\alpha)`
+
+        .. math::
+            \ln f(x) = -\ln(\alpha\pi) - \ln(1+((x-a)/\alpha)^2)
+        """
+        return _joined(x,*_logparts.cauchy(x,a,alpha))
+
+    def chi(x,n):
+        r"""Log-density of :math:`\chi(n)`
+
+        .. math::
+            \ln f(x) = -(\frac{n}{2}-1)\ln 2 - \ln\Gamma(\frac{n}{2}) + (n-1)\ln x - \frac{x^2}{2}
+        """
+        return _joined(x,*_logparts.chi(x,n))
+
+    def chisqr(x,n):
+        r"""Log-density of :math:`\chi^2(n)`
+
+        .. math::
+            \ln f(x) = (\frac{n}{2}-1)\ln x - \frac{x}{2} - \frac{n}{2}\ln 2 - \ln\Gamma(\frac{n}{2})
+        """
+        return _joined(x,*_logparts.chisqr(x,n))
+
+    def exponential(x,lam):
+        r"""Log-density of :math:`exponential(\lambda)`
+
+        .. math::
+            \ln f(x) = \ln\lambda - \lambda x
+        """
+        return _joined(x,*_logparts.exponential(x,lam))
+
+    def gamma(x,alpha,beta):
+        r"""Log-density of :math:`gamma(\alpha,\beta)`
+
+        .. math::
+            \ln f(x) = (\beta-1)\ln x - \frac{x}{\alpha} - \beta\ln\alpha - \ln\Gamma(\beta)
+        """
+        return _joined(x,*_logparts.gamma(x,alpha,beta))
+
+    def Ggamma(x,alpha,beta,gam):
+        r"""Log-density of :math:`\text{generalized gamma}(\alpha,\beta,\gamma)`
+
+        .. math::
+            \ln f(x) = \ln\gamma + (\gamma\beta-1)\ln x - (x/\alpha)^{\gamma} - \gamma\beta\ln\alpha - \ln\Gamma(\beta)
+        """
+        return _joined(x,*_logparts.Ggamma(x,alpha,beta,gam))
+
+    def Gpareto(x,delta,kappa,gam):
+        r"""Log-density of :math:`\text{generalized pareto}(\delta,\kappa,\gamma)`
+
+        .. math::
+            \ln f(x) = \ln(\gamma + \dfrac{\kappa}{x+\delta}) - \kappa\ln(1+\dfrac{x}{\delta}) - \gamma x
+        """
+        return _joined(x,*_logparts.Gpareto(x,delta,kappa,gam))
+
+    def invgaussian(x,lam,mu):
+        r"""Log-density of :math:`\text{inverse Gaussian}(\lambda,\mu)`
+
+        .. math::
+            \ln f(x) = \frac{1}{2}(\ln\lambda - \ln 2\pi - 3\ln x) - \dfrac{\lambda(x-\mu)^2}{2x\mu^2}
+        """
+        return _joined(x,*_logparts.invgaussian(x,lam,mu))
+
+    def invgamma(x,alpha,beta):
+        r"""Log-density of :math:`\text{inverted gamma}(\alpha,\beta)`
+
+        .. math::
+            \ln f(x) = -(\alpha+1)\ln x - \frac{1}{\beta x} - \ln\Gamma(\alpha) - \alpha\ln\beta
+        """
+        return _joined(x,*_logparts.invgamma(x,alpha,beta))
+
+    def laplace(x,alpha1,alpha2):
+        r"""Log-density of :math:`Laplace(\alpha_1,\alpha_2)`
+
+        .. math::
+            \ln f(x) = -\ln(\alpha_1+\alpha_2) + \begin{cases} x/\alpha_1, x < 0 \\ -x/\alpha_2, x \ge 0 \end{cases}
+        """
+        return _joined(x,*_logparts.laplace(x,alpha1,alpha2))
+
+    def loggamma(x,alpha,beta):
+        r"""Log-density of :math:`log-gamma(\alpha,\beta)`
+
+        .. math::
+            \ln f(x) = \beta x - \frac{e^x}{\alpha} - \beta\ln\alpha - \ln\Gamma(\beta)
+        """
+        return _joined(x,*_logparts.loggamma(x,alpha,beta))
+
+    def loglogistic(x,lam,kappa):
+        r"""Log-density of :math:`loglogistic(\lambda,\kappa)`
+
+        .. math::
+            \ln f(x) = \ln\lambda\kappa + (\kappa-1)\ln\lambda x - 2\ln(1+(\lambda x)^{\kappa})
+        """
+        return _joined(x,*_logparts.loglogistic(x,lam,kappa))
+
+    def lognormal(x,alpha,beta):
+        r"""Log-density of :math:`log-normal(\alpha,\beta)`
+
+        .. math::
+            \ln f(x) = -\ln x\beta - \frac{1}{2}\ln 2\pi - \frac{1}{2}(\ln(x/\alpha)/\beta)^2
+        """
+        return _joined(x,*_logparts.lognormal(x,alpha,beta))
+
+    def logistic(x,lam,kappa):
+        r"""Log-density of :math:`logistic(\lambda,\kappa)`
+
+        .. math::
+            \ln f(x) = \kappa\ln\lambda + \ln\kappa + \kappa x - 2\ln(1+(\lambda e^x)^{\kappa})
+        """
+        return _joined(x,*_logparts.logistic(x,lam,kappa))
+
+    def logistic_exp(x,alpha,beta):
+        r"""Log-density of :math:`log-exponential(\alpha,\beta)`
+
+        .. math::
+            \ln f(x) = \ln\alpha\beta + (\beta-1)\ln(e^{\alpha x}-1) + \alpha x - 2\ln(1+(e^{\alpha x}-1)^{\beta})
+        """
+        return _joined(x,*_logparts.logistic_exp(x,alpha,beta))
+
+    def lomax(x,lam,kappa):
+        r"""Log-density of :math:`lomax(\lambda,\kappa)`
+
+        .. math::
+            \ln f(x) = \ln\lambda\kappa - (\kappa+1)\ln(1+\lambda x)
+        """
+        return _joined(x,*_logparts.lomax(x,lam,kappa))
+
+    def makeham(x,delta,kappa,gam):
+        r"""Log-density of :math:`Makeham(\delta,\kappa,\gamma)`
+
+        .. math::
+            \ln f(x) = \ln(\gamma + \delta\kappa^x) - \gamma x - \delta(\kappa^x-1)/\ln\kappa
+        """
+        return _joined(x,*_logparts.makeham(x,delta,kappa,gam))
+
+    def minimax(x,beta,gam):
+        r"""Log-density of :math:`minimax(\beta,\gamma)`
+
+        .. math::
+            \ln f(x) = \ln\beta\gamma + (\beta-1)\ln x + (\gamma-1)\ln(1-x^{\beta})
+        """
+        return _joined(x,*_logparts.minimax(x,beta,gam))
+
+    def muth(x,kappa):
+        r"""Log-density of :math:`muth(\kappa)`
+
+        .. math::
+            \ln f(x) = \ln(e^{\kappa x}-\kappa) - \frac{e^{\kappa x}}{\kappa} + \kappa x + \frac{1}{\kappa}
+        """
+        return _joined(x,*_logparts.muth(x,kappa))
+
+    def normal(x,mu,sigma):
+        r"""Log-density of :math:`N(\mu,\sigma^2)`
+
+        .. math::
+            \ln f(x) = -\ln\sigma - \frac{1}{2}\ln 2\pi - \frac{(x-\mu)^2}{2\sigma^2}
+        """
+        return _joined(x,*_logparts.normal(x,mu,sigma))
+
+    def pareto(x,lam,kappa):
+        r"""Log-density of :math:`pareto(\lambda,\kappa)`
+
+        .. math::
+            \ln f(x) = \ln\kappa + \kappa\ln\lambda - (\kappa+1)\ln x
+        """
+        return _joined(x,*_logparts.pareto(x,lam,kappa))
+
+    def power(x,alpha,beta):
+        r"""Log-density of :math:`power(\alpha,\beta)`
+
+        .. math::
+            \ln f(x) = \ln\beta + (\beta-1)\ln x - \beta\ln\alpha
+        """
+        return _joined(x,*_logparts.power(x,alpha,beta))
+
+    def std_power(x,beta):
+        r"""Log-density of :math:`power(1,\beta)`
+
+        .. math::
+            \ln f(x) = \ln\beta + (\beta-1)\ln x
+        """
+        return _joined(x,*_logparts.std_power(x,beta))
+
+    def rayleigh(x,alpha):
+        r"""Log-density of :math:`Rayleigh(\alpha)`
+
+        .. math::
+            \ln f(x) = \ln 2x - \frac{x^2}{\alpha} - \ln\alpha
+        """
+        return _joined(x,*_logparts.rayleigh(x,alpha))
+
+    def std_wald(x,lam):
+        r"""Log-density of :math:`standard-Wald(\lambda)`
+
+        .. math::
+            \ln f(x) = \frac{1}{2}(\ln\lambda - \ln 2\pi - 3\ln x) - \frac{\lambda(x-1)^2}{2x}
+        """
+        return _joined(x,*_logparts.std_wald(x,lam))
+
+    def Tdist(x,n):
+        r"""Log-density of :math:`t(n)`
+
+        .. math::
+            \ln f(x) = -\ln B(\frac{1}{2},\frac{n}{2}) - \frac{1}{2}\ln n - \frac{n+1}{2}\ln(1+\frac{x^2}{n})
+        """
+        return _joined(x,*_logparts.Tdist(x,n))
+
+    def uniform(x,a,b):
+        r"""Log-density of :math:`U(a,b)`
+
+        .. math::
+            \ln f(x) = -\ln(b-a)
+        """
+        return _joined(x,*_logparts.uniform(x,a,b))
+
+    def weibull(x,alpha,beta):
+        r"""Log-density of :math:`Weibull(\alpha,\beta)`
+
+        .. math::
+            \ln f(x) = \ln\frac{\beta}{\alpha} + (\beta-1)\ln x - \frac{x^{\beta}}{\alpha}
+        """
+        return _joined(x,*_logparts.weibull(x,alpha,beta))
+    ####################################
+    # standard forms, no parameters
+    ####################################
+    def std_cauchy(x):
+        return -math.log(math.pi) - log1p(x**2)
+
+    def std_normal(x):
+        return -x**2/2 - math.log(2*math.pi)/2
+
+    def std_uniform(x):
+        assert np.all((0 < x) & (x < 1)), "'x' out of range"
+        if isinstance(x,np.ndarray):
+            return np.zeros(x.shape)
+        return 0.
+
+
+############################
+# log-stable building blocks
+############################
+def _mask(condition):
+    """Boolean condition on plain values as 0/1 weights, a float for a single value"""
+    w = np.asarray(condition,dtype=float)
+    return float(w) if w.ndim == 0 else w
+
+def _log1mexp(u):
+    r"""log(1 - e^u) for u <= 0, by expm1 near 0 and log1p further out
+
+    both branches are evaluated at a safe point where they are not selected
+    """
+    w = _mask(_real(u) > -_LOG2)
+    return w * log(-expm1(w*u - (1-w))) + (1-w) * log1p(-exp((1-w)*u - w))
+
+def _softplus(t):
+    """log(1 + e^t) without overflow"""
+    s = _mask(_real(t) > 0)
+    return s*t + log1p(exp(t - 2*s*t))
+
+def _logaddexp(u,v):
+    """log(e^u + e^v) shifted by the larger term"""
+    m = np.maximum(_real(u),_real(v))
+    m = float(m) if np.ndim(m) == 0 else m
+    return m + log(exp(u - m) + exp(v - m))
+
+def _cauchy_tail(u):
+    r"""log S(u) of the standard Cauchy for u >= 0, :math:`S(u) = \frac{2}{\pi}\arctan\frac{1}{\sqrt{1+u^2}+u}`
+
+    with the argument written :math:`\frac{t}{\sqrt{1+t^2}+1}, t = 1/u` beyond 1, where :math:`u^2` may overflow
+    """
+    big = _mask(_real(u) > 1)
+    t = 1/(big*u + (1-big))
+    small = (1-big)*u
+    return log(2*atan(big*t/(sqrt(1 + t**2) + 1) + (1-big)/(sqrt(1 + small**2) + small))) - math.log(math.pi)
+
+
+class logcdf:
+    r"""Univariate distributions log cumulative distribution functions library
+
+    Same families, arguments and checks as ``logpdf``. Every function works
+    on :math:`\ln F` directly, through ``log_ndtr``, the log of the
+    regularized incomplete gamma and beta functions, ``log1p`` and ``expm1``,
+    so it stays finite and accurate far into the lower tail where :math:`F`
+    itself underflows, and takes any autolik differentiable parameters
+    """
+    def beta(x,beta,gam):
+        r""":math:`\ln F(x) = \ln I_x(\beta,\gamma)`"""
+        assert np.all((0 < x) & (x < 1)), "'x' out of range"
+        assert np.all((beta > 0) & (gam > 0)), "Wrong paramterization"
+        return log_betainc(beta,gam,x)
+
+    def cauchy(x,a,alpha):
+        r""":math:`\ln F(x) = \ln(\frac{1}{2} + \frac{1}{\pi}\arctan\frac{x-a}{\alpha})`"""
+        return logsf.cauchy(-x,-a,alpha)
+
+    def chi(x,n):
+        r""":math:`\ln F(x) = \ln P(\frac{n}{2},\frac{x^2}{2})`"""
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all(n > 0), "Wrong paramterization"
+        return log_gammainc(n/2,x**2/2)
+
+    def chisqr(x,n):
+        r""":math:`\ln F(x) = \ln P(\frac{n}{2},\frac{x}{2})`"""
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all(n > 0), "Wrong paramterization"
+        return log_gammainc(n/2,x/2)
+
+    def exponential(x,lam):
+        r""":math:`\ln F(x) = \ln(1 - e^{-\lambda x})`"""
+        return _log1mexp(logsf.exponential(x,lam))
+
+    def gamma(x,alpha,beta):
+        r""":math:`\ln F(x) = \ln P(\beta,\frac{x}{\alpha})`"""
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((alpha > 0) & (beta > 0)), "Wrong paramterization"
+        return log_gammainc(beta,x/alpha)
+
+    def Ggamma(x,alpha,beta,gam):
+        r""":math:`\ln F(x) = \ln P(\beta,(\frac{x}{\alpha})^{\gamma})`"""
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((alpha > 0) & (beta > 0) & (gam > 0)), "Wrong paramterization"
+        return log_gammainc(beta,(x/alpha)**gam)
+
+    def Gpareto(x,delta,kappa,gam):
+        r""":math:`\ln F(x) = \ln(1 - (1+\frac{x}{\delta})^{-\kappa}e^{-\gamma x})`"""
+        return _log1mexp(logsf.Gpareto(x,delta,kappa,gam))
+
+    def invgaussian(x,lam,mu):
+        r""":math:`\ln F(x) = \ln(\Phi(\sqrt{\frac{\lambda}{x}}(\frac{x}{\mu}-1)) + e^{2\lambda/\mu}\Phi(-\sqrt{\frac{\lambda}{x}}(\frac{x}{\mu}+1)))`"""
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((lam > 0) & (mu > 0)), "Wrong paramterization"
+        r = sqrt(lam/x)
+        return _logaddexp(log_ndtr(r*(x/mu - 1)), 2*lam/mu + log_ndtr(-r*(x/mu + 1)))
+
+    def invgamma(x,alpha,beta):
+        r""":math:`\ln F(x) = \ln Q(\alpha,\frac{1}{\beta x})`"""
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((alpha > 0) & (beta > 0)), "Wrong paramterization"
+        return log_gammaincc(alpha,1/(beta*x))
+
+    def laplace(x,alpha1,alpha2):
+        r""":math:`\ln F(x) = \ln\frac{\alpha_1}{\alpha_1+\alpha_2} + \frac{x}{\alpha_1}, x < 0`, :math:`\ln(1 - \frac{\alpha_2}{\alpha_1+\alpha_2}e^{-x/\alpha_2}), x \ge 0`"""
+        assert np.all((alpha1 > 0) & (alpha2 > 0)), "Wrong paramterization"
+        w = _mask(x < 0)
+        lower = log(alpha1) - log(alpha1+alpha2) + np.minimum(x,0)/alpha1
+        upper = log(alpha2) - log(alpha1+alpha2) - np.maximum(x,0)/alpha2
+        return w*lower + (1-w)*_log1mexp(upper)
+
+    def loggamma(x,alpha,beta):
+        r""":math:`\ln F(x) = \ln P(\beta,\frac{e^x}{\alpha})`"""
+        assert np.all((alpha > 0) & (beta > 0)), "Wrong paramterization"
+        return log_gammainc(beta,exp(x)/alpha)
+
+    def loglogistic(x,lam,kappa):
+        r""":math:`\ln F(x) = -\ln(1+(\lambda x)^{-\kappa})`"""
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((lam > 0) & (kappa > 0)), "Wrong paramterization"
+        return -_softplus(-kappa*log(lam*x))
+
+    def lognormal(x,alpha,beta):
+        r""":math:`\ln F(x) = \ln\Phi(\frac{\ln(x/\alpha)}{\beta})`"""
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((alpha > 0) & (beta > 0)), "Wrong paramterization"
+        return log_ndtr(log(x/alpha)/beta)
+
+    def logistic(x,lam,kappa):
+        r""":math:`\ln F(x) = -\ln(1+(\lambda e^x)^{-\kappa})`"""
+        assert np.all((lam > 0) & (kappa > 0)), "Wrong paramterization"
+        return -_softplus(-kappa*(log(lam) + x))
+
+    def logistic_exp(x,alpha,beta):
+        r""":math:`\ln F(x) = -\ln(1+(e^{\alpha x}-1)^{-\beta})`"""
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((alpha > 0) & (beta > 0)), "Wrong paramterization"
+        return -_softplus(-beta*log(expm1(alpha*x)))
+
+    def lomax(x,lam,kappa):
+        r""":math:`\ln F(x) = \ln(1 - (1+\lambda x)^{-\kappa})`"""
+        return _log1mexp(logsf.lomax(x,lam,kappa))
+
+    def makeham(x,delta,kappa,gam):
+        r""":math:`\ln F(x) = \ln(1 - e^{-\gamma x - \delta(\kappa^x-1)/\ln\kappa})`"""
+        return _log1mexp(logsf.makeham(x,delta,kappa,gam))
+
+    def minimax(x,beta,gam):
+        r""":math:`\ln F(x) = \ln(1 - (1-x^{\beta})^{\gamma})`"""
+        return _log1mexp(logsf.minimax(x,beta,gam))
+
+    def muth(x,kappa):
+        r""":math:`\ln F(x) = \ln(1 - e^{\kappa x - (e^{\kappa x}-1)/\kappa})`"""
+        return _log1mexp(logsf.muth(x,kappa))
+
+    def normal(x,mu,sigma):
+        r""":math:`\ln F(x) = \ln\Phi(\frac{x-\mu}{\sigma})`"""
+        assert np.all(sigma > 0), "Wrong paramterization"
+        return log_ndtr((x - mu)/sigma)
+
+    def pareto(x,lam,kappa):
+        r""":math:`\ln F(x) = \ln(1 - (\lambda/x)^{\kappa})`"""
+        return _log1mexp(logsf.pareto(x,lam,kappa))
+
+    def power(x,alpha,beta):
+        r""":math:`\ln F(x) = \beta\ln\frac{x}{\alpha}`"""
+        assert np.all((0 < x) & (x < alpha)), "'x' out of range"
+        assert np.all((alpha > 0) & (beta > 0)), "Wrong paramterization"
+        return beta*(log(x) - log(alpha))
+
+    def std_power(x,beta):
+        r""":math:`\ln F(x) = \beta\ln x`"""
+        assert np.all((0 < x) & (x < 1)), "'x' out of range"
+        assert np.all(beta > 0), "Wrong paramterization"
+        return beta*log(x)
+
+    def rayleigh(x,alpha):
+        r""":math:`\ln F(x) = \ln(1 - e^{-x^2/\alpha})`"""
+        return _log1mexp(logsf.rayleigh(x,alpha))
+
+    def std_wald(x,lam):
+        r"""Inverse Gaussian with :math:`\mu = 1`"""
+        return logcdf.invgaussian(x,lam,1.)
+
+    def Tdist(x,n):
+        r""":math:`\ln F(x) = \ln\frac{1}{2}I_{n/(n+x^2)}(\frac{n}{2},\frac{1}{2}), x < 0`, :math:`\ln(1 - \frac{1}{2}I_{n/(n+x^2)}(\frac{n}{2},\frac{1}{2})), x \ge 0`"""
+        assert np.all(n > 0), "Wrong paramterization"
+        w = _mask(x < 0)
+        tail = log_betainc(n/2,0.5,n/(n + x**2)) - _LOG2
+        return w*tail + (1-w)*_log1mexp(tail)
+
+    def uniform(x,a,b):
+        r""":math:`\ln F(x) = \ln\frac{x-a}{b-a}`"""
+        assert np.all((a < x) & (x < b)), "'x' out of range"
+        return log(x - a) - log(b - a)
+
+    def weibull(x,alpha,beta):
+        r""":math:`\ln F(x) = \ln(1 - e^{-x^{\beta}/\alpha})`"""
+        return _log1mexp(logsf.weibull(x,alpha,beta))
+
+    ####################################
+    # standard forms, no parameters
+    ####################################
+    def std_cauchy(x):
+        return logcdf.cauchy(x,0.,1.)
+
+    def std_normal(x):
+        return log_ndtr(x)
+
+    def std_uniform(x):
+        assert np.all((0 < x) & (x < 1)), "'x' out of range"
+        return np.log(x)
+
+
+class logsf:
+    r"""Univariate distributions log survival functions library
+
+    :math:`\ln S(x) = \ln(1 - F(x))` for the same families, arguments and
+    checks as ``logpdf``, accurate far into the upper tail where :math:`S`
+    underflows; the building block of right-censored likelihoods
+    """
+    def beta(x,beta,gam):
+        r""":math:`\ln S(x) = \ln(1 - I_x(\beta,\gamma))`"""
+        assert np.all((0 < x) & (x < 1)), "'x' out of range"
+        assert np.all((beta > 0) & (gam > 0)), "Wrong paramterization"
+        return log_betaincc(beta,gam,x)
+
+    def cauchy(x,a,alpha):
+        r""":math:`\ln S(x) = \ln(\frac{1}{2} - \frac{1}{\pi}\arctan\frac{x-a}{\alpha})`"""
+        assert np.all(alpha > 0), "Wrong paramterization"
+        z = (x - a)/alpha
+        w = _mask(_real(z) >= 0)
+        tail = _cauchy_tail((2*w - 1)*z)
+        return w*tail + (1-w)*_log1mexp(tail)
+
+    def chi(x,n):
+        r""":math:`\ln S(x) = \ln Q(\frac{n}{2},\frac{x^2}{2})`"""
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all(n > 0), "Wrong paramterization"
+        return log_gammaincc(n/2,x**2/2)
+
+    def chisqr(x,n):
+        r""":math:`\ln S(x) = \ln Q(\frac{n}{2},\frac{x}{2})`"""
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all(n > 0), "Wrong paramterization"
+        return log_gammaincc(n/2,x/2)
+
+    def exponential(x,lam):
+        r""":math:`\ln S(x) = -\lambda x`"""
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all(lam > 0), "Wrong paramterization"
+        return -x * lam
+
+    def gamma(x,alpha,beta):
+        r""":math:`\ln S(x) = \ln Q(\beta,\frac{x}{\alpha})`"""
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((alpha > 0) & (beta > 0)), "Wrong paramterization"
+        return log_gammaincc(beta,x/alpha)
+
+    def Ggamma(x,alpha,beta,gam):
+        r""":math:`\ln S(x) = \ln Q(\beta,(\frac{x}{\alpha})^{\gamma})`"""
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((alpha > 0) & (beta > 0) & (gam > 0)), "Wrong paramterization"
+        return log_gammaincc(beta,(x/alpha)**gam)
+
+    def Gpareto(x,delta,kappa,gam):
+        r""":math:`\ln S(x) = -\kappa\ln(1+\frac{x}{\delta}) - \gamma x`"""
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((delta > 0) & (gam >= 0) & (kappa >= -delta*gam)), "Wrong paramterization"
+        return -kappa*log1p(x/delta) - gam*x
+
+    def invgaussian(x,lam,mu):
+        r""":math:`\ln S(x) = \ln(\Phi(-\sqrt{\frac{\lambda}{x}}(\frac{x}{\mu}-1)) - e^{2\lambda/\mu}\Phi(-\sqrt{\frac{\lambda}{x}}(\frac{x}{\mu}+1)))`"""
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((lam > 0) & (mu > 0)), "Wrong paramterization"
+        r = sqrt(lam/x)
+        upper = log_ndtr(-r*(x/mu - 1))
+        return upper + _log1mexp(2*lam/mu + log_ndtr(-r*(x/mu + 1)) - upper)
+
+    def invgamma(x,alpha,beta):
+        r""":math:`\ln S(x) = \ln P(\alpha,\frac{1}{\beta x})`"""
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((alpha > 0) & (beta > 0)), "Wrong paramterization"
+        return log_gammainc(alpha,1/(beta*x))
+
+    def laplace(x,alpha1,alpha2):
+        r""":math:`\ln S(x) = \ln\frac{\alpha_2}{\alpha_1+\alpha_2} - \frac{x}{\alpha_2}, x \ge 0`, :math:`\ln(1 - \frac{\alpha_1}{\alpha_1+\alpha_2}e^{x/\alpha_1}), x < 0`"""
+        assert np.all((alpha1 > 0) & (alpha2 > 0)), "Wrong paramterization"
+        w = _mask(x < 0)
+        lower = log(alpha1) - log(alpha1+alpha2) + np.minimum(x,0)/alpha1
+        upper = log(alpha2) - log(alpha1+alpha2) - np.maximum(x,0)/alpha2
+        return w*_log1mexp(lower) + (1-w)*upper
+
+    def loggamma(x,alpha,beta):
+        r""":math:`\ln S(x) = \ln Q(\beta,\frac{e^x}{\alpha})`"""
+        assert np.all((alpha > 0) & (beta > 0)), "Wrong paramterization"
+        return log_gammaincc(beta,exp(x)/alpha)
+
+    def loglogistic(x,lam,kappa):
+        r""":math:`\ln S(x) = -\ln(1+(\lambda x)^{\kappa})`"""
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((lam > 0) & (kappa > 0)), "Wrong paramterization"
+        return -_softplus(kappa*log(lam*x))
+
+    def lognormal(x,alpha,beta):
+        r""":math:`\ln S(x) = \ln\Phi(-\frac{\ln(x/\alpha)}{\beta})`"""
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((alpha > 0) & (beta > 0)), "Wrong paramterization"
+        return log_ndtr(-log(x/alpha)/beta)
+
+    def logistic(x,lam,kappa):
+        r""":math:`\ln S(x) = -\ln(1+(\lambda e^x)^{\kappa})`"""
+        assert np.all((lam > 0) & (kappa > 0)), "Wrong paramterization"
+        return -_softplus(kappa*(log(lam) + x))
+
+    def logistic_exp(x,alpha,beta):
+        r""":math:`\ln S(x) = -\ln(1+(e^{\alpha x}-1)^{\beta})`"""
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((alpha > 0) & (beta > 0)), "Wrong paramterization"
+        return -_softplus(beta*log(expm1(alpha*x)))
+
+    def lomax(x,lam,kappa):
+        r""":math:`\ln S(x) = -\kappa\ln(1+\lambda x)`"""
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((lam > 0) & (kappa > 0)), "Wrong paramterization"
+        return -kappa*log1p(lam*x)
+
+    def makeham(x,delta,kappa,gam):
+        r""":math:`\ln S(x) = -\gamma x - \delta(\kappa^x-1)/\ln\kappa`"""
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((delta > 0) & (kappa > 1) & (gam > 0)), "Wrong paramterization"
+        return -gam*x - delta*(kappa**x - 1)/log(kappa)
+
+    def minimax(x,beta,gam):
+        r""":math:`\ln S(x) = \gamma\ln(1-x^{\beta})`"""
+        assert np.all((0 < x) & (x < 1)), "'x' out of range"
+        assert np.all((beta > 0) & (gam > 0)), "Wrong paramterization"
+        return gam*log1p(-x**beta)
+
+    def muth(x,kappa):
+        r""":math:`\ln S(x) = \kappa x - \frac{e^{\kappa x}-1}{\kappa}`"""
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((0 < kappa) & (kappa <= 1)), "Wrong paramterization"
+        return kappa*x - expm1(kappa*x)/kappa
+
+    def normal(x,mu,sigma):
+        r""":math:`\ln S(x) = \ln\Phi(\frac{\mu-x}{\sigma})`"""
+        assert np.all(sigma > 0), "Wrong paramterization"
+        return log_ndtr((mu - x)/sigma)
+
+    def pareto(x,lam,kappa):
+        r""":math:`\ln S(x) = \kappa\ln\frac{\lambda}{x}`"""
+        assert np.all(x > lam), "'x' out of range"
+        assert np.all((lam > 0) & (kappa > 0)), "Wrong paramterization"
+        return kappa*(log(lam) - log(x))
+
+    def power(x,alpha,beta):
+        r""":math:`\ln S(x) = \ln(1 - (\frac{x}{\alpha})^{\beta})`"""
+        return _log1mexp(logcdf.power(x,alpha,beta))
+
+    def std_power(x,beta):
+        r""":math:`\ln S(x) = \ln(1 - x^{\beta})`"""
+        return _log1mexp(logcdf.std_power(x,beta))
+
+    def rayleigh(x,alpha):
+        r""":math:`\ln S(x) = -\frac{x^2}{\alpha}`"""
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all(alpha > 0), "Wrong paramterization"
+        return -x**2/alpha
+
+    def std_wald(x,lam):
+        r"""Inverse Gaussian with :math:`\mu = 1`"""
+        return logsf.invgaussian(x,lam,1.)
+
+    def Tdist(x,n):
+        r""":math:`\ln S(x) = \ln F(-x)`, the distribution is symmetric"""
+        return logcdf.Tdist(-x,n)
+
+    def uniform(x,a,b):
+        r""":math:`\ln S(x) = \ln\frac{b-x}{b-a}`"""
+        assert np.all((a < x) & (x < b)), "'x' out of range"
+        return log(b - x) - log(b - a)
+
+    def weibull(x,alpha,beta):
+        r""":math:`\ln S(x) = -\frac{x^{\beta}}{\alpha}`"""
+        assert np.all(x > 0), "'x' out of range"
+        assert np.all((alpha > 0) & (beta > 0)), "Wrong paramterization"
+        return -x**beta/alpha
+
+    ####################################
+    # standard forms, no parameters
+    ####################################
+    def std_cauchy(x):
+        return logsf.cauchy(x,0.,1.)
+
+    def std_normal(x):
+        return log_ndtr(-x)
+
+    def std_uniform(x):
+        assert np.all((0 < x) & (x < 1)), "'x' out of range"
+        return np.log1p(-x)
+
 # def main():
 #     print(pdf.normal(0,0,1))
 
@@ -0,0 +1,286 @@
+import numpy as np
+from autolik.Dual.benchmark import _real
+from autolik.distributions.univariate import logpdf, logcdf, logsf, _log1mexp, _mask
+from autolik.likelihood.loglik import _data, _sum
+
+_EVENT, _RIGHT, _LEFT = 1, 0, -1 # status codes of the observations
+
+
+def _censored(family,y,status,*params):
+    r"""Log-likelihood of censored observations, each group through its own vectorized term
+
+    .. math::
+        \ell = \sum_{event} \ln f(y_i) + \sum_{right} \ln S(y_i) + \sum_{left} \ln F(y_i)
+    """
+    y = _data(y)
+    status = np.broadcast_to(np.asarray(status).ravel(),y.shape)
+    unknown = ~np.isin(status,(_EVENT,_RIGHT,_LEFT))
+    if unknown.any(): # any other code would drop the observation silently
+        raise ValueError(f"status must be {_EVENT}, {_RIGHT} or {_LEFT}, got {np.unique(status[unknown]).tolist()}")
+    status = status.astype(int)
+    total = 0.
+    for code, lib in ((_EVENT,logpdf),(_RIGHT,logsf),(_LEFT,logcdf)):
+        mask = status == code
+        if mask.any():
+            total = total + _sum(getattr(lib,family)(y[mask],*params))
+    return total
+
+def _interval_mass(family,lower,upper,*params):
+    r"""log(F(upper) - F(lower)), a missing bound is None
+
+    taken from the tail the interval lies in, so the difference never rounds
+    to 0 when both bounds are far in the same tail
+
+    .. math::
+        \ln(F(u) - F(l)) = \begin{cases} \ln F(u) + \ln(1 - e^{\ln F(l) - \ln F(u)}), & F(u) < S(l) \\
+        \ln S(l) + \ln(1 - e^{\ln S(u) - \ln S(l)}), & \text{otherwise} \end{cases}
+    """
+    cdf, sf = getattr(logcdf,family), getattr(logsf,family)
+    if lower is None:
+        return cdf(np.asarray(upper,dtype=float),*params)
+    lower = np.asarray(lower,dtype=float)
+    if upper is None:
+        return sf(lower,*params)
+    upper = np.asarray(upper,dtype=float)
+    log_fl, log_fu = cdf(lower,*params), cdf(upper,*params)
+    log_sl, log_su = sf(lower,*params), sf(upper,*params)
+    w = _mask(_real(log_fu) < _real(log_sl)) # below the median, the other side at a safe point
+    left = log_fu + _log1mexp(w*(log_fl - log_fu) - (1-w))
+    right = log_sl + _log1mexp((1-w)*(log_su - log_sl) - w)
+    return w*left + (1-w)*right
+
+def _truncated(family,y,lower,upper,*params):
+    r"""Log-likelihood of observations truncated to [lower, upper]
+
+    .. math::
+        \ell = \sum_i \ln f(y_i) - \ln(F(u_i) - F(l_i))
+
+    the bounds are numbers or one per observation (delayed entry)
+    """
+    y = _data(y)
+    total = _sum(getattr(logpdf,family)(y,*params))
+    if lower is None and upper is None:
+        return total
+    mass = _interval_mass(family,lower,upper,*params)
+    if np.ndim(_real(mass)) == 0:
+        return total - len(y) * mass
+    return total - _sum(mass)
+
+
+class ll_censored:
+    """Censored-data log-likelihood functions library
+
+    Same families and parameters as ``ll``, after ``status``: one code per
+    observation, ``1`` (or ``True``) for an observed event, ``0`` (or
+    ``False``) for a right-censored one known only to exceed ``y`` and
+    ``-1`` for a left-censored one known only to be below ``y``. Each group
+    goes through one vectorized ``logpdf``, ``logsf`` or ``logcdf`` call, the
+    survival and distribution terms are computed in log space and stay
+    finite far into the tails.
+
+    Example:
+
+    >>> import numpy as np
+    >>> import autolik
+    >>> t = np.random.weibull(1.5,10**5) # event times
+    >>> c = np.random.exponential(2.,10**5) # censoring times
+    >>> y, event = np.minimum(t,c), t <= c
+    >>> autolik.ll_censored.weibull(y,event,1.,1.5)
+    >>> autolik.optim.mle(lambda a,b: autolik.ll_censored.weibull(y,event,a,b),start=[2.,1.]).x
+
+    """
+    def beta(y,status,beta,gam):
+        return _censored('beta',y,status,beta,gam)
+
+    def cauchy(y,status,a,alpha):
+        return _censored('cauchy',y,status,a,alpha)
+
+    def chi(y,status,n):
+        return _censored('chi',y,status,n)
+
+    def chisqr(y,status,n):
+        return _censored('chisqr',y,status,n)
+
+    def exponential(y,status,lam):
+        return _censored('exponential',y,status,lam)
+
+    def gamma(y,status,alpha,beta):
+        return _censored('gamma',y,status,alpha,beta)
+
+    def Ggamma(y,status,alpha,beta,gam):
+        return _censored('Ggamma',y,status,alpha,beta,gam)
+
+    def Gpareto(y,status,delta,kappa,gam):
+        return _censored('Gpareto',y,status,delta,kappa,gam)
+
+    def invgaussian(y,status,lam,mu):
+        return _censored('invgaussian',y,status,lam,mu)
+
+    def invgamma(y,status,alpha,beta):
+        return _censored('invgamma',y,status,alpha,beta)
+
+    def laplace(y,status,alpha1,alpha2):
+        return _censored('laplace',y,status,alpha1,alpha2)
+
+    def loggamma(y,status,alpha,beta):
+        return _censored('loggamma',y,status,alpha,beta)
+
+    def loglogistic(y,status,lam,kappa):
+        return _censored('loglogistic',y,status,lam,kappa)
+
+    def lognormal(y,status,alpha,beta):
+        return _censored('lognormal',y,status,alpha,beta)
+
+    def logistic(y,status,lam,kappa):
+        return _censored('logistic',y,status,lam,kappa)
+
+    def logistic_exp(y,status,alpha,beta):
+        return _censored('logistic_exp',y,status,alpha,beta)
+
+    def lomax(y,status,lam,kappa):
+        return _censored('lomax',y,status,lam,kappa)
+
+    def makeham(y,status,delta,kappa,gam):
+        return _censored('makeham',y,status,delta,kappa,gam)
+
+    def minimax(y,status,beta,gam):
+        return _censored('minimax',y,status,beta,gam)
+
+    def muth(y,status,kappa):
+        return _censored('muth',y,status,kappa)
+
+    def normal(y,status,mu,sigma):
+        return _censored('normal',y,status,mu,sigma)
+
+    def pareto(y,status,lam,kappa):
+        return _censored('pareto',y,status,lam,kappa)
+
+    def power(y,status,alpha,beta):
+        return _censored('power',y,status,alpha,beta)
+
+    def std_power(y,status,beta):
+        return _censored('std_power',y,status,beta)
+
+    def rayleigh(y,status,alpha):
+        return _censored('rayleigh',y,status,alpha)
+
+    def std_wald(y,status,lam):
+        return _censored('std_wald',y,status,lam)
+
+    def Tdist(y,status,n):
+        return _censored('Tdist',y,status,n)
+
+    def uniform(y,status,a,b):
+        return _censored('uniform',y,status,a,b)
+
+    def weibull(y,status,alpha,beta):
+        return _censored('weibull',y,status,alpha,beta)
+
+
+class ll_truncated:
+    """Truncated-data log-likelihood functions library
+
+    Same families and parameters as ``ll``, after the truncation bounds
+    ``lower`` and ``upper``: numbers, arrays with one bound per observation
+    (left truncation by delayed entry) or ``None`` for no bound. Each
+    observation's density is renormalized by the log of the probability
+    mass between its bounds, a difference of ``logcdf`` values when
+    F(upper) < S(lower), the interval lying toward the lower tail, and of
+    ``logsf`` values otherwise, so that truncation far into either tail stays
+    accurate.
+
+    Example:
+
+    >>> import numpy as np
+    >>> import autolik
+    >>> y = np.random.normal(1.,2.,10**5)
+    >>> y = y[y > 3.] # only values above 3 are recorded
+    >>> autolik.optim.mle(lambda mu,sigma: autolik.ll_truncated.normal(y,3.,None,mu,sigma),start=[0.,1.]).x
+
+    """
+    def beta(y,lower,upper,beta,gam):
+        return _truncated('beta',y,lower,upper,beta,gam)
+
+    def cauchy(y,lower,upper,a,alpha):
+        return _truncated('cauchy',y,lower,upper,a,alpha)
+
+    def chi(y,lower,upper,n):
+        return _truncated('chi',y,lower,upper,n)
+
+    def chisqr(y,lower,upper,n):
+        return _truncated('chisqr',y,lower,upper,n)
+
+    def exponential(y,lower,upper,lam):
+        return _truncated('exponential',y,lower,upper,lam)
+
+    def gamma(y,lower,upper,alpha,beta):
+        return _truncated('gamma',y,lower,upper,alpha,beta)
+
+    def Ggamma(y,lower,upper,alpha,beta,gam):
+        return _truncated('Ggamma',y,lower,upper,alpha,beta,gam)
+
+    def Gpareto(y,lower,upper,delta,kappa,gam):
+        return _truncated('Gpareto',y,lower,upper,delta,kappa,gam)
+
+    def invgaussian(y,lower,upper,lam,mu):
+        return _truncated('invgaussian',y,lower,upper,lam,mu)
+
+    def invgamma(y,lower,upper,alpha,beta):
+        return _truncated('invgamma',y,lower,upper,alpha,beta)
+
+    def laplace(y,lower,upper,alpha1,alpha2):
+        return _truncated('laplace',y,lower,upper,alpha1,alpha2)
+
+    def loggamma(y,lower,upper,alpha,beta):
+        return _truncated('loggamma',y,lower,upper,alpha,beta)
+
+    def loglogistic(y,lower,upper,lam,kappa):
+        return _truncated('loglogistic',y,lower,upper,lam,kappa)
+
+    def lognormal(y,lower,upper,alpha,beta):
+        return _truncated('lognormal',y,lower,upper,alpha,beta)
+
+    def logistic(y,lower,upper,lam,kappa):
+        return _truncated('logistic',y,lower,upper,lam,kappa)
+
+    def logistic_exp(y,lower,upper,alpha,beta):
+        return _truncated('logistic_exp',y,lower,upper,alpha,beta)
+
+    def lomax(y,lower,upper,lam,kappa):
+        return _truncated('lomax',y,lower,upper,lam,kappa)
+
+    def makeham(y,lower,upper,delta,kappa,gam):
+        return _truncated('makeham',y,lower,upper,delta,kappa,gam)
+
+    def minimax(y,lower,upper,beta,gam):
+        return _truncated('minimax',y,lower,upper,beta,gam)
+
+    def muth(y,lower,upper,kappa):
+        return _truncated('muth',y,lower,upper,kappa)
+
+    def normal(y,lower,upper,mu,sigma):
+        return _truncated('normal',y,lower,upper,mu,sigma)
+
+    def pareto(y,lower,upper,lam,kappa):
+        return _truncated('pareto',y,lower,upper,lam,kappa)
+
+    def power(y,lower,upper,alpha,beta):
+        return _truncated('power',y,lower,upper,alpha,beta)
+
+    def std_power(y,lower,upper,beta):
+        return _truncated('std_power',y,lower,upper,beta)
+
+    def rayleigh(y,lower,upper,alpha):
+        return _truncated('rayleigh',y,lower,upper,alpha)
+
+    def std_wald(y,lower,upper,lam):
+        return _truncated('std_wald',y,lower,upper,lam)
+
+    def Tdist(y,lower,upper,n):
+        return _truncated('Tdist',y,lower,upper,n)
+
+    def uniform(y,lower,upper,a,b):
+        return _truncated('uniform',y,lower,upper,a,b)
+
+    def weibull(y,lower,upper,alpha,beta):
+        return _truncated('weibull',y,lower,upper,alpha,beta)
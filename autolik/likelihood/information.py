@@ -0,0 +1,71 @@
+from typing import Callable
+import numpy as np
+from autolik.autodiff import _values_and_scores, _values_scores_hessian
+from autolik.distributions.univariate import logpdf
+from autolik.likelihood.loglik import ll, _data, _source
+
+def _contributions(family_or_fn,y) -> Callable:
+    """Per-observation log-density of a family name, an ``ll`` function or a user ``fn(y,*params)``"""
+    y = _data(_source(y))
+    if isinstance(family_or_fn,str) or getattr(ll,getattr(family_or_fn,'__name__',''),None) is family_or_fn:
+        density = getattr(logpdf,family_or_fn if isinstance(family_or_fn,str) else family_or_fn.__name__)
+        return lambda *theta: density(y,*theta)
+    return lambda *theta: family_or_fn(y,*theta)
+
+
+def scores(family_or_fn,y,params):
+    r"""Per-observation log-densities and score contributions
+
+    Returns the (n,) array of :math:`\ln f(y_i;\theta)` and the (n,p) matrix
+    of their gradients :math:`s_i = \nabla_\theta \ln f(y_i;\theta)`, all from
+    one vectorized dual evaluation of the log-density. ``family_or_fn`` is a
+    built-in family name, an ``ll`` function (its ``logpdf`` is used) or a
+    ``fn(y,*params)`` returning one contribution per observation
+
+    Example:
+
+    >>> import numpy as np
+    >>> import autolik
+    >>> y = np.random.normal(1.,2.,1000)
+    >>> values, S = autolik.scores('normal',y,[1.,2.])
+    >>> S.shape
+
+    """
+    return _values_and_scores(_contributions(family_or_fn,y),[float(p) for p in params])
+
+def opg(family_or_fn,y,params):
+    r"""Outer-product-of-gradients (BHHH) information
+
+    .. math::
+        B = \sum_i s_i s_i^T = S^T S
+
+    from the score matrix of ``scores``
+    """
+    S = scores(family_or_fn,y,params)[1]
+    return S.T @ S
+
+def sandwich(family_or_fn,y,params):
+    r"""Robust (sandwich) covariance of the estimates
+
+    .. math::
+        \hat V = A^{-1} B A^{-1}, \quad A = -\nabla^2_\theta \ell, \quad B = S^T S
+
+    with the observed information :math:`A` and the OPG information
+    :math:`B`, both from one hyper-dual evaluation of the per-observation
+    log-densities. Valid at the maximum likelihood estimates, where it stays
+    consistent when the model is misspecified. The robust standard errors are
+    ``np.sqrt(np.diag(V))``
+
+    Example:
+
+    >>> import numpy as np
+    >>> import autolik
+    >>> y = np.random.standard_t(5,10**4)
+    >>> fit = autolik.mle('normal',y,start=[0.,1.])
+    >>> V = autolik.sandwich('normal',y,fit.x)
+    >>> np.sqrt(np.diag(V))
+
+    """
+    _, S, H = _values_scores_hessian(_contributions(family_or_fn,y),[float(p) for p in params])
+    A_inv = np.linalg.inv(-H)
+    return A_inv @ (S.T @ S) @ A_inv
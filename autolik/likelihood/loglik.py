@@ -1,265 +1,163 @@
-from autolik.distributions.univariate import pdf
 from autolik.Dual.benchmark import *
+from autolik.Dual.benchmark import _real
+from autolik.distributions.univariate import _logparts
+import os
+import numpy as np
+
+# observations per chunk when walking a memory-mapped sample,
+# 512 KiB of float64 so a chunk and its temporaries stay in cache
+_CHUNK = 1 << 16
+
+
+def _data(y):
+    """Observations as a flat float array"""
+    return np.asarray(y,dtype=float).ravel()
+
+def _sum(loglik):
+    """Sum the log-likelihood contributions over the observations (last) axis
+
+    leading axes are kept, so parameters given as (n_points,1) columns give
+    back one log-likelihood per point
+    """
+    if isinstance(loglik,Dual):
+        return loglik.sum(axis=-1)
+    total = np.sum(loglik,axis=-1)
+    return float(total) if np.ndim(total) == 0 else total
+
+def _source(y):
+    """A raw float64 file path opened as a read-only np.memmap, other data unchanged"""
+    if isinstance(y,(str,os.PathLike)):
+        return np.memmap(y,dtype=float,mode='r')
+    return y
+
+def _out_of_core(y):
+    return isinstance(y,(str,os.PathLike,np.memmap))
+
+def _loglik(parts,y,*params):
+    """Log-likelihood of the sample, chunk by chunk when it is memory-mapped
+
+    a memmap is never read as a whole: each chunk is paged in, converted to
+    float and reduced before the next one, repeated passes hit the page cache
+    """
+    if not _out_of_core(y):
+        return _chunk(parts,_data(y),*params)
+    y = _source(y).reshape(-1)
+    total = 0.
+    for lo in range(0,len(y),_CHUNK):
+        total = total + _chunk(parts,_data(y[lo:lo + _CHUNK]),*params)
+    return total
+
+def _chunk(parts,y,*params):
+    """n c(params) + sum k(y,params) over one block of observations"""
+    const, kernel = parts(y,*params)
+    if np.ndim(_real(const)) > 0: # (n_points,1) parameter columns
+        const = _sum(const)
+    if kernel is None:
+        return len(y) * const
+    return len(y) * const + _sum(kernel)
+
 
 class ll:
-    """Log-Likelihood functions library"""
+    """Log-Likelihood functions library
+
+    ``y`` may be a list or a numpy array, the log-densities of the whole sample
+    are evaluated in a single vectorized pass and summed, with the parameter-only
+    normalizing constant of each family computed once and multiplied by n.
+    ``y`` may also be an ``np.memmap`` or the path of a raw binary file of
+    float64 values (open other dtypes with ``np.memmap(path,dtype,mode='r')``),
+    the file is then walked in cache-sized chunks without ever being loaded
+    whole, and Dual parameters still give value and gradient in one pass
+    """
     def beta(y,beta,gam):
-        length = len(y)
-        lik = list(map(pdf.beta, y, [beta]*length, [gam]*length))
-        if isinstance(beta,Dual) or isinstance(gam,Dual):
-            loglik = list(map(Dual.log, lik))
-        else:
-            loglik = list(map(math.log, lik))
-        return sum(loglik)
+        return _loglik(_logparts.beta,y,beta,gam)
 
     def cauchy(y,a,alpha):
-        length = len(y)
-        lik = list(map(pdf.cauchy, y, [a]*length, [alpha]*length))
-        if isinstance(a,Dual) or isinstance(alpha,Dual):
-            loglik = list(map(Dual.log, lik))
-        else:
-            loglik = list(map(math.log, lik))
-        return sum(loglik)
+        return _loglik(_logparts.cauchy,y,a,alpha)
 
     def chi(y,n):
-        length = len(y)
-        lik = list(map(pdf.chi, y, [n]*length))
-        if isinstance(n,Dual):
-            loglik = list(map(Dual.log, lik))
-        else:
-            loglik = list(map(math.log, lik))
-        return sum(loglik)
+        return _loglik(_logparts.chi,y,n)
 
     def chisqr(y,n):
-        length = len(y)
-        lik = list(map(pdf.chisqr, y, [n]*length))
-        if isinstance(n,Dual):
-            loglik = list(map(Dual.log, lik))
-        else:
-            loglik = list(map(math.log, lik))
-        return sum(loglik)
+        return _loglik(_logparts.chisqr,y,n)
 
     def exponential(y,lam):
-        length = len(y)
-        lik = list(map(pdf.exponential, y, [lam]*length))
-        if isinstance(lam,Dual):
-            loglik = list(map(Dual.log, lik))
-        else:
-            loglik = list(map(math.log, lik))
-        return sum(loglik)
+        return _loglik(_logparts.exponential,y,lam)
 
     def gamma(y,alpha,beta):
-        length = len(y)
-        lik = list(map(pdf.gamma, y, [alpha]*length, [beta]*length))
-        if isinstance(alpha,Dual) or isinstance(beta,Dual):
-            loglik = list(map(Dual.log, lik))
-        else:
-            loglik = list(map(math.log, lik))
-        return sum(loglik)
+        return _loglik(_logparts.gamma,y,alpha,beta)
 
     def Ggamma(y,alpha,beta,gam):
-        length = len(y)
-        lik = list(map(pdf.Ggamma, y, [alpha]*length, [beta]*length),[gam]*length)
-        if isinstance(alpha,Dual) or isinstance(beta,Dual) or isinstance(gam,Dual):
-            loglik = list(map(Dual.log, lik))
-        else:
-            loglik = list(map(math.log, lik))
-        return sum(loglik)
+        return _loglik(_logparts.Ggamma,y,alpha,beta,gam)
 
     def Gpareto(y,delta,kappa,gam):
-        length = len(y)
-        lik = list(map(pdf.Gpareto, y, [delta]*length, [kappa]*length),[gam]*length)
-        if isinstance(delta,Dual) or isinstance(kappa,Dual) or isinstance(gam,Dual):
-            loglik = list(map(Dual.log, lik))
-        else:
-            loglik = list(map(math.log, lik))
-        return sum(loglik)
+        return _loglik(_logparts.Gpareto,y,delta,kappa,gam)
 
     def invgaussian(y,lam,mu):
-        length = len(y)
-        lik = list(map(pdf.invgaussian, y, [lam]*length, [mu]*length))
-        if isinstance(lam,Dual) or isinstance(mu,Dual):
-            loglik = list(map(Dual.log, lik))
-        else:
-            loglik = list(map(math.log, lik))
-        return sum(loglik)
+        return _loglik(_logparts.invgaussian,y,lam,mu)
 
     def invgamma(y,alpha,beta):
-        length = len(y)
-        lik = list(map(pdf.invgamma, y, [alpha]*length, [beta]*length))
-        if isinstance(alpha,Dual) or isinstance(beta,Dual):
-            loglik = list(map(Dual.log, lik))
-        else:
-            loglik = list(map(math.log, lik))
-        return sum(loglik)
+        return _loglik(_logparts.invgamma,y,alpha,beta)
 
     def laplace(y,alpha1,alpha2):
-        length = len(y)
-        lik = list(map(pdf.laplace, y, [alpha1]*length, [alpha2]*length))
-        if isinstance(alpha1,Dual) or isinstance(alpha2,Dual):
-            loglik = list(map(Dual.log, lik))
-        else:
-            loglik = list(map(math.log, lik))
-        return sum(loglik)
+        return _loglik(_logparts.laplace,y,alpha1,alpha2)
 
     def loggamma(y,alpha,beta):
-        length = len(y)
-        lik = list(map(pdf.loggamma, y, [alpha]*length, [beta]*length))
-        if isinstance(alpha,Dual) or isinstance(beta,Dual):
-            loglik = list(map(Dual.log, lik))
-        else:
-            loglik = list(map(math.log, lik))
-        return sum(loglik)
+        return _loglik(_logparts.loggamma,y,alpha,beta)
 
     def loglogistic(y,lam,kappa):
-        length = len(y)
-        lik = list(map(pdf.loglogistic, y, [lam]*length, [kappa]*length))
-        if isinstance(lam,Dual) or isinstance(kappa,Dual):
-            loglik = list(map(Dual.log, lik))
-        else:
-            loglik = list(map(math.log, lik))
-        return sum(loglik)
+        return _loglik(_logparts.loglogistic,y,lam,kappa)
 
     def lognormal(y,alpha,beta):
-        length = len(y)
-        lik = list(map(pdf.lognormal, y, [alpha]*length, [beta]*length))
-        if isinstance(alpha,Dual) or isinstance(beta,Dual):
-            loglik = list(map(Dual.log, lik))
-        else:
-            loglik = list(map(math.log, lik))
-        return sum(loglik)
+        return _loglik(_logparts.lognormal,y,alpha,beta)
 
     def logistic(y,lam,kappa):
-        length = len(y)
-        lik = list(map(pdf.logistic, y, [lam]*length, [kappa]*length))
-        if isinstance(lam,Dual) or isinstance(kappa,Dual):
-            loglik = list(map(Dual.log, lik))
-        else:
-            loglik = list(map(math.log, lik))
-        return sum(loglik)
+        return _loglik(_logparts.logistic,y,lam,kappa)
 
     def logistic_exp(y,alpha,beta):
-        length = len(y)
-        lik = list(map(pdf.logistic_exp, y, [alpha]*length, [beta]*length))
-        if isinstance(alpha,Dual) or isinstance(beta,Dual):
-            loglik = list(map(Dual.log, lik))
-        else:
-            loglik = list(map(math.log, lik))
-        return sum(loglik)
+        return _loglik(_logparts.logistic_exp,y,alpha,beta)
 
     def lomax(y,lam,kappa):
-        length = len(y)
-        lik = list(map(pdf.lomax, y, [lam]*length, [kappa]*length))
-        if isinstance(lam,Dual) or isinstance(kappa,Dual):
-            loglik = list(map(Dual.log, lik))
-        else:
-            loglik = list(map(math.log, lik))
-        return sum(loglik)
+        return _loglik(_logparts.lomax,y,lam,kappa)
 
     def makeham(y,delta,kappa,gam):
-        length = len(y)
-        lik = list(map(pdf.makeham, y, [delta]*length, [kappa]*length, [gam]*length))
-        if isinstance(delta,Dual) or isinstance(kappa,Dual) or isinstance(gam,Dual):
-            loglik = list(map(Dual.log, lik))
-        else:
-            loglik = list(map(math.log, lik))
-        return sum(loglik)
+        return _loglik(_logparts.makeham,y,delta,kappa,gam)
 
     def minimax(y,beta,gam):
-        length = len(y)
-        lik = list(map(pdf.minimax, y, [beta]*length, [gam]*length))
-        if isinstance(beta,Dual) or isinstance(gam,Dual):
-            loglik = list(map(Dual.log, lik))
-        else:
-            loglik = list(map(math.log, lik))
-        return sum(loglik)
+        return _loglik(_logparts.minimax,y,beta,gam)
 
     def muth(y,kappa):
-        length = len(y)
-        lik = list(map(pdf.muth, y, [kappa]*length))
-        if isinstance(kappa,Dual):
-            loglik = list(map(Dual.log, lik))
-        else:
-            loglik = list(map(math.log, lik))
-        return sum(loglik)
+        return _loglik(_logparts.muth,y,kappa)
 
     def normal(y,mu,sigma):
-        length = len(y)
-        lik = list(map(pdf.normal, y, [mu]*length, [sigma]*length))
-        if isinstance(mu,Dual) or isinstance(sigma,Dual):
-            loglik = list(map(Dual.log, lik))
-        else:
-            loglik = list(map(math.log, lik))
-        return sum(loglik)
+        return _loglik(_logparts.normal,y,mu,sigma)
 
     def pareto(y,lam,kappa):
-        length = len(y)
-        lik = list(map(pdf.pareto, y, [lam]*length, [kappa]*length))
-        if isinstance(lam,Dual) or isinstance(kappa,Dual):
-            loglik = list(map(Dual.log, lik))
-        else:
-            loglik = list(map(math.log, lik))
-        return sum(loglik)
+        return _loglik(_logparts.pareto,y,lam,kappa)
 
     def power(y,alpha,beta):
-        length = len(y)
-        lik = list(map(pdf.power, y, [alpha]*length, [beta]*length))
-        if isinstance(alpha,Dual) or isinstance(beta,Dual):
-            loglik = list(map(Dual.log, lik))
-        else:
-            loglik = list(map(math.log, lik))
-        return sum(loglik)
-    
+        return _loglik(_logparts.power,y,alpha,beta)
+
     def std_power(y,beta):
-        length = len(y)
-        lik = list(map(pdf.std_power, y, [beta]*length))
-        if isinstance(beta,Dual):
-            loglik = list(map(Dual.log, lik))
-        else:
-            loglik = list(map(math.log, lik))
-        return sum(loglik)
+        return _loglik(_logparts.std_power,y,beta)
 
     def rayleigh(y,alpha):
-        length = len(y)
-        lik = list(map(pdf.rayleigh, y, [alpha]*length))
-        if isinstance(alpha,Dual):
-            loglik = list(map(Dual.log, lik))
-        else:
-            loglik = list(map(math.log, lik))
-        return sum(loglik)
+        return _loglik(_logparts.rayleigh,y,alpha)
 
     def std_wald(y,lam):
-        length = len(y)
-        lik = list(map(pdf.std_wald, y, [lam]*length))
-        if isinstance(lam,Dual):
-            loglik = list(map(Dual.log, lik))
-        else:
-            loglik = list(map(math.log, lik))
-        return sum(loglik)
+        return _loglik(_logparts.std_wald,y,lam)
 
     def Tdist(y,n):
-        length = len(y)
-        lik = list(map(pdf.Tdist, y, [n]*length))
-        if isinstance(n,Dual):
-            loglik = list(map(Dual.log, lik))
-        else:
-            loglik = list(map(math.log, lik))
-        return sum(loglik)
+        return _loglik(_logparts.Tdist,y,n)
 
     def uniform(y,a,b):
-        length = len(y)
-        lik = list(map(pdf.uniform, y, [a]*length, [b]*length))
-        if isinstance(a,Dual) or isinstance(b,Dual):
-            loglik = list(map(Dual.log, lik))
-        else:
-            loglik = list(map(math.log, lik))
-        return sum(loglik)
+        return _loglik(_logparts.uniform,y,a,b)
 
     def weibull(y,alpha,beta):
-        length = len(y)
-        lik = list(map(pdf.weibull, y, [alpha]*length, [beta]*length))
-        if isinstance(alpha,Dual) or isinstance(beta,Dual):
-            loglik = list(map(Dual.log, lik))
-        else:
-            loglik = list(map(math.log, lik))
-        return sum(loglik)
\ No newline at end of file
+        return _loglik(_logparts.weibull,y,alpha,beta)
+
+
+from autolik.likelihood.score import ll_score
+
+for _family in vars(ll_score):
+    if not _family.startswith('_'):
+        getattr(ll,_family).grad = getattr(ll_score,_family)
@@ -0,0 +1,87 @@
+from autolik.Dual.benchmark import Dual
+from autolik.autodiff import _hessian, _value_and_gradient, _value_gradient_hessian
+from autolik.likelihood.loglik import ll, _source, _out_of_core
+from autolik.likelihood.sample import Sample
+from autolik.likelihood.score import ll_score, ll_value
+from autolik.likelihood.information import scores, opg, sandwich
+
+class Likelihood:
+    """Log-likelihood of a built-in family bound to a fixed sample
+
+    The data transforms and reductions the family needs (sum y, sum y²,
+    sum log y, sum log(1-y), ...) are computed on first use and kept in the
+    bound ``Sample``, so repeated evaluations at new parameters cost O(1) in
+    the sample size for the exponential families and reuse the cached
+    transformed arrays for the others.
+
+    An ``np.memmap`` or a raw float64 file path is mapped once and never
+    loaded whole: every evaluation walks it in chunks through ``ll.<family>``
+    (value and score from one dual pass), and the pages read by one
+    optimizer iteration are served from the page cache on the next.
+
+    Calling the object with plain numbers gives the closed-form value, with
+    any autolik differentiable type it goes through ``ll.<family>`` so it can
+    be passed to ``grad``/``rgrad`` like any other function.
+
+    Example:
+
+    >>> import numpy as np
+    >>> from autolik import Likelihood
+    >>> y = np.random.gamma(2.,1.5,10**6)
+    >>> L = Likelihood('gamma',y) # or Likelihood(autolik.ll.gamma,y)
+    >>> L(1.5,2.)
+    >>> L.grad(1.5,2.)
+    >>> L.hessian(1.5,2.)
+
+    """
+    def __init__(self, family, y) -> None:
+        self.family = family if isinstance(family,str) else family.__name__
+        self.chunked = _out_of_core(y)
+        self.sample = None if self.chunked else Sample.of(y)
+        self._y = _source(y) if self.chunked else self.sample.y
+        self._ll = getattr(ll,self.family)
+        self._value = getattr(ll_value,self.family)
+        self._grad = getattr(ll_score,self.family)
+
+    def __call__(self,*params):
+        if self.chunked or any(isinstance(p,Dual) for p in params):
+            return self._ll(self._y,*params)
+        return self._value(self.sample,*params)
+
+    def value(self,*params):
+        """Log-likelihood at the given parameters"""
+        if self.chunked:
+            return float(self._ll(self._y,*params))
+        return self._value(self.sample,*params)
+
+    def grad(self,*params):
+        """Score at the given parameters, as a list in argument order"""
+        if self.chunked:
+            return self.value_and_grad(*params)[1]
+        return self._grad(self.sample,*params)
+
+    def value_and_grad(self,*params):
+        """Log-likelihood and score at the given parameters"""
+        if self.chunked:
+            return _value_and_gradient(lambda *theta: self._ll(self._y,*theta),params)
+        return self._value(self.sample,*params), self._grad(self.sample,*params)
+
+    def hessian(self,*params):
+        """Hessian of the log-likelihood, minus the observed information matrix"""
+        return _hessian(lambda *theta: self._ll(self._y,*theta),params)
+
+    def value_grad_hessian(self,*params):
+        """Log-likelihood, score and Hessian from one hyper-dual pass over the data"""
+        return _value_gradient_hessian(lambda *theta: self._ll(self._y,*theta),params)
+
+    def scores(self,*params):
+        """Per-observation log-densities (n,) and score contributions (n,p)"""
+        return scores(self.family,self._y,params)
+
+    def opg(self,*params):
+        """Outer-product-of-gradients (BHHH) information matrix"""
+        return opg(self.family,self._y,params)
+
+    def sandwich(self,*params):
+        """Robust (sandwich) covariance of the estimates, at the maximum likelihood estimates"""
+        return sandwich(self.family,self._y,params)
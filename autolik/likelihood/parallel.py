@@ -0,0 +1,88 @@
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import os
+import numpy as np
+from autolik.autodiff import _value_and_gradient
+from autolik.likelihood.loglik import ll, _data
+
+# worker side: the shared sample each worker process is attached to
+_SHARED = {}
+
+def _attach(name,n):
+    """Pool initializer, map the shared sample into the worker once"""
+    shm = shared_memory.SharedMemory(name=name)
+    _SHARED['shm'] = shm # keep the mapping alive with the process
+    _SHARED['y'] = np.ndarray((n,),dtype=float,buffer=shm.buf)
+
+def _shard(fn,lo,hi,params):
+    """Partial log-likelihood of observations lo:hi, a Dual when params are Duals"""
+    return fn(_SHARED['y'][lo:hi],*params)
+
+
+class ParallelLikelihood:
+    """Log-likelihood evaluated over shards of the sample on a process pool
+
+    The sample is copied once into shared memory, every worker maps it at
+    start-up, so a call only ships the shard bounds and the parameters. Each
+    worker returns the partial sum of its shard, plain numbers or ``Dual``
+    (value and gradient together), and the partial sums are added up.
+
+    ``family_or_fn`` is a built-in family name, an ``ll`` function or any
+    picklable ``fn(y,*params)`` written with autolik types. Calling the
+    object with ``Dual`` parameters gives back a ``Dual``, so ``grad`` and
+    ``mle`` work on it unchanged. Release the pool and the shared memory with
+    ``close()`` or a ``with`` block.
+
+    Example:
+
+    >>> import numpy as np
+    >>> import autolik
+    >>> y = np.random.gamma(2.,1.5,10**7)
+    >>> with autolik.ParallelLikelihood('gamma',y,workers=8) as L:
+    ...     L(1.5,2.), L.grad(1.5,2.)
+
+    """
+    def __init__(self, family_or_fn, y, workers=None, shards=None) -> None:
+        self._fn = getattr(ll,family_or_fn) if isinstance(family_or_fn,str) else family_or_fn
+        y = _data(y)
+        self.n = len(y)
+        self.workers = workers or os.cpu_count()
+        bounds = np.linspace(0,self.n,(shards or self.workers) + 1).astype(int)
+        self._bounds = [(int(lo),int(hi)) for lo, hi in zip(bounds[:-1],bounds[1:]) if hi > lo]
+        self._shm = shared_memory.SharedMemory(create=True,size=max(y.nbytes,1))
+        np.ndarray(y.shape,dtype=float,buffer=self._shm.buf)[:] = y
+        self._pool = ProcessPoolExecutor(self.workers,initializer=_attach,initargs=(self._shm.name,self.n))
+        self._finalizer = weakref.finalize(self,_release,self._pool,self._shm)
+
+    def __call__(self,*params):
+        futures = [self._pool.submit(_shard,self._fn,lo,hi,params) for lo, hi in self._bounds]
+        return sum(f.result() for f in futures)
+
+    def value(self,*params):
+        """Log-likelihood at the given parameters"""
+        return float(self(*params))
+
+    def grad(self,*params):
+        """Score at the given parameters, as a list in argument order"""
+        return _value_and_gradient(self,params)[1]
+
+    def value_and_grad(self,*params):
+        """Log-likelihood and score from one parallel dual evaluation"""
+        return _value_and_gradient(self,params)
+
+    def close(self):
+        """Shut the worker pool down and free the shared memory"""
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,*exc):
+        self.close()
+
+
+def _release(pool,shm):
+    pool.shutdown()
+    shm.close()
+    shm.unlink()
@@ -0,0 +1,98 @@
+import numpy as np
+
+# elementwise transforms of the observations, cached by name
+_TRANSFORMS = {
+    'y': lambda y: y,
+    'sq': np.square,
+    'inv': np.reciprocal,
+    'exp': np.exp,
+    'log': np.log,
+    'log1m': lambda y: np.log1p(-y),
+    'neg': lambda y: np.minimum(y,0),
+    'pos': lambda y: np.maximum(y,0),
+}
+
+class Sample:
+    """Observations with cached transforms and reductions
+
+    ``array(name)`` returns a transformed copy of the data (``'log'`` for
+    log y, ``'sq'`` for y², ``'log1m'`` for log(1-y), ...) and ``total(name)``
+    its sum, ``deviations(c,name)`` its sums of t-c and (t-c)², all
+    computed on first use only. Binding the data once and reusing the Sample
+    makes every later evaluation of an exponential-family log-likelihood or
+    score O(1) in the sample size.
+
+    Example:
+
+    >>> from autolik.likelihood.sample import Sample
+    >>> d = Sample([0.5,1.5,2.5])
+    >>> d.n, d.total('y'), d.total('log')
+
+    """
+    def __init__(self, y) -> None:
+        self.y = np.asarray(y,dtype=float).ravel()
+        self.n = len(self.y)
+        self._arrays = {'y': self.y}
+        self._totals = {}
+
+    @classmethod
+    def of(cls,y):
+        """Wrap raw observations, a Sample is returned as is"""
+        return y if isinstance(y,Sample) else cls(y)
+
+    def array(self,name):
+        """Transformed observations"""
+        if name not in self._arrays:
+            self._arrays[name] = _TRANSFORMS[name](self.y)
+        return self._arrays[name]
+
+    def total(self,name):
+        """Sum of the transformed observations"""
+        if name not in self._totals:
+            self._totals[name] = float(self.array(name).sum())
+        return self._totals[name]
+
+    def spread(self,name='y'):
+        r"""Center :math:`m` of the transformed observations, :math:`\sum(t-m)` and :math:`\sum(t-m)^2`
+
+        :math:`m` is the mean rounded to a float, the residual sum keeps what
+        the rounding lost
+        """
+        key = 'spread ' + name
+        if key not in self._totals:
+            t = self.array(name)
+            m = float(t.mean())
+            self._totals[key] = m, float((t - m).sum()), float(np.square(t - m).sum())
+        return self._totals[key]
+
+    def deviations(self,c,name='y'):
+        r"""Sums :math:`\sum(t-c)` and :math:`\sum(t-c)^2` of the transformed observations, O(1) from ``spread``
+
+        unlike :math:`\sum t^2 - 2c\sum t + nc^2` they keep their precision
+        when the spread is small next to the mean
+        """
+        m, r, S = self.spread(name)
+        e = m - c
+        return r + self.n*e, S + e*(2*r + self.n*e)
+
+    def relative_squares(self,c):
+        r"""Sum :math:`\sum (y-c)^2/y`, O(1) around the cached harmonic mean like ``deviations``"""
+        if 'harmonic spread' not in self._totals:
+            h = self.n / self.total('inv')
+            self._totals['harmonic spread'] = (h, float(((self.y - h) / self.y).sum()),
+                                               float((np.square(self.y - h) / self.y).sum()))
+        h, r, S = self._totals['harmonic spread']
+        e = h - c
+        return S + e*(2*r + e*self.total('inv'))
+
+    @property
+    def min(self):
+        if 'min' not in self._totals:
+            self._totals['min'] = float(self.y.min())
+        return self._totals['min']
+
+    @property
+    def max(self):
+        if 'max' not in self._totals:
+            self._totals['max'] = float(self.y.max())
+        return self._totals['max']
@@ -0,0 +1,389 @@
+import math
+import numpy as np
+from autolik._lazy import scipy
+from autolik.distributions.univariate import _logparts
+from autolik.likelihood.sample import Sample
+
+_LOG2PI = math.log(2*math.pi)
+
+
+def _checked(parts,y,*params):
+    """Sample of y after the domain checks of the log-density, run once on its extreme observations
+
+    the supports are intervals, so the smallest and largest observations
+    check the data and the parameters are checked as in ``ll``
+    """
+    d = Sample.of(y)
+    with np.errstate(all='ignore'):
+        parts(np.array([d.min,d.max]),*params)
+    return d
+
+
+class ll_score:
+    r"""Closed-form score functions library
+
+    ``ll_score.<family>(y,*params)`` returns the gradient of ``ll.<family>``
+    with respect to its parameters, in the same order and as a list like
+    ``grad``, from vectorized analytic expressions of the log-density
+    derivatives instead of dual propagation. Each function is also reachable
+    as ``ll.<family>.grad``.
+
+    ``y`` may be raw observations or a ``Sample``, whose cached reductions
+    make the exponential-family scores O(1) in the sample size.
+    """
+    def beta(y,beta,gam):
+        r"""Score of :math:`beta(\beta,\gamma)` with respect to :math:`(\beta,\gamma)`"""
+        d = _checked(_logparts.beta,y,beta,gam)
+        psi = scipy.special.digamma(beta+gam)
+        return [d.n*(psi - scipy.special.digamma(beta)) + d.total('log'),
+                d.n*(psi - scipy.special.digamma(gam)) + d.total('log1m')]
+
+    def cauchy(y,a,alpha):
+        r"""Score of :math:`Cauchy(a,\alpha)` with respect to :math:`(a,\alpha)`"""
+        d = _checked(_logparts.cauchy,y,a,alpha)
+        z = (d.y - a) / alpha
+        w = 2*z / (1 + z**2)
+        return [float(w.sum()) / alpha,
+                (float((w*z).sum()) - d.n) / alpha]
+
+    def chi(y,n):
+        r"""Score of :math:`\chi(n)` with respect to :math:`n`"""
+        d = _checked(_logparts.chi,y,n)
+        return [d.total('log') - d.n*(math.log(2) + scipy.special.digamma(n/2))/2]
+
+    def chisqr(y,n):
+        r"""Score of :math:`\chi^2(n)` with respect to :math:`n`"""
+        d = _checked(_logparts.chisqr,y,n)
+        return [(d.total('log') - d.n*(math.log(2) + scipy.special.digamma(n/2)))/2]
+
+    def exponential(y,lam):
+        r"""Score of :math:`exponential(\lambda)` with respect to :math:`\lambda`"""
+        d = _checked(_logparts.exponential,y,lam)
+        return [d.n/lam - d.total('y')]
+
+    def gamma(y,alpha,beta):
+        r"""Score of :math:`gamma(\alpha,\beta)` with respect to :math:`(\alpha,\beta)`"""
+        d = _checked(_logparts.gamma,y,alpha,beta)
+        return [d.total('y')/alpha**2 - d.n*beta/alpha,
+                d.total('log') - d.n*(math.log(alpha) + scipy.special.digamma(beta))]
+
+    def Ggamma(y,alpha,beta,gam):
+        r"""Score of :math:`\text{generalized gamma}(\alpha,\beta,\gamma)` with respect to :math:`(\alpha,\beta,\gamma)`"""
+        d = _checked(_logparts.Ggamma,y,alpha,beta,gam)
+        L = d.array('log') - math.log(alpha)
+        t = np.exp(gam*L) # (y/alpha)**gam
+        sL = d.total('log') - d.n*math.log(alpha)
+        return [gam*(float(t.sum()) - d.n*beta)/alpha,
+                gam*sL - d.n*scipy.special.digamma(beta),
+                d.n/gam + beta*sL - float((t*L).sum())]
+
+    def Gpareto(y,delta,kappa,gam):
+        r"""Score of :math:`\text{generalized pareto}(\delta,\kappa,\gamma)` with respect to :math:`(\delta,\kappa,\gamma)`"""
+        d = _checked(_logparts.Gpareto,y,delta,kappa,gam)
+        yd = d.y + delta
+        h = gam + kappa/yd
+        return [kappa*float((d.y/(delta*yd) - 1/(yd**2*h)).sum()),
+                float((1/(yd*h)).sum()) - float(np.log1p(d.y/delta).sum()),
+                float((1/h).sum()) - d.total('y')]
+
+    def invgaussian(y,lam,mu):
+        r"""Score of :math:`\text{inverse Gaussian}(\lambda,\mu)` with respect to :math:`(\lambda,\mu)`"""
+        d = _checked(_logparts.invgaussian,y,lam,mu)
+        sdev = d.relative_squares(mu) # sum (y-mu)^2/y
+        return [d.n/(2*lam) - sdev/(2*mu**2),
+                lam*d.deviations(mu)[0]/mu**3]
+
+    def invgamma(y,alpha,beta):
+        r"""Score of :math:`\text{inverted gamma}(\alpha,\beta)` with respect to :math:`(\alpha,\beta)`"""
+        d = _checked(_logparts.invgamma,y,alpha,beta)
+        return [-d.total('log') - d.n*(scipy.special.digamma(alpha) + math.log(beta)),
+                d.total('inv')/beta**2 - d.n*alpha/beta]
+
+    def laplace(y,alpha1,alpha2):
+        r"""Score of :math:`Laplace(\alpha_1,\alpha_2)` with respect to :math:`(\alpha_1,\alpha_2)`"""
+        d = _checked(_logparts.laplace,y,alpha1,alpha2)
+        return [-d.n/(alpha1+alpha2) - d.total('neg')/alpha1**2,
+                -d.n/(alpha1+alpha2) + d.total('pos')/alpha2**2]
+
+    def loggamma(y,alpha,beta):
+        r"""Score of :math:`log-gamma(\alpha,\beta)` with respect to :math:`(\alpha,\beta)`"""
+        d = _checked(_logparts.loggamma,y,alpha,beta)
+        return [d.total('exp')/alpha**2 - d.n*beta/alpha,
+                d.total('y') - d.n*(math.log(alpha) + scipy.special.digamma(beta))]
+
+    def loglogistic(y,lam,kappa):
+        r"""Score of :math:`loglogistic(\lambda,\kappa)` with respect to :math:`(\lambda,\kappa)`"""
+        d = _checked(_logparts.loglogistic,y,lam,kappa)
+        L = math.log(lam) + d.array('log')
+        w = scipy.special.expit(kappa*L) # u/(1+u), u = (lam*y)**kappa
+        return [kappa*(d.n - 2*float(w.sum()))/lam,
+                d.n/kappa + float((L*(1 - 2*w)).sum())]
+
+    def lognormal(y,alpha,beta):
+        r"""Score of :math:`log-normal(\alpha,\beta)` with respect to :math:`(\alpha,\beta)`"""
+        d = _checked(_logparts.lognormal,y,alpha,beta)
+        sw, sw2 = d.deviations(math.log(alpha),'log') # sum log(y/alpha) and its squares
+        return [sw/(alpha*beta**2),
+                -d.n/beta + sw2/beta**3]
+
+    def logistic(y,lam,kappa):
+        r"""Score of :math:`logistic(\lambda,\kappa)` with respect to :math:`(\lambda,\kappa)`"""
+        d = _checked(_logparts.logistic,y,lam,kappa)
+        L = math.log(lam) + d.y
+        w = scipy.special.expit(kappa*L) # u/(1+u), u = (lam*exp(y))**kappa
+        return [kappa*(d.n - 2*float(w.sum()))/lam,
+                d.n/kappa + float((L*(1 - 2*w)).sum())]
+
+    def logistic_exp(y,alpha,beta):
+        r"""Score of :math:`log-exponential(\alpha,\beta)` with respect to :math:`(\alpha,\beta)`"""
+        d = _checked(_logparts.logistic_exp,y,alpha,beta)
+        m = np.expm1(alpha*d.y)
+        Lm = np.log(m)
+        w = scipy.special.expit(beta*Lm) # v/(1+v), v = m**beta
+        r = d.y * (m + 1) / m
+        return [d.n/alpha + float((r*(beta - 1 - 2*beta*w)).sum()) + d.total('y'),
+                d.n/beta + float((Lm*(1 - 2*w)).sum())]
+
+    def lomax(y,lam,kappa):
+        r"""Score of :math:`lomax(\lambda,\kappa)` with respect to :math:`(\lambda,\kappa)`"""
+        d = _checked(_logparts.lomax,y,lam,kappa)
+        return [d.n/lam - (kappa+1)*float((d.y/(1+lam*d.y)).sum()),
+                d.n/kappa - float(np.log1p(lam*d.y).sum())]
+
+    def makeham(y,delta,kappa,gam):
+        r"""Score of :math:`Makeham(\delta,\kappa,\gamma)` with respect to :math:`(\delta,\kappa,\gamma)`"""
+        d = _checked(_logparts.makeham,y,delta,kappa,gam)
+        L = math.log(kappa)
+        k = np.exp(L*d.y) # kappa**y
+        h = gam + delta*k
+        yk = d.y*k
+        sk1 = float(k.sum()) - d.n
+        return [float((k/h).sum()) - sk1/L,
+                delta*(float((yk/h).sum()) - float(yk.sum())/L + sk1/L**2)/kappa,
+                float((1/h).sum()) - d.total('y')]
+
+    def minimax(y,beta,gam):
+        r"""Score of :math:`minimax(\beta,\gamma)` with respect to :math:`(\beta,\gamma)`"""
+        d = _checked(_logparts.minimax,y,beta,gam)
+        L = d.array('log')
+        yb = np.exp(beta*L)
+        return [d.n/beta + d.total('log') - (gam-1)*float((yb*L/(1-yb)).sum()),
+                d.n/gam + float(np.log1p(-yb).sum())]
+
+    def muth(y,kappa):
+        r"""Score of :math:`muth(\kappa)` with respect to :math:`\kappa`"""
+        d = _checked(_logparts.muth,y,kappa)
+        e = np.exp(kappa*d.y)
+        return [float(((d.y*e - 1)/(e - kappa)).sum())
+                - float((d.y*e - e/kappa).sum())/kappa
+                + d.total('y') - d.n/kappa**2]
+
+    def normal(y,mu,sigma):
+        r"""Score of :math:`N(\mu,\sigma^2)` with respect to :math:`(\mu,\sigma)`"""
+        d = _checked(_logparts.normal,y,mu,sigma)
+        sd, sd2 = d.deviations(mu) # sum (y-mu) and (y-mu)^2
+        return [sd/sigma**2,
+                -d.n/sigma + sd2/sigma**3]
+
+    def pareto(y,lam,kappa):
+        r"""Score of :math:`pareto(\lambda,\kappa)` with respect to :math:`(\lambda,\kappa)`"""
+        d = _checked(_logparts.pareto,y,lam,kappa)
+        return [d.n*kappa/lam,
+                d.n/kappa + d.n*math.log(lam) - d.total('log')]
+
+    def power(y,alpha,beta):
+        r"""Score of :math:`power(\alpha,\beta)` with respect to :math:`(\alpha,\beta)`"""
+        d = _checked(_logparts.power,y,alpha,beta)
+        return [-d.n*beta/alpha,
+                d.n/beta + d.total('log') - d.n*math.log(alpha)]
+
+    def std_power(y,beta):
+        r"""Score of :math:`power(1,\beta)` with respect to :math:`\beta`"""
+        d = _checked(_logparts.std_power,y,beta)
+        return [d.n/beta + d.total('log')]
+
+    def rayleigh(y,alpha):
+        r"""Score of :math:`Rayleigh(\alpha)` with respect to :math:`\alpha`"""
+        d = _checked(_logparts.rayleigh,y,alpha)
+        return [d.total('sq')/alpha**2 - d.n/alpha]
+
+    def std_wald(y,lam):
+        r"""Score of :math:`standard-Wald(\lambda)` with respect to :math:`\lambda`"""
+        d = _checked(_logparts.std_wald,y,lam)
+        return [d.n/(2*lam) - d.relative_squares(1.)/2] # sum (y-1)^2/y
+
+    def Tdist(y,n):
+        r"""Score of :math:`t(n)` with respect to :math:`n`"""
+        d = _checked(_logparts.Tdist,y,n)
+        y2 = d.array('sq')
+        c = scipy.special.digamma((n+1)/2) - scipy.special.digamma(n/2) - 1/n
+        return [(d.n*c - float(np.log1p(y2/n).sum()) + (n+1)*float((y2/(n*(n + y2))).sum()))/2]
+
+    def uniform(y,a,b):
+        r"""Score of :math:`U(a,b)` with respect to :math:`(a,b)`"""
+        d = _checked(_logparts.uniform,y,a,b)
+        return [d.n/(b-a), -d.n/(b-a)]
+
+    def weibull(y,alpha,beta):
+        r"""Score of :math:`Weibull(\alpha,\beta)` with respect to :math:`(\alpha,\beta)`"""
+        d = _checked(_logparts.weibull,y,alpha,beta)
+        L = d.array('log')
+        yb = np.exp(beta*L)
+        return [-d.n/alpha + float(yb.sum())/alpha**2,
+                d.n/beta + d.total('log') - float((yb*L).sum())/alpha]
+
+
+class ll_value:
+    r"""Closed-form log-likelihood values library
+
+    ``ll_value.<family>(y,*params)`` equals ``ll.<family>`` for plain number
+    parameters, written on the sufficient statistics of a ``Sample`` (sum y,
+    sum y², sum log y, ...) for the exponential families, so a bound sample
+    is evaluated in O(1), and on its cached transforms for the others.
+    """
+    def beta(y,beta,gam):
+        d = _checked(_logparts.beta,y,beta,gam)
+        return (d.n*(-scipy.special.betaln(beta,gam))
+                + (beta-1)*d.total('log') + (gam-1)*d.total('log1m'))
+
+    def cauchy(y,a,alpha):
+        d = _checked(_logparts.cauchy,y,a,alpha)
+        z = (d.y - a) / alpha
+        return -d.n*math.log(alpha*math.pi) - float(np.log1p(z**2).sum())
+
+    def chi(y,n):
+        d = _checked(_logparts.chi,y,n)
+        return (-d.n*((n/2-1)*math.log(2) + scipy.special.gammaln(n/2))
+                + (n-1)*d.total('log') - d.total('sq')/2)
+
+    def chisqr(y,n):
+        d = _checked(_logparts.chisqr,y,n)
+        return ((n/2-1)*d.total('log') - d.total('y')/2
+                - d.n*(n/2*math.log(2) + scipy.special.gammaln(n/2)))
+
+    def exponential(y,lam):
+        d = _checked(_logparts.exponential,y,lam)
+        return d.n*math.log(lam) - lam*d.total('y')
+
+    def gamma(y,alpha,beta):
+        d = _checked(_logparts.gamma,y,alpha,beta)
+        return ((beta-1)*d.total('log') - d.total('y')/alpha
+                - d.n*(beta*math.log(alpha) + scipy.special.gammaln(beta)))
+
+    def Ggamma(y,alpha,beta,gam):
+        d = _checked(_logparts.Ggamma,y,alpha,beta,gam)
+        la = math.log(alpha)
+        t = np.exp(gam*(d.array('log') - la)) # (y/alpha)**gam
+        return (d.n*(math.log(gam) - gam*beta*la - scipy.special.gammaln(beta))
+                + (gam*beta-1)*d.total('log') - float(t.sum()))
+
+    def Gpareto(y,delta,kappa,gam):
+        d = _checked(_logparts.Gpareto,y,delta,kappa,gam)
+        return (float(np.log(gam + kappa/(d.y+delta)).sum())
+                - kappa*float(np.log1p(d.y/delta).sum()) - gam*d.total('y'))
+
+    def invgaussian(y,lam,mu):
+        d = _checked(_logparts.invgaussian,y,lam,mu)
+        sdev = d.relative_squares(mu) # sum (y-mu)^2/y
+        return d.n*(math.log(lam) - _LOG2PI)/2 - 1.5*d.total('log') - lam*sdev/(2*mu**2)
+
+    def invgamma(y,alpha,beta):
+        d = _checked(_logparts.invgamma,y,alpha,beta)
+        return (-(alpha+1)*d.total('log') - d.total('inv')/beta
+                - d.n*(scipy.special.gammaln(alpha) + alpha*math.log(beta)))
+
+    def laplace(y,alpha1,alpha2):
+        d = _checked(_logparts.laplace,y,alpha1,alpha2)
+        return -d.n*math.log(alpha1+alpha2) + d.total('neg')/alpha1 - d.total('pos')/alpha2
+
+    def loggamma(y,alpha,beta):
+        d = _checked(_logparts.loggamma,y,alpha,beta)
+        return (beta*d.total('y') - d.total('exp')/alpha
+                - d.n*(beta*math.log(alpha) + scipy.special.gammaln(beta)))
+
+    def loglogistic(y,lam,kappa):
+        d = _checked(_logparts.loglogistic,y,lam,kappa)
+        L = math.log(lam) + d.array('log')
+        return (d.n*math.log(lam*kappa) + (kappa-1)*(d.n*math.log(lam) + d.total('log'))
+                - 2*float(np.logaddexp(0,kappa*L).sum()))
+
+    def lognormal(y,alpha,beta):
+        d = _checked(_logparts.lognormal,y,alpha,beta)
+        sw2 = d.deviations(math.log(alpha),'log')[1] # sum log(y/alpha)^2
+        return -d.total('log') - d.n*(math.log(beta) + _LOG2PI/2) - sw2/(2*beta**2)
+
+    def logistic(y,lam,kappa):
+        d = _checked(_logparts.logistic,y,lam,kappa)
+        L = math.log(lam) + d.y
+        return (d.n*(kappa*math.log(lam) + math.log(kappa)) + kappa*d.total('y')
+                - 2*float(np.logaddexp(0,kappa*L).sum()))
+
+    def logistic_exp(y,alpha,beta):
+        d = _checked(_logparts.logistic_exp,y,alpha,beta)
+        Lm = np.log(np.expm1(alpha*d.y))
+        return (d.n*math.log(alpha*beta) + (beta-1)*float(Lm.sum()) + alpha*d.total('y')
+                - 2*float(np.logaddexp(0,beta*Lm).sum()))
+
+    def lomax(y,lam,kappa):
+        d = _checked(_logparts.lomax,y,lam,kappa)
+        return d.n*math.log(lam*kappa) - (kappa+1)*float(np.log1p(lam*d.y).sum())
+
+    def makeham(y,delta,kappa,gam):
+        d = _checked(_logparts.makeham,y,delta,kappa,gam)
+        L = math.log(kappa)
+        k = np.exp(L*d.y) # kappa**y
+        return (float(np.log(gam + delta*k).sum()) - gam*d.total('y')
+                - delta*(float(k.sum()) - d.n)/L)
+
+    def minimax(y,beta,gam):
+        d = _checked(_logparts.minimax,y,beta,gam)
+        yb = np.exp(beta*d.array('log'))
+        return (d.n*math.log(beta*gam) + (beta-1)*d.total('log')
+                + (gam-1)*float(np.log1p(-yb).sum()))
+
+    def muth(y,kappa):
+        d = _checked(_logparts.muth,y,kappa)
+        e = np.exp(kappa*d.y)
+        return (float(np.log(e - kappa).sum()) - float(e.sum())/kappa
+                + kappa*d.total('y') + d.n/kappa)
+
+    def normal(y,mu,sigma):
+        d = _checked(_logparts.normal,y,mu,sigma)
+        sd2 = d.deviations(mu)[1] # sum (y-mu)^2
+        return -d.n*(math.log(sigma) + _LOG2PI/2) - sd2/(2*sigma**2)
+
+    def pareto(y,lam,kappa):
+        d = _checked(_logparts.pareto,y,lam,kappa)
+        return d.n*(math.log(kappa) + kappa*math.log(lam)) - (kappa+1)*d.total('log')
+
+    def power(y,alpha,beta):
+        d = _checked(_logparts.power,y,alpha,beta)
+        return d.n*(math.log(beta) - beta*math.log(alpha)) + (beta-1)*d.total('log')
+
+    def std_power(y,beta):
+        d = _checked(_logparts.std_power,y,beta)
+        return d.n*math.log(beta) + (beta-1)*d.total('log')
+
+    def rayleigh(y,alpha):
+        d = _checked(_logparts.rayleigh,y,alpha)
+        return d.n*math.log(2/alpha) + d.total('log') - d.total('sq')/alpha
+
+    def std_wald(y,lam):
+        d = _checked(_logparts.std_wald,y,lam)
+        sdev = d.relative_squares(1.) # sum (y-1)^2/y
+        return d.n*(math.log(lam) - _LOG2PI)/2 - 1.5*d.total('log') - lam*sdev/2
+
+    def Tdist(y,n):
+        d = _checked(_logparts.Tdist,y,n)
+        c = scipy.special.gammaln((n+1)/2) - scipy.special.gammaln(n/2) - math.log(n*math.pi)/2
+        return d.n*c - (n+1)/2*float(np.log1p(d.array('sq')/n).sum())
+
+    def uniform(y,a,b):
+        d = _checked(_logparts.uniform,y,a,b)
+        return -d.n*math.log(b-a)
+
+    def weibull(y,alpha,beta):
+        d = _checked(_logparts.weibull,y,alpha,beta)
+        yb = np.exp(beta*d.array('log'))
+        return (d.n*math.log(beta/alpha) + (beta-1)*d.total('log')
+                - float(yb.sum())/alpha)
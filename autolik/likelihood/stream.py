@@ -0,0 +1,157 @@
+from typing import Callable, Iterable
+from itertools import islice
+import numpy as np
+from autolik.likelihood.loglik import _logparts, _data, _chunk
+
+
+def chunked(rows:Iterable,size=65536,column=None):
+    """Group a stream of observations into float arrays of at most ``size``
+
+    ``rows`` may yield numbers or records (csv rows, database tuples), then
+    ``column`` picks the observation out of each record. Only one chunk is
+    held in memory at a time.
+
+    Example:
+
+    >>> import csv
+    >>> from autolik.likelihood.stream import chunked
+    >>> with open('data.csv') as fh:
+    ...     chunks = chunked(csv.reader(fh),column=0)
+
+    """
+    rows = iter(rows)
+    while True:
+        block = list(islice(rows,size))
+        if not block:
+            return
+        if column is not None:
+            block = [record[column] for record in block]
+        yield np.asarray(block,dtype=float)
+
+
+def _chunks(source):
+    """Chunks of a source, a zero-argument callable is called for a fresh pass"""
+    return source() if callable(source) else source
+
+def _stream(parts:Callable,source,*params):
+    """Accumulate the log-likelihood chunk by chunk, in memory bounded by one chunk"""
+    total = 0.
+    for chunk in _chunks(source):
+        total = total + _chunk(parts,_data(chunk),*params)
+    return total
+
+
+class ll_stream:
+    """Streaming log-likelihood functions library
+
+    Same families and parameters as ``ll``, the data come as ``chunks``: any
+    iterable of array-like blocks of observations (a generator over a file,
+    ``chunked(csv_reader)``, a database cursor's ``fetchmany`` batches, ...)
+    or a zero-argument callable returning a fresh such iterable. The partial
+    log-likelihood of every chunk is added to a running total and the chunk
+    dropped, so the sample never has to fit in memory. With ``Dual``
+    parameters the running total is a ``Dual`` and value and gradient come
+    out of the same single pass over the data.
+
+    A generator is consumed by one evaluation, pass a callable (or a list of
+    chunks) to evaluate repeatedly, e.g. inside ``grad`` or ``mle``.
+
+    Example:
+
+    >>> import numpy as np
+    >>> import autolik
+    >>> def chunks(): # re-reads the source on every evaluation
+    ...     rng = np.random.default_rng(0)
+    ...     for _ in range(100):
+    ...         yield rng.normal(1.,2.,10**5)
+    >>> autolik.ll_stream.normal(chunks,1.,2.)
+    >>> autolik.grad(lambda mu,sigma: autolik.ll_stream.normal(chunks,mu,sigma))([1.,2.])
+
+    """
+    def beta(chunks,beta,gam):
+        return _stream(_logparts.beta,chunks,beta,gam)
+
+    def cauchy(chunks,a,alpha):
+        return _stream(_logparts.cauchy,chunks,a,alpha)
+
+    def chi(chunks,n):
+        return _stream(_logparts.chi,chunks,n)
+
+    def chisqr(chunks,n):
+        return _stream(_logparts.chisqr,chunks,n)
+
+    def exponential(chunks,lam):
+        return _stream(_logparts.exponential,chunks,lam)
+
+    def gamma(chunks,alpha,beta):
+        return _stream(_logparts.gamma,chunks,alpha,beta)
+
+    def Ggamma(chunks,alpha,beta,gam):
+        return _stream(_logparts.Ggamma,chunks,alpha,beta,gam)
+
+    def Gpareto(chunks,delta,kappa,gam):
+        return _stream(_logparts.Gpareto,chunks,delta,kappa,gam)
+
+    def invgaussian(chunks,lam,mu):
+        return _stream(_logparts.invgaussian,chunks,lam,mu)
+
+    def invgamma(chunks,alpha,beta):
+        return _stream(_logparts.invgamma,chunks,alpha,beta)
+
+    def laplace(chunks,alpha1,alpha2):
+        return _stream(_logparts.laplace,chunks,alpha1,alpha2)
+
+    def loggamma(chunks,alpha,beta):
+        return _stream(_logparts.loggamma,chunks,alpha,beta)
+
+    def loglogistic(chunks,lam,kappa):
+        return _stream(_logparts.loglogistic,chunks,lam,kappa)
+
+    def lognormal(chunks,alpha,beta):
+        return _stream(_logparts.lognormal,chunks,alpha,beta)
+
+    def logistic(chunks,lam,kappa):
+        return _stream(_logparts.logistic,chunks,lam,kappa)
+
+    def logistic_exp(chunks,alpha,beta):
+        return _stream(_logparts.logistic_exp,chunks,alpha,beta)
+
+    def lomax(chunks,lam,kappa):
+        return _stream(_logparts.lomax,chunks,lam,kappa)
+
+    def makeham(chunks,delta,kappa,gam):
+        return _stream(_logparts.makeham,chunks,delta,kappa,gam)
+
+    def minimax(chunks,beta,gam):
+        return _stream(_logparts.minimax,chunks,beta,gam)
+
+    def muth(chunks,kappa):
+        return _stream(_logparts.muth,chunks,kappa)
+
+    def normal(chunks,mu,sigma):
+        return _stream(_logparts.normal,chunks,mu,sigma)
+
+    def pareto(chunks,lam,kappa):
+        return _stream(_logparts.pareto,chunks,lam,kappa)
+
+    def power(chunks,alpha,beta):
+        return _stream(_logparts.power,chunks,alpha,beta)
+
+    def std_power(chunks,beta):
+        return _stream(_logparts.std_power,chunks,beta)
+
+    def rayleigh(chunks,alpha):
+        return _stream(_logparts.rayleigh,chunks,alpha)
+
+    def std_wald(chunks,lam):
+        return _stream(_logparts.std_wald,chunks,lam)
+
+    def Tdist(chunks,n):
+        return _stream(_logparts.Tdist,chunks,n)
+
+    def uniform(chunks,a,b):
+        return _stream(_logparts.uniform,chunks,a,b)
+
+    def weibull(chunks,alpha,beta):
+        return _stream(_logparts.weibull,chunks,alpha,beta)
+
@@ -0,0 +1,2 @@
+from autolik.optim.optimize import mle, MLEResult
+from autolik.optim.multistart import multistart, MultiStartResult
@@ -0,0 +1,163 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+import numpy as np
+from autolik.optim.optimize import MLEResult, _METHODS, _Objective, _objective, _tolist
+
+# worker side: the shared sample and the board of the best value of each run
+_SHARED = {}
+
+def _attach(data,shape,board,k):
+    """Pool initializer, map the shared sample and the board into the worker once"""
+    if isinstance(data,str) and shape is not None: # sample in shared memory
+        shm = shared_memory.SharedMemory(name=data)
+        _SHARED['data'] = shm # keep the mapping alive with the process
+        data = np.ndarray(shape,dtype=float,buffer=shm.buf)
+    _SHARED['y'] = data
+    shm = shared_memory.SharedMemory(name=board)
+    _SHARED['board'] = shm
+    _SHARED['best'] = np.ndarray((k,),dtype=float,buffer=shm.buf)
+
+
+class _Dominated(Exception):
+    """Raised inside a run once another start is clearly better"""
+
+
+class _Watched(_Objective):
+    """Objective publishing its best value on the shared board and giving up when dominated
+
+    the run is cancelled once, after ``patience`` evaluations, its value is
+    worse than the best of the other runs by more than ``margin`` relative to
+    :math:`\\max(1,|\\ell|)` and it did not gain that much over its last
+    ``patience`` evaluations
+    """
+    def __init__(self, obj:_Objective, k, best, margin, patience) -> None:
+        super().__init__(obj._fg,obj._fgh)
+        self._k = k
+        self._best = best
+        self._margin = margin
+        self._recent = deque(maxlen=patience)
+        self.x = None
+        self.f = np.inf
+
+    def _watch(self,x,f):
+        if f < self.f:
+            self.x, self.f = x, f
+            self._best[self._k] = f
+        self._recent.append(self.f)
+        if len(self._recent) < self._recent.maxlen:
+            return
+        others = np.delete(self._best,self._k).min(initial=np.inf)
+        gap = self.f - others
+        if gap > self._margin * max(1.,abs(others)) and self._recent[0] - self.f < gap:
+            raise _Dominated
+
+    def fg(self,x):
+        f, g = super().fg(x)
+        self._watch(x,f)
+        return f, g
+
+    def fgh(self,x):
+        f, g, h = super().fgh(x)
+        self._watch(x,f)
+        return f, g, h
+
+
+def _run(family_or_fn,k,start,method,gtol,ftol,maxiter,margin,patience):
+    """One start, run in a worker"""
+    obj = _Watched(_objective(family_or_fn,_SHARED['y']),k,_SHARED['best'],margin,patience)
+    try:
+        x, f, g, nit, success, message = _METHODS[method](obj,np.asarray(start,dtype=float),gtol,ftol,maxiter)
+    except _Dominated:
+        x, f, g, nit, success, message = obj.x, obj.f, None, None, False, "cancelled, dominated by another start"
+    obj._best[k] = min(obj._best[k],f)
+    return MLEResult(x, -f, None if g is None else -g, nit, obj.nfev, obj.nhev, success, message, method)
+
+
+class MultiStartResult:
+    """Outcome of a multi-start fit
+
+    ``runs`` holds the ``MLEResult`` of every start in the order of the
+    starts, ``optima`` the distinct optima reached by the converged runs,
+    best first, and ``best`` the first of them, or the run with the highest
+    log-likelihood when none converged (None when no run recorded a point).
+    ``cancelled`` counts the runs stopped because another start dominated
+    them.
+    """
+    def __init__(self, runs, optima) -> None:
+        self.runs = runs
+        self.optima = optima
+        evaluated = [r for r in runs if r.x is not None]
+        self.best = optima[0] if optima else max(evaluated,key=lambda r: r.loglik,default=None)
+        self.cancelled = sum(r.message.startswith("cancelled") for r in runs)
+
+    def __repr__(self):
+        x, loglik = (None, None) if self.best is None else (_tolist(self.best.x), self.best.loglik)
+        return (f"MultiStartResult(starts={len(self.runs)}, optima={len(self.optima)}, cancelled={self.cancelled},\n"
+                f"                 x={x}, loglik={loglik})")
+
+
+def _distinct(runs,xtol):
+    """Converged runs ranked by log-likelihood, one per optimum"""
+    optima = []
+    for r in sorted((r for r in runs if r.success),key=lambda r: -r.loglik):
+        if all(np.max(np.abs(r.x - o.x) / np.maximum(1.,np.abs(o.x))) > xtol for o in optima):
+            optima.append(r)
+    return optima
+
+
+def multistart(family_or_fn, y=None, starts=None, method='bfgs', workers=None, margin=0.01, patience=10,
+               xtol=1e-4, gtol=1e-8, ftol=2.2e-9, maxiter=200) -> MultiStartResult:
+    r"""Maximum likelihood from many starting points, run concurrently
+
+    Each row of ``starts`` is fitted by ``mle`` with ``method`` on a pool of
+    ``workers`` processes. The sample is copied once into shared memory and
+    every run publishes its best log-likelihood on a shared board. A run is
+    cancelled once, after ``patience`` evaluations, it trails the best other
+    run by more than
+
+    .. math::
+        \text{margin} \cdot \max(1, |\ell_{best}|)
+
+    and its last ``patience`` evaluations did not gain as much, so the wall
+    time stays close to that of the slowest useful run. ``family_or_fn``
+    is a built-in family name, an ``ll`` function or a picklable
+    ``fn(y,*params)`` (``fn(*params)`` when ``y`` is None).
+
+    Example:
+
+    >>> import numpy as np
+    >>> import autolik
+    >>> y = np.random.weibull(1.5,10**4)
+    >>> starts = np.random.uniform(0.2,3.,(16,3))
+    >>> fit = autolik.multistart('Ggamma',y,starts)
+    >>> fit.best.x, [o.loglik for o in fit.optima], fit.cancelled
+
+    """
+    if method not in _METHODS:
+        raise ValueError(f"unknown method {method!r}, use one of {list(_METHODS)}")
+    starts = np.atleast_2d(np.asarray(starts,dtype=float))
+    k = len(starts)
+    board = shared_memory.SharedMemory(create=True,size=k * 8)
+    np.ndarray((k,),dtype=float,buffer=board.buf)[:] = np.inf
+    data, shape, shm = y, None, None
+    if y is not None and not isinstance(y,(str,os.PathLike)): # in-memory sample, share it
+        y = np.asarray(y,dtype=float)
+        shm = shared_memory.SharedMemory(create=True,size=max(y.nbytes,1))
+        np.ndarray(y.shape,dtype=float,buffer=shm.buf)[:] = y
+        data, shape = shm.name, y.shape
+    try:
+        with ProcessPoolExecutor(min(workers or os.cpu_count(),k),initializer=_attach,
+                                 initargs=(data,shape,board.name,k)) as pool:
+            futures = {pool.submit(_run,family_or_fn,i,start,method,gtol,ftol,maxiter,margin,patience): i
+                       for i, start in enumerate(starts)}
+            runs = [None] * k
+            for future in as_completed(futures):
+                runs[futures[future]] = future.result()
+    finally:
+        for segment in (board, shm):
+            if segment is not None:
+                segment.close()
+                segment.unlink()
+    return MultiStartResult(runs,_distinct(runs,xtol))
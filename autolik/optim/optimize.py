@@ -1 +1,299 @@
-# TODO: optimization interface
\ No newline at end of file
+from typing import Callable
+from collections import deque
+import numpy as np
+from autolik.autodiff import _value_and_gradient, _value_gradient_hessian
+from autolik.likelihood.loglik import ll
+from autolik.likelihood.model import Likelihood
+
+def _tolist(x):
+    """Estimates as a list for display, None for a run stopped before its first point"""
+    return None if x is None else np.asarray(x).tolist()
+
+
+class MLEResult:
+    """Outcome of a maximum likelihood fit
+
+    ``x`` holds the estimates, ``loglik`` the maximized log-likelihood and
+    ``grad`` the score at ``x``. ``nit`` counts the iterations, ``nfev`` the
+    value-and-gradient evaluations and ``nhev`` the Hessian evaluations.
+    ``success`` and ``message`` tell how the iterations stopped.
+    """
+    def __init__(self, x, loglik, grad, nit, nfev, nhev, success, message, method) -> None:
+        self.x = x
+        self.loglik = loglik
+        self.grad = grad
+        self.nit = nit
+        self.nfev = nfev
+        self.nhev = nhev
+        self.success = success
+        self.message = message
+        self.method = method
+
+    def __repr__(self):
+        return (f"MLEResult(method={self.method!r}, success={self.success}, message={self.message!r},\n"
+                f"          x={_tolist(self.x)}, loglik={self.loglik},\n"
+                f"          nit={self.nit}, nfev={self.nfev}, nhev={self.nhev})")
+
+
+class _Objective:
+    """Negative log-likelihood with shared value/gradient evaluations and counters
+
+    points where the log-likelihood cannot be evaluated (out of the parameter
+    space, overflow, ...) get an infinite value so the line search backs off
+    """
+    _FAILURES = (AssertionError, ValueError, ZeroDivisionError, OverflowError, FloatingPointError)
+
+    def __init__(self, fg:Callable, fgh:Callable) -> None:
+        self._fg = fg
+        self._fgh = fgh
+        self.nfev = 0
+        self.nhev = 0
+
+    def fg(self,x):
+        self.nfev += 1
+        try:
+            with np.errstate(all='ignore'):
+                f, g = self._fg(x.tolist())
+        except self._FAILURES:
+            return np.inf, None
+        g = np.asarray(g,dtype=float)
+        if not (np.isfinite(f) and np.all(np.isfinite(g))):
+            return np.inf, None
+        return -f, -g
+
+    def fgh(self,x):
+        self.nfev += 1
+        self.nhev += 1
+        try:
+            with np.errstate(all='ignore'):
+                f, g, h = self._fgh(x.tolist())
+        except self._FAILURES:
+            return np.inf, None, None
+        g, h = np.asarray(g,dtype=float), np.asarray(h,dtype=float)
+        if not (np.isfinite(f) and np.all(np.isfinite(g)) and np.all(np.isfinite(h))):
+            return np.inf, None, None
+        return -f, -g, -h
+
+
+def _objective(family_or_fn,y) -> _Objective:
+    """Objective of a built-in family name, an ``ll`` function, a bound likelihood or a user log-likelihood"""
+    if isinstance(family_or_fn,str) or getattr(ll,getattr(family_or_fn,'__name__',''),None) is family_or_fn:
+        family_or_fn = Likelihood(family_or_fn,y)
+    if hasattr(family_or_fn,'value_grad_hessian'): # Likelihood, Regression, Mixture: one pass per Newton step
+        return _Objective(lambda theta: family_or_fn.value_and_grad(*theta),
+                          lambda theta: family_or_fn.value_grad_hessian(*theta))
+    if hasattr(family_or_fn,'hessian') and hasattr(family_or_fn,'value_and_grad'): # other objects with their own Hessian
+        return _Objective(lambda theta: family_or_fn.value_and_grad(*theta),
+                          lambda theta: family_or_fn.value_and_grad(*theta) + (family_or_fn.hessian(*theta),))
+    if hasattr(family_or_fn,'value_and_grad'): # ParallelLikelihood, hyper-duals through __call__
+        return _Objective(lambda theta: family_or_fn.value_and_grad(*theta),
+                          lambda theta: _value_gradient_hessian(family_or_fn,theta))
+    fn = family_or_fn if y is None else (lambda *theta: family_or_fn(y,*theta))
+    return _Objective(lambda theta: _value_and_gradient(fn,theta),
+                      lambda theta: _value_gradient_hessian(fn,theta))
+
+
+############################
+# line search
+############################
+def _line_search(obj:_Objective,x,f0,g0,d,alpha=1.,c1=1e-4,c2=0.9,maxiter=30,hessian=False):
+    r"""Step length along ``d`` satisfying the strong Wolfe conditions
+
+    .. math::
+        f(x+\alpha d) \le f(x) + c_1 \alpha \nabla f^T d, \quad |\nabla f(x+\alpha d)^T d| \le c_2 |\nabla f^T d|
+
+    expands the step until the minimum is bracketed, then shrinks the bracket
+    by safeguarded quadratic interpolation. Returns ``(alpha, f, g)``, or
+    ``None`` when no acceptable step was found. With ``hessian`` the first
+    trial step goes through ``fgh`` and ``(alpha, f, g, h)`` is returned,
+    ``h`` being that Hessian when the first step is accepted and ``None``
+    otherwise, so a Newton step accepted at once costs a single evaluation
+    """
+    dg0 = g0 @ d
+    lo = (0., f0, None, dg0, None) # step, value, gradient, directional derivative, Hessian
+    hi = None # step, value
+    a = alpha
+    for i in range(maxiter):
+        if hessian and i == 0:
+            f, g, h = obj.fgh(x + a * d)
+        else:
+            (f, g), h = obj.fg(x + a * d), None
+        if not np.isfinite(f) or f > f0 + c1 * a * dg0 or f >= lo[1]:
+            hi = (a, f)
+        else:
+            dg = g @ d
+            if abs(dg) <= -c2 * dg0:
+                return (a, f, g, h) if hessian else (a, f, g)
+            if dg * ((np.inf if hi is None else hi[0]) - lo[0]) >= 0:
+                hi = lo[:2]
+            lo = (a, f, g, dg, h)
+        if hi is None: # still descending, expand
+            a = 2 * a
+            continue
+        a = _interpolate(lo, hi)
+    if lo[0] > 0: # sufficient decrease holds, curvature did not
+        return (*lo[:3], lo[4]) if hessian else lo[:3]
+    return None
+
+def _interpolate(lo,hi):
+    """Minimizer of the quadratic through the bracket ends, kept away from them"""
+    a0, f0, _, dg0 = lo[:4]
+    a1, f1 = hi
+    width = a1 - a0
+    a = a0 + width / 2
+    if np.isfinite(f1):
+        denom = 2 * (f1 - f0 - dg0 * width)
+        if denom > 0:
+            a = a0 - dg0 * width**2 / denom
+    low, high = sorted((a0 + 0.1 * width, a1 - 0.1 * width))
+    return a if low <= a <= high else a0 + width / 2
+
+
+############################
+# methods
+############################
+def _converged(f,g,gtol):
+    return np.max(np.abs(g)) <= gtol * max(1., abs(f))
+
+def _stalled(f_old,f,ftol):
+    return f_old - f <= ftol * max(1., abs(f_old), abs(f))
+
+_GTOL = "gradient tolerance reached"
+_FTOL = "relative reduction of the log-likelihood below ftol"
+
+def _bfgs(obj:_Objective,x,gtol,ftol,maxiter):
+    """Quasi-Newton with the dense BFGS update of the inverse Hessian"""
+    f, g = obj.fg(x)
+    if g is None:
+        return x, f, g, 0, False, "log-likelihood not finite at the starting point"
+    I = np.eye(len(x))
+    H = I
+    for k in range(maxiter):
+        if _converged(f,g,gtol):
+            return x, f, g, k, True, _GTOL
+        d = -H @ g
+        if g @ d >= 0: # lost descent, restart from steepest descent
+            H, d = I, -g
+        step = _line_search(obj,x,f,g,d,alpha=1. if k else min(1.,1/np.max(np.abs(g))))
+        if step is None:
+            return x, f, g, k, False, "line search failed"
+        a, f_new, g_new = step
+        s, yv = a * d, g_new - g
+        sy = s @ yv
+        if sy > 1e-12 * np.linalg.norm(s) * np.linalg.norm(yv):
+            if k == 0:
+                H = sy / (yv @ yv) * I
+            rho = 1 / sy
+            V = I - rho * np.outer(s,yv)
+            H = V @ H @ V.T + rho * np.outer(s,s)
+        x, f_old, f, g = x + s, f, f_new, g_new
+        if _stalled(f_old,f,ftol):
+            return x, f, g, k + 1, True, _FTOL
+    return x, f, g, maxiter, _converged(f,g,gtol), "maximum number of iterations reached"
+
+def _lbfgs(obj:_Objective,x,gtol,ftol,maxiter,memory=10):
+    """Limited-memory BFGS, the inverse Hessian is applied by the two-loop recursion"""
+    f, g = obj.fg(x)
+    if g is None:
+        return x, f, g, 0, False, "log-likelihood not finite at the starting point"
+    pairs = deque(maxlen=memory) # (s, y, 1/s'y)
+    for k in range(maxiter):
+        if _converged(f,g,gtol):
+            return x, f, g, k, True, _GTOL
+        q = g.copy()
+        alphas = []
+        for s, yv, rho in reversed(pairs):
+            a = rho * (s @ q)
+            q -= a * yv
+            alphas.append(a)
+        if pairs:
+            s, yv, rho = pairs[-1]
+            q *= 1 / (rho * (yv @ yv))
+        for (s, yv, rho), a in zip(pairs, reversed(alphas)):
+            q += s * (a - rho * (yv @ q))
+        d = -q
+        if g @ d >= 0:
+            pairs.clear()
+            d = -g
+        step = _line_search(obj,x,f,g,d,alpha=1. if pairs else min(1.,1/np.max(np.abs(g))))
+        if step is None:
+            return x, f, g, k, False, "line search failed"
+        a, f_new, g_new = step
+        s, yv = a * d, g_new - g
+        sy = s @ yv
+        if sy > 1e-12 * np.linalg.norm(s) * np.linalg.norm(yv):
+            pairs.append((s, yv, 1 / sy))
+        x, f_old, f, g = x + s, f, f_new, g_new
+        if _stalled(f_old,f,ftol):
+            return x, f, g, k + 1, True, _FTOL
+    return x, f, g, maxiter, _converged(f,g,gtol), "maximum number of iterations reached"
+
+def _newton(obj:_Objective,x,gtol,ftol,maxiter):
+    """Newton's method on the exact Hessian, shifted to positive definite when needed"""
+    f, g, h = obj.fgh(x)
+    if g is None:
+        return x, f, g, 0, False, "log-likelihood not finite at the starting point"
+    for k in range(maxiter):
+        if _converged(f,g,gtol):
+            return x, f, g, k, True, _GTOL
+        d = _newton_direction(g,h)
+        step = _line_search(obj,x,f,g,d,hessian=True)
+        if step is None:
+            return x, f, g, k, False, "line search failed"
+        x, f_old = x + step[0] * d, f
+        f, g, h = step[1:] if step[3] is not None else obj.fgh(x) # the unit step already carries its Hessian
+        if g is None:
+            return x, step[1], step[2], k + 1, False, "Hessian not finite"
+        if _stalled(f_old,f,ftol):
+            return x, f, g, k + 1, True, _FTOL
+    return x, f, g, maxiter, _converged(f,g,gtol), "maximum number of iterations reached"
+
+def _newton_direction(g,h):
+    """Solve (h + tau I) d = -g with the smallest tau making the Cholesky factorization succeed"""
+    scale = np.max(np.abs(np.diag(h))) or 1.
+    tau = 0.
+    while True:
+        try:
+            L = np.linalg.cholesky(h + tau * np.eye(len(g)))
+            return -np.linalg.solve(L.T, np.linalg.solve(L,g))
+        except np.linalg.LinAlgError:
+            tau = max(2 * tau, 1e-3 * scale)
+
+_METHODS = {'bfgs': _bfgs, 'l-bfgs': _lbfgs, 'newton': _newton}
+
+
+def mle(family_or_fn, y=None, start=None, method='bfgs', gtol=1e-8, ftol=2.2e-9, maxiter=200) -> MLEResult:
+    r"""Maximum likelihood estimation driven by autolik derivatives
+
+    ``family_or_fn`` is a built-in family name (``'gamma'``), an ``ll``
+    function (``autolik.ll.gamma``), a bound ``Likelihood`` or
+    ``ParallelLikelihood`` (``y`` is then ignored) or any log-likelihood written with
+    autolik types, called as ``fn(y,*params)`` when ``y`` is given and as
+    ``fn(*params)`` otherwise. Built-in families are bound once with
+    ``Likelihood`` and use their closed-form value and score, user functions
+    get their value and gradient from one dual evaluation.
+
+    ``method`` is ``'bfgs'``, ``'l-bfgs'`` or ``'newton'`` (exact hyper-dual
+    Hessian), each step is taken by a strong Wolfe line search. The iterations
+    stop once
+
+    .. math::
+        \max_i |\partial_i \ell| \le \text{gtol} \cdot \max(1, |\ell|)
+
+    or once a step raises :math:`\ell` by less than ``ftol`` relative to
+    :math:`\max(1, |\ell|)`, the precision of the log-likelihood itself
+
+    Example:
+
+    >>> import numpy as np
+    >>> from autolik.optim import mle
+    >>> y = np.random.gamma(2.,1.5,10**5)
+    >>> fit = mle('gamma',y,start=[1.,1.])
+    >>> fit.x, fit.nfev
+
+    """
+    if method not in _METHODS:
+        raise ValueError(f"unknown method {method!r}, use one of {list(_METHODS)}")
+    obj = _objective(family_or_fn,y)
+    x, f, g, nit, success, message = _METHODS[method](obj,np.asarray(start,dtype=float),gtol,ftol,maxiter)
+    return MLEResult(x, -f, None if g is None else -g, nit, obj.nfev, obj.nhev, success, message, method)
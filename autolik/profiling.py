@@ -0,0 +1,188 @@
+import atexit
+import functools
+import json
+import math
+import os
+import sys
+import time
+import scipy.special
+import autolik.autodiff
+from autolik.Dual.benchmark import Dual
+from autolik.distributions.univariate import pdf, logpdf
+from autolik.likelihood import loglik
+from autolik.likelihood.loglik import ll
+
+# special functions counted, as (module, attribute name)
+_SPECIAL = [(scipy.special, name) for name in ('gamma','gammaln','digamma','polygamma','betaln','erf','logsumexp',
+                                                                   'log_ndtr','gammainc','gammaincc','betainc','betaincc')] \
+         + [(math, name) for name in ('lgamma','erf','gamma')]
+
+# differentiation engines of autodiff whose evaluations of f are counted
+_ENGINES = ('_F','_value_and_gradient','_rgradient','_value_gradient_hessian','_batch_value_and_gradient')
+
+_stats = {}
+_originals = [] # (owner, name, original, patched), restored on disable
+_depth = 0
+
+
+def _constructor(init):
+    @functools.wraps(init)
+    def wrapper(self,*args,**kwargs):
+        counts = _stats['constructions']
+        name = type(self).__name__
+        counts[name] = counts.get(name,0) + 1
+        init(self,*args,**kwargs)
+    return wrapper
+
+def _types(cls=Dual):
+    """Dual and every differentiable type derived from it"""
+    yield cls
+    for sub in cls.__subclasses__():
+        yield from _types(sub)
+
+def _counted(fn,label):
+    @functools.wraps(fn)
+    def wrapper(*args,**kwargs):
+        counts = _stats['special']
+        counts[label] = counts.get(label,0) + 1
+        return fn(*args,**kwargs)
+    return wrapper
+
+def _timed(fn,label):
+    @functools.wraps(fn)
+    def wrapper(*args,**kwargs):
+        start = time.perf_counter()
+        try:
+            return fn(*args,**kwargs)
+        finally:
+            entry = _stats['timings'].setdefault(label,{'calls': 0,'seconds': 0.})
+            entry['calls'] += 1
+            entry['seconds'] += time.perf_counter() - start
+    return wrapper
+
+def _evaluating(engine,label):
+    @functools.wraps(engine)
+    def wrapper(f,*args,**kwargs):
+        entry = _stats['evaluations'].setdefault(label,{'calls': 0,'f_evals': 0})
+        entry['calls'] += 1
+        def counted(*theta):
+            entry['f_evals'] += 1
+            return f(*theta)
+        return engine(counted,*args,**kwargs)
+    return wrapper
+
+
+def _patch(owner,name,patched):
+    original = owner.__dict__[name] if isinstance(owner,type) else getattr(owner,name)
+    setattr(owner,name,patched)
+    _originals.append((owner,name,original,patched))
+    if not isinstance(owner,type): # module-level aliases, from autolik.autodiff import _value_and_gradient
+        for module in list(sys.modules.values()):
+            if module is not owner and getattr(module,'__name__','').startswith('autolik') \
+               and getattr(module,name,None) is original:
+                setattr(module,name,patched)
+                _originals.append((module,name,original,patched))
+
+def _install():
+    for cls in _types():
+        if '__init__' in vars(cls): # the types set their fields without chaining to super().__init__
+            _patch(cls,'__init__',_constructor(cls.__init__))
+    for module, name in _SPECIAL:
+        _patch(module,name,_counted(getattr(module,name),f'{module.__name__}.{name}'))
+    for name in _ENGINES:
+        _patch(autolik.autodiff,name,_evaluating(getattr(autolik.autodiff,name),name))
+    for library in (ll, pdf, logpdf):
+        for name, fn in list(vars(library).items()):
+            if callable(fn) and not name.startswith('_'):
+                _patch(library,name,_timed(fn,f'{library.__name__}.{name}'))
+    _patch(loglik,'_sum',_timed(loglik._sum,'sum'))
+
+def _uninstall():
+    restore = {id(patched): (patched, original) for _, _, original, patched in _originals}
+    while _originals:
+        owner, name, original, _ = _originals.pop()
+        setattr(owner,name,original)
+    for module in list(sys.modules.values()): # modules first imported while profiling bound the wrappers
+        if getattr(module,'__name__','').startswith('autolik'):
+            for name, value in list(vars(module).items()):
+                if id(value) in restore and restore[id(value)][0] is value:
+                    setattr(module,name,restore[id(value)][1])
+
+
+def reset():
+    """Clear the counters"""
+    _stats.clear()
+    _stats.update(constructions={}, special={}, evaluations={}, timings={})
+
+def enable():
+    """Start counting, nested calls are matched by as many ``disable``"""
+    global _depth
+    if _depth == 0:
+        if not _stats:
+            reset()
+        _install()
+    _depth += 1
+
+def disable():
+    """Stop counting and restore the uninstrumented functions"""
+    global _depth
+    _depth = max(_depth - 1,0)
+    if _depth == 0:
+        _uninstall()
+
+def report():
+    """Counters as a dict
+
+    ``constructions`` Dual objects created by type, ``special`` calls of each
+    special function, ``evaluations`` calls of each differentiation engine and
+    the evaluations of ``f`` they made, ``timings`` calls and cumulated
+    seconds of every ``ll``, ``pdf`` and ``logpdf`` function and of the sums
+    over the observations
+    """
+    return json.loads(json.dumps(_stats))
+
+
+class profile:
+    """Context manager collecting the profiling counters of its block
+
+    Instrumentation is installed on entry by swapping the counted functions
+    for wrappers and removed on exit, so nothing is left on the hot path
+    when profiling is off. Setting the environment variable
+    ``AUTOLIK_PROFILE=1`` profiles the whole process and prints the report
+    at exit, ``AUTOLIK_PROFILE=<file>.json`` writes it to that file.
+
+    Example:
+
+    >>> import numpy as np
+    >>> import autolik
+    >>> y = np.random.gamma(2.,1.5,10**5)
+    >>> with autolik.profile() as prof:
+    ...     autolik.optim.mle('gamma',y,start=[1.,1.],method='newton')
+    >>> prof.report['special'], prof.report['timings']['ll.gamma']
+
+    """
+    def __init__(self) -> None:
+        self.report = None
+
+    def __enter__(self):
+        if _depth == 0:
+            reset()
+        enable()
+        return self
+
+    def __exit__(self,*exc):
+        disable()
+        self.report = report()
+
+
+def _at_exit(target):
+    disable()
+    if target.endswith('.json'):
+        with open(target,'w') as fh:
+            json.dump(report(),fh,indent=1)
+    else:
+        print(json.dumps(report(),indent=1),file=sys.stderr)
+
+if os.environ.get('AUTOLIK_PROFILE','').strip() not in ('','0'):
+    enable()
+    atexit.register(_at_exit,os.environ['AUTOLIK_PROFILE'].strip())
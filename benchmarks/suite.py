@@ -0,0 +1,256 @@
+"""Autolik benchmark suite
+
+Times the ``Dual`` operators, every ``ll.<family>`` value and gradient over
+a range of sample sizes and for every differentiation engine, and the
+Hessians, then writes the timings to a JSON file so that runs of two
+releases on the same machine can be compared.
+
+Example:
+
+>>> python benchmarks/suite.py --out bench.json
+>>> python benchmarks/suite.py --quick --families normal gamma --out new.json
+>>> python benchmarks/suite.py --compare bench.json new.json
+>>> python benchmarks/suite.py --check-import 0.5
+
+"""
+import argparse
+import datetime
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+import numpy as np
+import scipy
+
+sys.path.insert(0,os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import autolik
+from autolik.autodiff import _value_and_gradient, _rgradient, _value_gradient_hessian
+
+# sample generator in the support of each family and the parameters it is evaluated at
+CASES = {
+    'beta': (lambda rng,n: rng.uniform(0.05,0.95,n), (2.,3.)),
+    'cauchy': (lambda rng,n: rng.standard_cauchy(n), (0.3,1.5)),
+    'chi': (lambda rng,n: rng.uniform(0.1,3,n), (3.,)),
+    'chisqr': (lambda rng,n: rng.chisquare(4.,n), (4.,)),
+    'exponential': (lambda rng,n: rng.exponential(1/1.3,n), (1.3,)),
+    'gamma': (lambda rng,n: rng.gamma(2.2,1.5,n), (1.5,2.2)),
+    'Ggamma': (lambda rng,n: rng.gamma(2.2,1.5,n), (1.5,2.2,1.3)),
+    'Gpareto': (lambda rng,n: rng.uniform(0.1,5,n), (1.5,0.7,0.4)),
+    'invgaussian': (lambda rng,n: rng.wald(2.2,1.5,n), (1.5,2.2)),
+    'invgamma': (lambda rng,n: 1/rng.gamma(1.5,2.2,n), (1.5,2.2)),
+    'laplace': (lambda rng,n: rng.laplace(0,2,n), (1.5,2.2)),
+    'loggamma': (lambda rng,n: np.log(rng.gamma(2.2,1.5,n)), (1.5,2.2)),
+    'loglogistic': (lambda rng,n: rng.uniform(0.1,5,n), (1.5,2.2)),
+    'lognormal': (lambda rng,n: rng.lognormal(0.4,0.8,n), (1.5,0.8)),
+    'logistic': (lambda rng,n: rng.logistic(0,1,n), (1.5,2.2)),
+    'logistic_exp': (lambda rng,n: rng.uniform(0.1,2,n), (1.5,2.2)),
+    'lomax': (lambda rng,n: rng.pareto(2.2,n) + 0.01, (1.5,2.2)),
+    'makeham': (lambda rng,n: rng.uniform(0.1,3,n), (0.5,1.7,0.3)),
+    'minimax': (lambda rng,n: rng.uniform(0.05,0.95,n), (1.5,2.2)),
+    'muth': (lambda rng,n: rng.uniform(0.1,3,n), (0.6,)),
+    'normal': (lambda rng,n: rng.normal(0.3,1.7,n), (0.3,1.7)),
+    'pareto': (lambda rng,n: 1.1 + rng.pareto(2.2,n), (1.,2.2)),
+    'power': (lambda rng,n: rng.uniform(0.1,1.9,n), (2.,2.2)),
+    'std_power': (lambda rng,n: rng.uniform(0.05,0.95,n), (2.2,)),
+    'rayleigh': (lambda rng,n: rng.rayleigh(1.,n), (1.5,)),
+    'std_wald': (lambda rng,n: rng.wald(1.,1.5,n), (1.5,)),
+    'Tdist': (lambda rng,n: rng.standard_t(4.5,n), (4.5,)),
+    'uniform': (lambda rng,n: rng.uniform(-1,2,n), (-1.5,2.5)),
+    'weibull': (lambda rng,n: rng.weibull(2.2,n), (1.5,2.2)),
+}
+
+SIZES = (10**2, 10**3, 10**4, 10**5, 10**6)
+QUICK_SIZES = (10**2, 10**4)
+
+
+############################
+# timing
+############################
+def measure(fn,min_time=0.2,repeat=5):
+    """Best time of one call of ``fn`` in seconds
+
+    the number of calls per sample is raised until a sample lasts ``min_time``
+    / ``repeat``, the minimum over the samples is the least noisy estimate
+    """
+    timer = timeit.Timer(fn)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time / repeat or number >= 10**6:
+            break
+        number *= 2 if elapsed == 0 else max(2, math.ceil(min_time / repeat / elapsed))
+    samples = [elapsed] + timer.repeat(repeat - 1, number)
+    return {'seconds': min(samples) / number, 'number': number, 'repeat': repeat}
+
+def _fd_gradient(f,at,h=1e-6):
+    """Central finite-difference gradient, 2p evaluations"""
+    g = []
+    for j, x in enumerate(at):
+        step = h * max(1., abs(x))
+        up, down = list(at), list(at)
+        up[j], down[j] = x + step, x - step
+        g.append((f(*up) - f(*down)) / (2 * step))
+    return g
+
+
+############################
+# benchmarks
+############################
+def bench_dual_ops(min_time):
+    """Per-operation cost of scalar and array Dual arithmetic"""
+    records = []
+    x, y = autolik.Dual(1.3,np.array([1.,0.])), autolik.Dual(0.7,np.array([0.,1.]))
+    a = autolik.DualArray(np.linspace(0.5,1.5,1000),np.ones((1,1000)))
+    ops = {
+        'add': lambda u,v: u + v, 'sub': lambda u,v: u - v, 'mul': lambda u,v: u * v,
+        'div': lambda u,v: u / v, 'pow': lambda u,v: u ** v, 'add_float': lambda u,v: u + 2.,
+        'mul_float': lambda u,v: u * 2., 'pow_float': lambda u,v: u ** 2.,
+        'exp': lambda u,v: u.exp(), 'log': lambda u,v: u.log(), 'sqrt': lambda u,v: u.sqrt(),
+        'sin': lambda u,v: u.sin(), 'gamma': lambda u,v: u.gamma(), 'lgamma': lambda u,v: u.lgamma(),
+        'log1p': lambda u,v: u.log1p(), 'tanh': lambda u,v: u.tanh(), 'erf': lambda u,v: u.erf(),
+        'digamma': lambda u,v: u.digamma(), 'betaln': lambda u,v: u.betaln(v),
+    }
+    for name, op in ops.items():
+        for kind, (u, v) in (('Dual', (x, y)), ('DualArray[1000]', (a, a))):
+            t = measure(lambda: op(u,v),min_time)
+            records.append({'group': 'dual_ops', 'name': name, 'type': kind, **t})
+    return records
+
+def _engines(family,y,params):
+    """Callables computing the log-likelihood value, gradient or Hessian of one family on y"""
+    fn = getattr(autolik.ll,family)
+    f = lambda *theta: fn(y,*theta)
+    L = autolik.Likelihood(family,y)
+    C = autolik.compile(f,len(params))
+    L.value_and_grad(*params), C.value_and_grad(*params) # cached sums, trace
+    return {
+        'value': lambda: f(*params),
+        'grad_forward': lambda: _value_and_gradient(f,params),
+        'grad_reverse': lambda: _rgradient(f,params),
+        'grad_finite_difference': lambda: _fd_gradient(f,params),
+        'grad_closed_form': lambda: L.value_and_grad(*params),
+        'grad_compiled': lambda: C.value_and_grad(*params),
+        'hessian': lambda: _value_gradient_hessian(f,params),
+    }
+
+def bench_families(families,sizes,modes,min_time,seed=0):
+    """Value, gradient (every engine) and Hessian of each family at each sample size"""
+    records = []
+    for family in families:
+        sampler, params = CASES[family]
+        for n in sizes:
+            y = sampler(np.random.default_rng(seed),n)
+            engines = _engines(family,y,list(params))
+            for mode in modes:
+                try:
+                    t = measure(engines[mode],min_time)
+                except Exception as e: # an engine without support for a family is recorded, not fatal
+                    t = {'seconds': None, 'error': f'{type(e).__name__}: {e}'}
+                records.append({'group': 'll', 'family': family, 'n': n, 'mode': mode, **t})
+                print(f"{family:>12} n={n:<8} {mode:<24} {_format(t['seconds'])}",file=sys.stderr)
+    return records
+
+
+_IMPORT = """
+import sys, time
+start = time.perf_counter()
+import autolik
+print(time.perf_counter() - start, int('scipy' in sys.modules), int('autolik.likelihood.loglik' in sys.modules))
+"""
+
+def bench_import(runs=7):
+    """Time of ``import autolik`` in fresh interpreters, and whether it pulled in scipy or the likelihood modules"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None,[root, os.environ.get('PYTHONPATH')])))
+    env.pop('AUTOLIK_PROFILE',None)
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable,'-c',_IMPORT],cwd=root,env=env,capture_output=True,text=True,check=True).stdout.split()
+        samples.append(float(out[0]))
+    return {'group': 'import', 'name': 'import autolik', 'seconds': statistics.median(samples),
+            'best': min(samples), 'runs': runs, 'imports_scipy': bool(int(out[1])), 'imports_likelihood': bool(int(out[2]))}
+
+def check_import(max_seconds):
+    """Import-time regression check, exits non-zero when ``import autolik`` got eager or slow"""
+    record = bench_import()
+    problems = [f'{name} imported by `import autolik`' for name, key in
+                (('scipy', 'imports_scipy'), ('autolik.likelihood', 'imports_likelihood')) if record[key]]
+    if max_seconds is not None and record['seconds'] > max_seconds:
+        problems.append(f"import took {_format(record['seconds'])}, limit {_format(max_seconds)}")
+    print(f"import autolik: {_format(record['seconds'])} (median of {record['runs']})",file=sys.stderr)
+    for problem in problems:
+        print(f'FAIL: {problem}',file=sys.stderr)
+    sys.exit(1 if problems else 0)
+
+
+############################
+# reports
+############################
+def _format(seconds):
+    if seconds is None:
+        return 'failed'
+    for unit, scale in (('s', 1.), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f'{seconds / scale:8.2f} {unit}'
+    return f'{seconds / 1e-9:8.2f} ns'
+
+def environment():
+    """Versions and machine the timings were taken on"""
+    return {
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'scipy': scipy.__version__,
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'cpu_count': os.cpu_count(),
+    }
+
+def _key(record):
+    return tuple(record.get(k) for k in ('group', 'name', 'type', 'family', 'n', 'mode'))
+
+def compare(old,new):
+    """Print new/old time ratios of the measurements two result files share"""
+    with open(old) as fh:
+        before = {_key(r): r['seconds'] for r in json.load(fh)['results']}
+    with open(new) as fh:
+        after = json.load(fh)['results']
+    for record in after:
+        t0, t1 = before.get(_key(record)), record['seconds']
+        if t0 and t1:
+            label = ' '.join(str(v) for v in _key(record) if v is not None)
+            print(f'{label:<60} {_format(t0)} -> {_format(t1)}  x{t0 / t1:6.2f}')
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--out',default='bench.json',help='JSON file the results are written to')
+    parser.add_argument('--families',nargs='+',default=list(CASES),choices=list(CASES),metavar='FAMILY')
+    parser.add_argument('--sizes',nargs='+',type=int,default=None,help=f'sample sizes, default {SIZES}')
+    parser.add_argument('--modes',nargs='+',default=None,metavar='MODE',help='value, grad_forward, grad_reverse, grad_finite_difference, grad_closed_form, grad_compiled, hessian')
+    parser.add_argument('--quick',action='store_true',help=f'sizes {QUICK_SIZES} and shorter timings')
+    parser.add_argument('--skip-ops',action='store_true',help='leave out the Dual operator timings')
+    parser.add_argument('--compare',nargs=2,metavar=('OLD','NEW'),help='compare two result files and exit')
+    parser.add_argument('--check-import',nargs='?',type=float,const=-1.,metavar='MAX_SECONDS',
+                        help='fail if import autolik loads scipy or the likelihood modules, or takes longer than MAX_SECONDS')
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(*args.compare)
+        return
+    if args.check_import is not None:
+        check_import(None if args.check_import < 0 else args.check_import)
+    min_time = 0.05 if args.quick else 0.2
+    sizes = args.sizes or (QUICK_SIZES if args.quick else SIZES)
+    modes = args.modes or list(_engines('normal',np.ones(2),[0.,1.]))
+    results = [bench_import()] + ([] if args.skip_ops else bench_dual_ops(min_time))
+    results += bench_families(args.families,sizes,modes,min_time)
+    with open(args.out,'w') as fh:
+        json.dump({'environment': environment(), 'results': results},fh,indent=1)
+    print(f'{len(results)} timings written to {args.out}',file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -10,23 +10,19 @@ def z(x,y):
     else:
         return x * np.exp(-x**2 - y**2)
 
-z_grad = autolik.grad(z)
-
 x = np.linspace(-2,2,100)
 y = np.linspace(-2,2,100)
 X,Y = np.meshgrid(x,y)
 
-# data
-Z = np.array([[z(i,j) for i in x] for j in y])
+# data, every grid point in one batched evaluation
+Z = autolik.batch_F(z,np.column_stack([X.ravel(),Y.ravel()])).reshape(X.shape)
 
 vx = np.linspace(-2,2,50)
 vy = np.linspace(-2,2,50)
 vX,vY = np.meshgrid(vx,vy)
 
 # gradient vectors
-Z_grad = np.array([z_grad([i,j]) for i in vx for j in vy])
-# Z_grad = np.array(autolik.gradient(z,at=[[i,j] for i in x for j in y]))
-# print(Z_grad)
+Z_grad = autolik.batch_gradient(z,np.column_stack([vX.ravel(),vY.ravel()]))
 
 ax = plt.axes()
 ax.contourf(X,Y,Z,levels=50, cmap=cm.jet, alpha = 0.7)
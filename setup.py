@@ -8,7 +8,7 @@ setup(
     author='Langyan Zang',
     author_email="langyan.zang@uzh.ch",
     packages=['autolik', 'autolik.Dual', 'autolik.distributions', 'autolik.likelihood', 'autolik.optim'],
-    install_requires=['scipy'],
+    install_requires=['numpy', 'scipy'],
     keywords=['Automatic differentiation', 'gradients',
               'likelihood', 'optimization','Python', 
               'Scipy'],
@@ -0,0 +1,77 @@
+"""Valid parameters and samples of every built-in family, shared by the tests"""
+import numpy as np
+from autolik._lazy import scipy
+
+_rng = np.random.default_rng(20240517)
+_unit = _rng.uniform(0.05,0.95,400)
+_positive = _rng.gamma(2.,1.,400) + 0.05
+_real = _rng.normal(0.3,1.5,400)
+
+# family: (parameters, sample inside the support)
+FAMILIES = {
+    'beta': ((2.,3.), _unit),
+    'cauchy': ((0.5,1.5), _real),
+    'chi': ((3.,), _positive),
+    'chisqr': ((4.,), _positive),
+    'exponential': ((0.7,), _positive),
+    'gamma': ((1.5,2.), _positive),
+    'Ggamma': ((1.5,2.,1.3), _positive),
+    'Gpareto': ((1.,0.5,0.3), _positive),
+    'invgaussian': ((2.,1.5), _positive),
+    'invgamma': ((3.,0.5), _positive),
+    'laplace': ((1.,2.), _real),
+    'loggamma': ((1.5,2.), _real),
+    'loglogistic': ((0.8,2.), _positive),
+    'lognormal': ((1.5,0.6), _positive),
+    'logistic': ((0.8,2.), _real),
+    'logistic_exp': ((0.7,1.5), _positive),
+    'lomax': ((0.5,3.), _positive),
+    'makeham': ((0.5,1.5,0.3), _positive),
+    'minimax': ((1.5,2.), _unit),
+    'muth': ((0.6,), _positive),
+    'normal': ((0.5,2.), _real),
+    'pareto': ((0.04,3.), _positive),
+    'power': ((12.,2.), _positive),
+    'std_power': ((1.5,), _unit),
+    'rayleigh': ((2.,), _positive),
+    'std_wald': ((1.5,), _positive),
+    'Tdist': ((5.,), _real),
+    'uniform': ((-6.,9.), _real),
+    'weibull': ((1.5,2.), _positive),
+}
+
+# one invalid parameter point per family
+INVALID = {
+    'beta': (-1.,3.), 'cauchy': (0.5,-1.), 'chi': (-3.,), 'chisqr': (-4.,), 'exponential': (-0.7,),
+    'gamma': (1.5,-2.), 'Ggamma': (1.5,2.,-1.3), 'Gpareto': (-1.,0.5,0.3), 'invgaussian': (2.,-1.),
+    'invgamma': (-3.,0.5), 'laplace': (-0.5,1.), 'loggamma': (1.5,-2.), 'loglogistic': (-0.8,2.),
+    'lognormal': (1.5,-0.6), 'logistic': (0.8,-2.), 'logistic_exp': (0.7,-1.5), 'lomax': (-0.5,3.),
+    'makeham': (0.5,0.5,0.3), 'minimax': (1.5,-2.), 'muth': (1.5,), 'normal': (0.5,-2.),
+    'pareto': (-0.04,3.), 'power': (12.,-2.), 'std_power': (-1.5,), 'rayleigh': (-2.,),
+    'std_wald': (-1.5,), 'Tdist': (-5.,), 'weibull': (1.5,-2.),
+}
+
+# family: scipy.stats distribution with the same density at the given parameters
+def reference(family,*p):
+    stats = scipy.stats
+    return {
+        'beta': lambda b,g: stats.beta(b,g),
+        'cauchy': lambda a,s: stats.cauchy(a,s),
+        'chi': lambda n: stats.chi(n),
+        'chisqr': lambda n: stats.chi2(n),
+        'exponential': lambda lam: stats.expon(scale=1/lam),
+        'gamma': lambda a,b: stats.gamma(b,scale=a),
+        'invgaussian': lambda lam,mu: stats.invgauss(mu/lam,scale=lam),
+        'invgamma': lambda a,b: stats.invgamma(a,scale=1/b),
+        'lognormal': lambda a,b: stats.lognorm(b,scale=a),
+        'lomax': lambda lam,k: stats.lomax(k,scale=1/lam),
+        'normal': lambda m,s: stats.norm(m,s),
+        'pareto': lambda lam,k: stats.pareto(k,scale=lam),
+        'rayleigh': lambda a: stats.rayleigh(scale=np.sqrt(a/2)),
+        'Tdist': lambda n: stats.t(n),
+        'uniform': lambda a,b: stats.uniform(a,b - a),
+        'weibull': lambda a,b: stats.weibull_min(b,scale=a**(1/b)),
+    }[family](*p)
+
+REFERENCED = ['beta','cauchy','chi','chisqr','exponential','gamma','invgaussian','invgamma','lognormal',
+              'lomax','normal','pareto','rayleigh','Tdist','uniform','weibull']
@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+import autolik
+from autolik import Dual
+
+_y = np.random.default_rng(11).gamma(2.,1.5,500)
+
+
+def _special(x,y):
+    return (x.lgamma() + (x*y).tanh() + y.erf() + (x/y).atan() + x.digamma()*y
+            + (y*y).log1p() + (-x).expm1() + (x+y).sqrt().sin() + y.cos()*x.exp().log())
+
+def _loglik(alpha,beta):
+    return autolik.ll.gamma(_y,alpha,beta)
+
+def _value(f,at):
+    return float(f(*(Dual(float(a),0.) for a in at)).real)
+
+def _central(f,at,h=1e-6):
+    at = np.asarray(at,dtype=float)
+    out = []
+    for i in range(len(at)):
+        step = h * max(1.,abs(at[i]))
+        e = np.zeros(len(at)); e[i] = step
+        out.append((_value(f,at + e) - _value(f,at - e)) / (2*step))
+    return np.array(out)
+
+_POINTS = [[1.3,0.7],[2.5,1.9],[0.4,3.2]]
+
+
+@pytest.mark.parametrize('at',_POINTS)
+def test_forward_gradient_matches_differences(at):
+    np.testing.assert_allclose(autolik.grad(_special)(at),_central(_special,at),rtol=1e-6,atol=1e-7)
+
+
+def test_gradient_lists_agree_with_the_per_point_function():
+    np.testing.assert_allclose(autolik.gradient(_special,_POINTS),[autolik.grad(_special)(p) for p in _POINTS])
+
+
+@pytest.mark.parametrize('at',_POINTS)
+def test_reverse_gradient_matches_the_forward_gradient(at):
+    np.testing.assert_allclose(autolik.rgrad(_special)(at),autolik.grad(_special)(at),rtol=1e-12,atol=1e-14)
+    np.testing.assert_allclose(autolik.rgrad(_loglik)(at),autolik.grad(_loglik)(at),rtol=1e-12)
+
+
+def test_reverse_gradient_lists_agree_with_the_forward_lists():
+    np.testing.assert_allclose(autolik.rgradient(_special,_POINTS),autolik.gradient(_special,_POINTS),rtol=1e-12)
+
+
+def test_hessian_matches_differences_of_the_gradient():
+    at = np.array([1.3,0.7])
+    H = np.asarray(autolik.hessian(_special)(at))
+    g = autolik.grad(_special)
+    reference = np.column_stack([(np.array(g(at + e)) - np.array(g(at - e))) / 2e-6 for e in 1e-6*np.eye(2)])
+    np.testing.assert_allclose(H,H.T,rtol=1e-12)
+    np.testing.assert_allclose(H,reference,rtol=1e-5,atol=1e-6)
+
+
+def test_batch_evaluation_matches_point_by_point():
+    rng = np.random.default_rng(3)
+    at = np.column_stack([rng.uniform(1.,3.,37),rng.uniform(0.5,2.,37)])
+    values = autolik.batch_F(_loglik,at,chunksize=10)
+    grads = autolik.batch_gradient(_loglik,at)
+    np.testing.assert_allclose(values,[_loglik(*p) for p in at],rtol=1e-12)
+    np.testing.assert_allclose(grads,[autolik.grad(_loglik)(p) for p in at],rtol=1e-10)
+
+
+def test_compiled_replay_matches_the_traced_function():
+    L = autolik.compile(_loglik,2)
+    for at in [[2.,1.5],[1.2,3.],[4.,0.6]]:
+        assert L(*at) == pytest.approx(_loglik(*at),rel=1e-12)
+        value, grad = L.value_and_grad(*at)
+        assert value == pytest.approx(_loglik(*at),rel=1e-12)
+        np.testing.assert_allclose(grad,autolik.grad(_loglik)(at),rtol=1e-10)
+        np.testing.assert_allclose(L.grad(*at),grad,rtol=1e-14)
+
+
+def test_value_and_grad_wrt_and_cache():
+    value, grad = autolik.value_and_grad(_loglik)([2.,1.5])
+    assert value == pytest.approx(_loglik(2.,1.5),rel=1e-14)
+    np.testing.assert_allclose(grad,autolik.grad(_loglik)([2.,1.5]),rtol=1e-14)
+
+    _, partial = autolik.value_and_grad(_loglik,wrt=[1,0])([2.,1.5])
+    np.testing.assert_allclose(partial,grad[::-1],rtol=1e-14)
+
+    vg = autolik.value_and_grad(_loglik,cache=4)
+    assert vg([2.,1.5]) == vg(np.array([2.,1.5])) == (value,grad)
+    assert vg.cache_info().hits == 1
+    vg.cache_clear()
+    assert vg.cache_info().currsize == 0
+
+
+def test_value_and_grad_wrt_negative_and_invalid_indices():
+    f = lambda a,b: a*a + b
+    assert autolik.value_and_grad(f,wrt=[-1])([2.,3.])[1] == [1.]
+    assert autolik.value_and_grad(f,wrt=-2)([2.,3.])[1] == [4.]
+    with pytest.raises(IndexError):
+        autolik.value_and_grad(f,wrt=[2])([2.,3.])
+    with pytest.raises(IndexError):
+        autolik.value_and_grad(f,wrt=[-3])([2.,3.])
+    with pytest.raises(ValueError):
+        autolik.value_and_grad(f,wrt=[1,-1])([2.,3.])
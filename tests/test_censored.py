@@ -0,0 +1,114 @@
+import numpy as np
+import pytest
+import autolik
+from autolik.distributions.univariate import logpdf, logcdf, logsf
+from families import FAMILIES, INVALID, REFERENCED, reference
+
+
+@pytest.mark.parametrize('family',REFERENCED)
+def test_logcdf_logsf_match_scipy(family):
+    params, y = FAMILIES[family]
+    dist = reference(family,*params)
+    np.testing.assert_allclose(getattr(logcdf,family)(y,*params),dist.logcdf(y),rtol=1e-7,atol=1e-12)
+    np.testing.assert_allclose(getattr(logsf,family)(y,*params),dist.logsf(y),rtol=1e-7,atol=1e-12)
+
+
+@pytest.mark.parametrize('family',FAMILIES)
+def test_logcdf_logsf_are_complementary(family):
+    params, y = FAMILIES[family]
+    F = np.exp(getattr(logcdf,family)(y,*params))
+    S = np.exp(getattr(logsf,family)(y,*params))
+    np.testing.assert_allclose(F + S,1.,rtol=1e-7)
+
+
+@pytest.mark.parametrize('family',INVALID)
+def test_logcdf_logsf_and_censored_check_parameters(family):
+    y = FAMILIES[family][1]
+    params = INVALID[family]
+    status = np.resize([1,0,-1],len(y))
+    for fn in (lambda: getattr(logcdf,family)(y,*params), lambda: getattr(logsf,family)(y,*params),
+               lambda: getattr(autolik.ll_censored,family)(y,status,*params),
+               lambda: getattr(autolik.ll_truncated,family)(y,float(np.min(y)),None,*params)):
+        with pytest.raises(AssertionError,match="Wrong paramterization"):
+            fn()
+
+
+def test_tails_stay_finite():
+    assert logsf.normal(40.,0.,1.) == pytest.approx(autolik._lazy.scipy.stats.norm.logsf(40.),rel=1e-10)
+    assert logcdf.normal(-40.,0.,1.) == pytest.approx(autolik._lazy.scipy.stats.norm.logcdf(-40.),rel=1e-10)
+    assert np.isfinite(logsf.gamma(2000.,1.,2.)) and np.isfinite(logcdf.cauchy(-1e300,0.,1.))
+
+
+@pytest.mark.parametrize('family',REFERENCED)
+def test_censored_matches_scipy(family):
+    params, y = FAMILIES[family]
+    status = np.resize([1,0,-1],len(y))
+    dist = reference(family,*params)
+    expected = (dist.logpdf(y[status == 1]).sum() + dist.logsf(y[status == 0]).sum()
+                + dist.logcdf(y[status == -1]).sum())
+    assert getattr(autolik.ll_censored,family)(y,status,*params) == pytest.approx(expected,rel=1e-8)
+
+
+@pytest.mark.parametrize('status',[[1,0,2],[1,0,np.nan],[1,0,0.5]])
+def test_unknown_status_codes_are_rejected(status):
+    with pytest.raises(ValueError):
+        autolik.ll_censored.gamma([1.,2.,3.],status,1.5,2.)
+
+
+def test_boolean_status_codes_are_accepted():
+    y = [1.,2.,3.]
+    assert autolik.ll_censored.gamma(y,[True,False,True],1.5,2.) == autolik.ll_censored.gamma(y,[1,0,1],1.5,2.)
+
+
+@pytest.mark.parametrize('family',REFERENCED)
+def test_truncated_matches_scipy(family):
+    params, y = FAMILIES[family]
+    lower, upper = np.quantile(y,0.1), np.quantile(y,0.9)
+    inside = y[(lower < y) & (y < upper)]
+    dist = reference(family,*params)
+    expected = (dist.logpdf(inside) - np.log(dist.cdf(upper) - dist.cdf(lower))).sum()
+    assert getattr(autolik.ll_truncated,family)(inside,lower,upper,*params) == pytest.approx(expected,rel=1e-8)
+    entry = inside / 2 # delayed entry, one bound per observation
+    expected = (dist.logpdf(inside) - dist.logsf(entry)).sum()
+    assert getattr(autolik.ll_truncated,family)(inside,entry,None,*params) == pytest.approx(expected,rel=1e-8)
+
+
+@pytest.mark.parametrize('lower, upper',[(-42.,-40.),(40.,42.),(-1.,0.5)])
+def test_truncated_normal_in_both_tails(lower, upper):
+    truncnorm = autolik._lazy.scipy.stats.truncnorm
+    y = np.linspace(lower,upper,7)[1:-1]
+    value = autolik.ll_truncated.normal(y,lower,upper,0.,1.)
+    assert value == pytest.approx(truncnorm(lower,upper).logpdf(y).sum(),rel=1e-10)
+    g = autolik.grad(lambda mu,sigma: autolik.ll_truncated.normal(y,lower,upper,mu,sigma))([0.,1.])
+    f = lambda mu,sigma: truncnorm((lower - mu)/sigma,(upper - mu)/sigma,mu,sigma).logpdf(y).sum()
+    h = 1e-6
+    fd = [(f(h,1.) - f(-h,1.))/(2*h), (f(0.,1. + h) - f(0.,1. - h))/(2*h)]
+    np.testing.assert_allclose(g,fd,rtol=1e-5)
+
+
+@pytest.mark.parametrize('family',['gamma','weibull','normal','beta','Tdist'])
+def test_censored_gradient_matches_finite_differences(family):
+    params, y = FAMILIES[family]
+    status = np.resize([1,0,-1],len(y))
+    f = lambda *p: getattr(autolik.ll_censored,family)(y,status,*p)
+    g = autolik.grad(f)(list(params))
+    for i, gi in enumerate(g):
+        h = 1e-6 * max(1.,abs(params[i]))
+        up, down = list(params), list(params)
+        up[i] += h
+        down[i] -= h
+        assert gi == pytest.approx((f(*up) - f(*down))/(2*h),rel=1e-5,abs=1e-6)
+
+
+@pytest.mark.parametrize('family',['gamma','chi','chisqr','beta','invgamma'])
+def test_censored_and_truncated_compile(family):
+    params, y = FAMILIES[family]
+    status = np.resize([1,0,-1],len(y))
+    lower = float(np.quantile(y,0.1))
+    for f in (lambda *p: getattr(autolik.ll_censored,family)(y,status,*p),
+              lambda *p: getattr(autolik.ll_truncated,family)(y,lower,None,*p)):
+        L = autolik.compile(f,len(params))
+        value, grad = L.value_and_grad(*params)
+        assert value == pytest.approx(f(*params),rel=1e-12)
+        np.testing.assert_allclose(grad,autolik.grad(f)(list(params)),rtol=1e-9,atol=1e-9)
+
@@ -0,0 +1,31 @@
+import os
+import subprocess
+import sys
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _modules_after(code):
+    """Modules loaded by a fresh interpreter running code"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None,[_ROOT, os.environ.get('PYTHONPATH')])))
+    env.pop('AUTOLIK_PROFILE',None)
+    out = subprocess.run([sys.executable,'-c',code + '\nimport sys\nprint(" ".join(sys.modules))'],
+                         cwd=_ROOT,env=env,capture_output=True,text=True,check=True).stdout
+    return set(out.split())
+
+
+def test_import_is_lazy():
+    modules = _modules_after('import autolik')
+    assert 'scipy' not in modules
+    assert not any(m.startswith('autolik.likelihood') for m in modules)
+
+
+def test_differentiation_does_not_load_the_likelihoods():
+    modules = _modules_after('import autolik\nautolik.grad(lambda x,y: x*autolik.exp(y))([1.,2.])')
+    assert 'scipy' not in modules
+    assert not any(m.startswith('autolik.likelihood') for m in modules)
+
+
+def test_attributes_load_on_first_use():
+    modules = _modules_after('import autolik\nautolik.ll.normal([0.,1.],0.,1.)')
+    assert 'autolik.likelihood.loglik' in modules
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+import autolik
+from autolik._lazy import scipy
+from autolik.Dual.incomplete import log_gammainc, log_gammaincc, log_betainc, log_betaincc
+
+
+def _richardson(f,x):
+    """Central difference with one Richardson step, a relative step"""
+    d = lambda h: (f(x + h) - f(x - h)) / (2*h)
+    h = 1e-3 * abs(x)
+    return (4*d(h/2) - d(h)) / 3
+
+
+@pytest.mark.parametrize('a',[5e-6,2e-5,1e-3,0.7,3.,40.])
+@pytest.mark.parametrize('x',[0.05,1.,20.])
+def test_gamma_values_and_shape_derivatives(a,x):
+    sp = scipy.special
+    assert log_gammainc(a,x) == pytest.approx(np.log(sp.gammainc(a,x)),rel=1e-10)
+    assert log_gammaincc(a,x) == pytest.approx(np.log(sp.gammaincc(a,x)),rel=1e-10)
+    for fn, ref in ((log_gammainc,sp.gammainc),(log_gammaincc,sp.gammaincc)):
+        da, dx = autolik.grad(fn)([a,x])
+        assert np.isfinite(da) and np.isfinite(dx)
+        assert da == pytest.approx(_richardson(lambda t: np.log(ref(t,x)),a),rel=1e-5,abs=1e-8)
+        assert dx == pytest.approx(_richardson(lambda t: np.log(ref(a,t)),x),rel=1e-6,abs=1e-10)
+
+
+@pytest.mark.parametrize('a',[5e-6,1e-3,2.])
+@pytest.mark.parametrize('x',[0.01,0.3,0.95])
+def test_beta_values_and_shape_derivatives(a,x):
+    sp = scipy.special
+    b = 2.5
+    assert log_betainc(a,b,x) == pytest.approx(np.log(sp.betainc(a,b,x)),rel=1e-10)
+    assert log_betaincc(a,b,x) == pytest.approx(np.log(sp.betaincc(a,b,x)),rel=1e-10,abs=1e-14)
+    da, db, dx = autolik.grad(log_betainc)([a,b,x])
+    assert da == pytest.approx(_richardson(lambda t: np.log(sp.betainc(t,b,x)),a),rel=1e-5,abs=1e-8)
+    assert db == pytest.approx(_richardson(lambda t: np.log(sp.betainc(a,t,x)),b),rel=1e-5,abs=1e-8)
+    assert dx == pytest.approx(_richardson(lambda t: np.log(sp.betainc(a,b,t)),x),rel=1e-6)
+
+
+def test_far_tails_stay_finite():
+    assert np.isfinite(log_gammaincc(2.,2000.)) and np.isfinite(log_gammainc(3.,1e-200))
+    assert np.isfinite(log_betainc(2.,3.,1e-200))
+
+
+@pytest.mark.parametrize('a',[1e-5,0.5,4.])
+def test_hessian_matches_differences(a):
+    x = 1.5
+    sp = scipy.special
+    H = autolik.hessian(log_gammaincc)([a,x])
+    dx = lambda a,x: autolik.grad(log_gammaincc)([a,x])[1] # closed form in the bound
+    da = lambda t: _richardson(lambda s: np.log(sp.gammaincc(s,x)),t)
+    assert H[1][1] == pytest.approx(_richardson(lambda t: dx(a,t),x),rel=1e-6)
+    assert H[0][1] == pytest.approx(_richardson(lambda t: dx(t,x),a),rel=1e-4)
+    assert H[1][0] == H[0][1]
+    assert H[0][0] == pytest.approx(_richardson(da,a),rel=1e-3)
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+import autolik
+from autolik.distributions.univariate import logpdf
+
+_y = np.random.default_rng(7).standard_t(5,3000)
+_at = [0.1,1.2]
+
+
+def test_scores_sum_to_the_log_likelihood_gradient():
+    values, S = autolik.scores('normal',_y,_at)
+    np.testing.assert_allclose(values,logpdf.normal(_y,*_at),rtol=1e-13)
+    assert S.shape == (len(_y),2)
+    np.testing.assert_allclose(S.sum(axis=0),autolik.grad(lambda mu,sigma: autolik.ll.normal(_y,mu,sigma))(_at),rtol=1e-10)
+
+
+def test_family_name_ll_function_and_user_function_agree():
+    by_name = autolik.scores('normal',_y,_at)[1]
+    np.testing.assert_allclose(autolik.scores(autolik.ll.normal,_y,_at)[1],by_name,rtol=1e-14)
+    np.testing.assert_allclose(autolik.scores(logpdf.normal,_y,_at)[1],by_name,rtol=1e-14)
+    user = lambda y,mu,sigma: -0.5*((y - mu)/sigma)**2 - sigma.log() - 0.5*np.log(2*np.pi)
+    np.testing.assert_allclose(autolik.scores(user,_y,_at)[1],by_name,rtol=1e-10,atol=1e-12)
+
+
+def test_opg_is_the_outer_product_of_the_scores():
+    S = autolik.scores('normal',_y,_at)[1]
+    np.testing.assert_allclose(autolik.opg('normal',_y,_at),S.T @ S,rtol=1e-14)
+
+
+def test_sandwich_from_observed_and_opg_information():
+    fit = autolik.mle('normal',_y,start=[0.,1.])
+    V = autolik.sandwich('normal',_y,fit.x)
+    A = -np.asarray(autolik.hessian(lambda mu,sigma: autolik.ll.normal(_y,mu,sigma))(fit.x))
+    A_inv = np.linalg.inv(A)
+    np.testing.assert_allclose(V,A_inv @ autolik.opg('normal',_y,fit.x) @ A_inv,rtol=1e-8)
+    np.testing.assert_allclose(V,V.T,rtol=1e-12)
+    assert np.all(np.linalg.eigvalsh(V) > 0)
+
+
+def test_user_function_named_like_a_family_is_not_replaced():
+    def normal(y,mu,sigma): # a normal parameterized by its variance
+        return -0.5*(y - mu)**2/sigma - 0.5*sigma.log() - 0.5*np.log(2*np.pi)
+    values, S = autolik.scores(normal,_y,_at)
+    np.testing.assert_allclose(values,logpdf.normal(_y,_at[0],np.sqrt(_at[1])),rtol=1e-12)
+    np.testing.assert_allclose(S.sum(axis=0),autolik.grad(lambda mu,v: autolik.ll.normal(_y,mu,v.sqrt()))(_at),rtol=1e-10)
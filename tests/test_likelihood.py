@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+import autolik
+from autolik.likelihood.loglik import ll
+from autolik.likelihood.score import ll_score, ll_value
+from families import FAMILIES, INVALID
+
+
+@pytest.mark.parametrize('family',FAMILIES)
+def test_closed_form_matches_ll(family):
+    params, y = FAMILIES[family]
+    L = autolik.Likelihood(family,y)
+    value, grad = L.value_and_grad(*params)
+    assert value == pytest.approx(getattr(ll,family)(y,*params),rel=1e-10)
+    expected = autolik.grad(lambda *p: getattr(ll,family)(y,*p))(list(params))
+    np.testing.assert_allclose(grad,expected,rtol=1e-8,atol=1e-8)
+
+
+@pytest.mark.parametrize('family',INVALID)
+def test_closed_form_checks_parameters(family):
+    y = FAMILIES[family][1]
+    params = INVALID[family]
+    with pytest.raises(AssertionError,match="Wrong paramterization"):
+        getattr(ll,family)(y,*params)
+    L = autolik.Likelihood(family,y)
+    for fn in (L, L.value, L.grad, L.value_and_grad):
+        with pytest.raises(AssertionError,match="Wrong paramterization"):
+            fn(*params)
+
+
+def test_closed_form_checks_data():
+    with pytest.raises(AssertionError,match="out of range"):
+        ll_value.gamma([1.,-2.],1.,1.)
+    with pytest.raises(AssertionError,match="out of range"):
+        ll_score.power([1.,2.],1.5,1.)
+
+
+@pytest.mark.parametrize('family, y, params',[
+    ('normal', 1e8 + np.random.default_rng(1).normal(0,1e-3,1000), (1e8,1e-3)),
+    ('lognormal', np.exp(30 + np.random.default_rng(2).normal(0,1e-4,1000)), (np.exp(30),1e-4)),
+    ('invgaussian', 1e6 + np.random.default_rng(3).normal(0,1e-2,1000), (1e20,1e6)),
+    ('std_wald', 1 + np.random.default_rng(4).normal(0,1e-5,1000), (1e9,)),
+])
+def test_sufficient_statistics_keep_precision(family, y, params):
+    L = autolik.Likelihood(family,y)
+    assert L(*params) == pytest.approx(getattr(ll,family)(y,*params),rel=1e-12)
+    expected = autolik.grad(lambda *p: getattr(ll,family)(y,*p))(list(params))
+    np.testing.assert_allclose(L.grad(*params),expected,rtol=1e-8)
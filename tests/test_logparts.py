@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+from autolik.distributions.univariate import logpdf, _logparts
+from autolik.likelihood.loglik import ll
+from families import FAMILIES, REFERENCED, reference
+
+
+@pytest.mark.parametrize('family',FAMILIES)
+def test_split_adds_up_to_logpdf(family):
+    params, y = FAMILIES[family]
+    const, kernel = getattr(_logparts,family)(y,*params)
+    total = len(y)*const + (0. if kernel is None else np.sum(kernel))
+    assert np.isfinite(total)
+    assert total == pytest.approx(np.sum(getattr(logpdf,family)(y,*params)),rel=1e-12)
+    assert getattr(ll,family)(y,*params) == pytest.approx(total,rel=1e-12)
+
+
+@pytest.mark.parametrize('family',REFERENCED)
+def test_logpdf_matches_scipy(family):
+    params, y = FAMILIES[family]
+    np.testing.assert_allclose(getattr(logpdf,family)(y,*params),reference(family,*params).logpdf(y),rtol=1e-10)
+
+
+def test_memmap_walks_chunks(tmp_path):
+    params, y = FAMILIES['gamma']
+    path = tmp_path / 'y.bin'
+    np.tile(y,200).tofile(path) # several chunks
+    assert ll.gamma(str(path),*params) == pytest.approx(200*ll.gamma(y,*params),rel=1e-10)
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+import autolik
+from autolik.distributions.univariate import logpdf
+
+_rng = np.random.default_rng(7)
+_y = np.concatenate([_rng.weibull(1.2,600),3*_rng.weibull(4.,400)])
+
+
+def test_value_is_the_log_of_the_weighted_densities():
+    M = autolik.Mixture(['weibull','gamma'],_y)
+    x = M.pack([0.3,0.7],(1.,1.2),(1.5,2.))
+    density = 0.3*np.exp(logpdf.weibull(_y,1.,1.2)) + 0.7*np.exp(logpdf.gamma(_y,1.5,2.))
+    assert M(*x) == pytest.approx(np.log(density).sum(),rel=1e-12)
+    weights, thetas = M.unpack(x)
+    np.testing.assert_allclose(weights,[0.3,0.7])
+    assert thetas == [(1.,1.2),(1.5,2.)]
+    np.testing.assert_allclose(M.responsibilities(*x).sum(axis=1),1.)
+
+
+def test_gradient_and_hessian_match_finite_differences():
+    M = autolik.Mixture(['weibull','weibull'],_y)
+    x = np.array(M.pack([0.5,0.5],(1.,1.),(10.,2.)))
+    value, g = M.value_and_grad(*x)
+    H = np.array(M.hessian(*x))
+    for i in range(len(x)):
+        h = 1e-6 * max(1.,abs(x[i]))
+        step = np.eye(len(x))[i] * h
+        assert g[i] == pytest.approx((M(*(x + step)) - M(*(x - step)))/(2*h),rel=1e-5,abs=1e-5)
+        column = (np.array(M.grad(*(x + step))) - np.array(M.grad(*(x - step))))/(2*h)
+        np.testing.assert_allclose(H[:,i],column,rtol=1e-4,atol=1e-3)
+
+
+def test_em_increases_the_log_likelihood_to_the_gradient_optimum():
+    M = autolik.Mixture(['weibull','weibull'],_y)
+    start = M.pack([0.5,0.5],(1.,1.),(10.,2.))
+    em = M.fit(start)
+    bfgs = M.fit(start,method='bfgs')
+    assert em.success and em.loglik > M(*start)
+    assert em.loglik == pytest.approx(bfgs.loglik,abs=0.5)
+
+
+def test_em_without_iterations_returns_the_start():
+    M = autolik.Mixture(['weibull','weibull'],_y)
+    start = M.pack([0.5,0.5],(1.,1.),(10.,2.))
+    fit = M.fit(start,maxiter=0)
+    assert fit.nit == 0 and not fit.success
+    np.testing.assert_allclose(fit.x,start)
+    assert fit.loglik == pytest.approx(M(*start))
@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+import autolik
+from autolik.optim.multistart import MultiStartResult
+from autolik.optim.optimize import MLEResult
+
+
+def test_finds_the_maximum_likelihood_estimates():
+    y = np.random.default_rng(3).gamma(2.,1.5,2000)
+    starts = [[0.5,0.5],[3.,4.],[1.,1.],[2.,1.]]
+    fit = autolik.multistart('gamma',y,starts,workers=2)
+    single = autolik.optim.mle('gamma',y,start=[1.,1.])
+    assert len(fit.runs) == 4 and fit.optima
+    np.testing.assert_allclose(fit.best.x,single.x,rtol=1e-4)
+    assert fit.best.loglik == pytest.approx(single.loglik,rel=1e-10)
+    assert 'MultiStartResult' in repr(fit)
+
+
+def test_best_skips_runs_cancelled_before_any_point():
+    never = MLEResult(None, -np.inf, None, None, 12, 0, False, "cancelled, dominated by another start", 'bfgs')
+    stalled = MLEResult(np.array([1.,2.]), -10., None, 200, 250, 0, False, "maximum number of iterations reached", 'bfgs')
+    result = MultiStartResult([never,stalled],[])
+    assert result.best is stalled and result.cancelled == 1
+    assert 'x=[1.0, 2.0]' in repr(result) and 'x=None' in repr(never)
+    empty = MultiStartResult([never],[])
+    assert empty.best is None and 'x=None' in repr(empty)
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+import autolik
+from autolik.likelihood.loglik import ll
+from autolik.optim.optimize import _objective
+
+_y = np.random.default_rng(11).gamma(2.,1.5,3000)
+
+
+@pytest.mark.parametrize('method',['bfgs','l-bfgs','newton'])
+def test_methods_agree_on_every_kind_of_objective(method):
+    reference = autolik.optim.mle('gamma',_y,start=[1.,1.],method='newton')
+    assert reference.success
+    for family_or_fn, y in (('gamma',_y), (ll.gamma,_y), (autolik.Likelihood('gamma',_y),None),
+                            (lambda y,a,b: ll.gamma(y,a,b),_y)):
+        fit = autolik.optim.mle(family_or_fn,y,start=[1.,1.],method=method)
+        assert fit.success
+        np.testing.assert_allclose(fit.x,reference.x,rtol=1e-5)
+
+
+class _Counting:
+    """Likelihood recording which of its derivative methods the optimizer calls"""
+    def __init__(self, L) -> None:
+        self.L, self.calls = L, []
+
+    def value_and_grad(self,*params):
+        self.calls.append('value_and_grad')
+        return self.L.value_and_grad(*params)
+
+    def value_grad_hessian(self,*params):
+        self.calls.append('value_grad_hessian')
+        return self.L.value_grad_hessian(*params)
+
+
+def test_newton_takes_one_combined_pass_per_hessian():
+    counted = _Counting(autolik.Likelihood('gamma',_y))
+    fit = autolik.optim.mle(counted,start=[1.,1.],method='newton')
+    assert fit.success and fit.nhev == counted.calls.count('value_grad_hessian') > 0
+    obj = _objective(counted,None)
+    f, g, h = obj.fgh(np.array([1.5,2.]))
+    value, grad, hess = autolik.Likelihood('gamma',_y).value_grad_hessian(1.5,2.)
+    assert f == -value
+    np.testing.assert_allclose(h,-np.array(hess))
+
+
+@pytest.mark.parametrize('start',[[1.,1.],[0.3,5.]])
+def test_newton_evaluates_the_data_once_per_step(start):
+    with autolik.profile() as prof:
+        fit = autolik.optim.mle(lambda y,alpha,beta: autolik.ll.gamma(y,alpha,beta),_y,start=start,method='newton')
+    assert fit.success
+    passes = prof.report['timings']['ll.gamma']['calls']
+    assert passes == prof.report['evaluations']['_value_gradient_hessian']['f_evals'] == fit.nfev == fit.nhev
+    assert passes == fit.nit + 1 # the starting point, then one combined pass per accepted unit step
+
+
+def test_value_grad_hessian_is_consistent():
+    L = autolik.Likelihood('gamma',_y)
+    value, grad, hess = L.value_grad_hessian(1.5,2.)
+    assert value == pytest.approx(L(1.5,2.),rel=1e-12)
+    np.testing.assert_allclose(grad,L.grad(1.5,2.),rtol=1e-10)
+    np.testing.assert_allclose(hess,L.hessian(1.5,2.),rtol=1e-12)
+
+
+def test_invalid_points_are_rejected_by_the_line_search():
+    obj = _objective('laplace',np.random.default_rng(2).laplace(size=100))
+    f, g = obj.fg(np.array([-0.5,1.]))
+    assert f == np.inf and g is None
@@ -0,0 +1,14 @@
+import numpy as np
+import pytest
+import autolik
+
+_y = np.random.default_rng(2).gamma(2.,1.5,10**4)
+
+
+def test_parallel_matches_the_whole_sample():
+    with autolik.ParallelLikelihood('gamma',_y,workers=2,shards=5) as L:
+        assert L.value(2.,1.5) == pytest.approx(autolik.ll.gamma(_y,2.,1.5),rel=1e-12)
+        value, grad = L.value_and_grad(2.,1.5)
+        assert value == pytest.approx(L.value(2.,1.5),rel=1e-14)
+        np.testing.assert_allclose(grad,autolik.grad(lambda a,b: autolik.ll.gamma(_y,a,b))([2.,1.5]),rtol=1e-11)
+        np.testing.assert_allclose(L.grad(2.,1.5),grad,rtol=1e-14)
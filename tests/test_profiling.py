@@ -0,0 +1,25 @@
+import numpy as np
+import autolik
+from autolik import profiling
+from autolik.likelihood.loglik import ll
+
+_y = np.random.default_rng(4).gamma(2.,1.5,1000)
+
+
+def test_profile_counts_its_block_and_restores_the_functions():
+    original = ll.gamma
+    with autolik.profile() as prof:
+        assert ll.gamma is not original
+        autolik.grad(lambda a,b: autolik.ll.gamma(_y,a,b))([2.,1.5])
+    assert ll.gamma is original and profiling._depth == 0
+    report = prof.report
+    assert report['evaluations']['_value_and_gradient'] == {'calls': 1, 'f_evals': 1}
+    assert report['timings']['ll.gamma']['calls'] == 1
+    assert report['special']['math.lgamma'] == 1 and report['special']['scipy.special.digamma'] == 1
+    assert report['constructions']['Dual'] > 0
+
+
+def test_values_are_unchanged_under_profiling():
+    expected = autolik.ll.gamma(_y,2.,1.5), autolik.grad(lambda a,b: autolik.ll.gamma(_y,a,b))([2.,1.5])
+    with autolik.profile():
+        assert (autolik.ll.gamma(_y,2.,1.5), autolik.grad(lambda a,b: autolik.ll.gamma(_y,a,b))([2.,1.5])) == expected
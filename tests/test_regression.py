@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+import autolik
+from autolik.distributions.univariate import logpdf
+
+_rng = np.random.default_rng(5)
+_X = np.column_stack([np.ones(2000),_rng.normal(size=(2000,2))])
+_y = _rng.gamma(2.,np.exp(_X @ [0.5,0.2,-0.1]))
+
+
+def _model():
+    return autolik.Regression('gamma',_y,alpha=(_X,'log'))
+
+
+def test_value_is_the_sum_of_the_linked_log_densities():
+    R = _model()
+    b = [0.4,0.1,0.,1.5]
+    assert R(*b) == pytest.approx(np.sum(logpdf.gamma(_y,np.exp(_X @ b[:3]),b[3])),rel=1e-12)
+
+
+def test_gradient_and_hessian_match_a_dual_pass_on_every_coefficient():
+    R = _model()
+    b = [0.4,0.1,0.,1.5]
+    value, grad, hess = R.value_grad_hessian(*b)
+    assert value == pytest.approx(R(*b),rel=1e-12)
+    np.testing.assert_allclose(grad,autolik.grad(R)(b),rtol=1e-9,atol=1e-9)
+    np.testing.assert_allclose(R.grad(*b),grad,rtol=1e-12)
+    np.testing.assert_allclose(hess,autolik.hessian(R)(b),rtol=1e-9,atol=1e-9)
+    np.testing.assert_allclose(R.hessian(*b),hess,rtol=1e-12)
+
+
+def test_newton_recovers_the_coefficients():
+    fit = autolik.optim.mle(_model(),start=[0.,0.,0.,1.],method='newton')
+    assert fit.success
+    np.testing.assert_allclose(fit.x,[0.5,0.2,-0.1,2.],atol=0.15)
+
+
+def test_unknown_parameter_is_rejected():
+    with pytest.raises(ValueError):
+        autolik.Regression('gamma',_y,scale=_X)
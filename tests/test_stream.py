@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+import autolik
+from autolik.likelihood.stream import ll_stream, chunked
+from families import FAMILIES
+
+
+def _blocks(y,size=97):
+    return [y[i:i+size] for i in range(0,len(y),size)]
+
+
+@pytest.mark.parametrize('family',sorted(FAMILIES))
+def test_stream_matches_the_whole_sample(family):
+    params, y = FAMILIES[family]
+    y = np.asarray(y,dtype=float)
+    expected = getattr(autolik.ll,family)(y,*params)
+    assert getattr(ll_stream,family)(_blocks(y),*params) == pytest.approx(expected,rel=1e-12)
+    assert getattr(ll_stream,family)(lambda: iter(_blocks(y,13)),*params) == pytest.approx(expected,rel=1e-12)
+
+
+def test_stream_gradient_in_one_pass():
+    params, y = FAMILIES['gamma']
+    blocks = _blocks(np.asarray(y,dtype=float))
+    g = autolik.grad(lambda alpha,beta: ll_stream.gamma(blocks,alpha,beta))(params)
+    np.testing.assert_allclose(g,autolik.grad(lambda alpha,beta: autolik.ll.gamma(y,alpha,beta))(params),rtol=1e-11)
+
+
+def test_chunked_groups_records():
+    rows = [(str(v),'x') for v in range(10)]
+    blocks = list(chunked(rows,size=4,column=0))
+    assert [len(b) for b in blocks] == [4,4,2]
+    np.testing.assert_array_equal(np.concatenate(blocks),np.arange(10.))
+